@@ -1,7 +1,13 @@
+import heapq
 import random
 
 import pygame
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from ..pathfinders.nav_node import NavNode
 
 
@@ -37,7 +43,9 @@ class MazeWall:
             third_id = end_index[1]
             fourth_id = start_index[1]
 
-        self.id = str(first_id) + str(second_id) + str(third_id) + str(fourth_id)
+        # walls are axis aligned, so the ordered end indices on each axis identify a segment whichever way round
+        # it was created
+        self.id = (first_id, second_id, third_id, fourth_id)
         self.start_index = start_index
         self.end_index = end_index
 
@@ -67,23 +75,64 @@ class MazeWall:
         self.rect = pygame.Rect((left, top), (width, height))
 
 
-def add_new_wall_if_unique(possible_new_wall, maze_walls):
-    wall_already_exists = False
-    for wall in maze_walls:
-        if wall.id == possible_new_wall.id:
-            wall_already_exists = True
-    if not wall_already_exists:
+class MazeGrid:
+    """
+    The squares of a maze, indexed [x][y] with 0 for an open square and 1 for a wall, along with what is needed
+    to go between grid squares and the screen positions the nav nodes use. For the finders that search the
+    grid itself rather than the junction graph.
+    """
+    def __init__(self, maze_shape, top_left, square_size):
+        self.maze_shape = maze_shape
+        self.width = len(maze_shape)
+        self.height = len(maze_shape[0])
+        self.top_left = top_left
+        self.square_size = square_size
+
+    def is_open(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height and self.maze_shape[x][y] == 0
+
+    def get_grid_position(self, position):
+        return (int(round((position[0] - self.top_left[0]) / self.square_size)),
+                int(round((position[1] - self.top_left[1]) / self.square_size)))
+
+    def get_screen_position(self, x, y):
+        return (self.top_left[0] + (x * self.square_size),
+                self.top_left[1] + (y * self.square_size))
+
+
+def add_new_wall_if_unique(possible_new_wall, maze_walls, maze_wall_ids):
+    if possible_new_wall.id not in maze_wall_ids:
+        maze_wall_ids.add(possible_new_wall.id)
         maze_walls.append(possible_new_wall)
 
     return maze_walls
 
 
-def create_maze(top_left, square_size, width=11, height=16, complexity=.75, density=.75):
-    # Only odd shapes
-    shape = ((width // 2) * 2 + 1, (height // 2) * 2 + 1)
-    # Adjust complexity and density relative to maze size
-    complexity = int(complexity * (5 * (shape[0] + shape[1])))
-    density = int(density * ((shape[0] // 2) * (shape[1] // 2)))
+def link_junction_neighbours(junction_points, maze_shape, shape):
+    # look up junctions by grid position rather than searching the whole list for each open square we pass.
+    # If two junctions share a square the first one in the list is the one that gets linked to.
+    junction_grid = {}
+    for point in junction_points:
+        junction_grid.setdefault((point.grid_x_pos, point.grid_y_pos), point)
+
+    for point in junction_points:
+        # locate neighbours in the four possible directions if they exist, walking along the corridor until
+        # we find a junction or hit a wall
+        for x_step, y_step in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            x_explore = point.grid_x_pos + x_step
+            y_explore = point.grid_y_pos + y_step
+            while 0 <= x_explore < shape[1] and 0 <= y_explore < shape[0]:
+                if maze_shape[x_explore][y_explore] == 1:
+                    break
+                neighbour_point = junction_grid.get((x_explore, y_explore))
+                if neighbour_point is not None:
+                    point.nav_node.add_neighbour(neighbour_point.nav_node)
+                    break
+                x_explore += x_step
+                y_explore += y_step
+
+
+def carve_maze_aisles(shape, complexity, density):
     # Build actual maze
     maze_shape = []
     for x in range(0, shape[0]):
@@ -120,47 +169,140 @@ def create_maze(top_left, square_size, width=11, height=16, complexity=.75, dens
                     maze_shape[x_ + (x - x_) // 2][y_ + (y - y_) // 2] = 1
                     x, y = x_, y_
 
-    # clears dead ends
+    return maze_shape
+
+
+def carve_maze_aisles_numpy(shape, complexity, density, waves=128):
+    # the same random walks as carve_maze_aisles, but all the walkers in a wave take their steps at once. Walls
+    # only ever grow from a wall into an open square, so like the one at a time version they never close off
+    # part of the maze. Walkers are let go in waves rather than all at the start so that later ones can fill in
+    # the gaps the earlier ones left, as they do one at a time. The mazes look the same but aren't the ones the
+    # pure python version makes for the same seed.
+    walker_steps = numpy.array([(-2, 0), (2, 0), (0, -2), (0, 2)])
+    maze_grid = numpy.zeros(shape, dtype=numpy.uint8)
+    maze_grid[:, 0] = 1
+    maze_grid[:, -1] = 1
+    maze_grid[0, :] = 1
+    maze_grid[-1, :] = 1
+
+    # seeded from random, so that random.seed() still picks the maze
+    generator = numpy.random.default_rng(random.getrandbits(64))
+    start_xs = generator.integers(0, shape[0] // 2, size=density, endpoint=True) * 2
+    start_ys = generator.integers(0, shape[1] // 2, size=density, endpoint=True) * 2
+    walkers_per_wave = max(1, -(-density // waves))
+    released_count = 0
+
+    xs = numpy.zeros(0, dtype=numpy.int64)
+    ys = numpy.zeros(0, dtype=numpy.int64)
+    step_count = 0
+    while released_count < density or (step_count < complexity and len(xs)):
+        if released_count < density:
+            wave_xs = start_xs[released_count:released_count + walkers_per_wave]
+            wave_ys = start_ys[released_count:released_count + walkers_per_wave]
+            released_count += walkers_per_wave
+            maze_grid[wave_xs, wave_ys] = 1
+            xs = numpy.concatenate((xs, wave_xs))
+            ys = numpy.concatenate((ys, wave_ys))
+        step_count += 1
+
+        # the four squares two away from each walker, and which of them are still open
+        target_xs = xs[:, None] + walker_steps[:, 0]
+        target_ys = ys[:, None] + walker_steps[:, 1]
+        in_bounds = (target_xs >= 0) & (target_xs < shape[0]) & (target_ys >= 0) & (target_ys < shape[1])
+        numpy.clip(target_xs, 0, shape[0] - 1, out=target_xs)
+        numpy.clip(target_ys, 0, shape[1] - 1, out=target_ys)
+        open_targets = in_bounds & (maze_grid[target_xs, target_ys] == 0)
+
+        # squares only ever turn into walls here, so a walker with no open square around it is done for good
+        walking = open_targets.any(axis=1)
+        if not walking.all():
+            xs, ys = xs[walking], ys[walking]
+            target_xs, target_ys = target_xs[walking], target_ys[walking]
+            in_bounds, open_targets = in_bounds[walking], open_targets[walking]
+
+        # each walker picks any square in bounds like the one at a time version does, and only moves if it is
+        # open. When two pick the same square the first one gets it.
+        choices = numpy.floor(generator.random(len(xs)) * in_bounds.sum(axis=1)).astype(numpy.int64)
+        choices = (numpy.cumsum(in_bounds, axis=1) > choices[:, None]).argmax(axis=1)
+        movers = numpy.flatnonzero(open_targets[numpy.arange(len(xs)), choices])
+        move_xs = target_xs[movers, choices[movers]]
+        move_ys = target_ys[movers, choices[movers]]
+        _, first_movers = numpy.unique(move_xs * shape[1] + move_ys, return_index=True)
+        movers, move_xs, move_ys = movers[first_movers], move_xs[first_movers], move_ys[first_movers]
+
+        maze_grid[move_xs, move_ys] = 1
+        maze_grid[(xs[movers] + move_xs) // 2, (ys[movers] + move_ys) // 2] = 1
+        xs[movers] = move_xs
+        ys[movers] = move_ys
+
+    return maze_grid
+
+
+def clear_dead_end(maze_shape, shape, x, y):
+    # if the open square at x, y has one exit or fewer, knock down one of its walls at random and return the
+    # square we opened up
+    if maze_shape[x][y] == 0:
+        wall_neighbours = []
+        exits = 0
+        if maze_shape[x][y + 1] == 0:
+            exits += 1
+        elif (y + 1) != shape[0] - 1:
+            wall_neighbours.append((y + 1, x))
+        if maze_shape[x + 1][y] == 0:
+            exits += 1
+        elif (x + 1) != shape[1] - 1:
+            wall_neighbours.append((y, x + 1))
+        if maze_shape[x - 1][y] == 0:
+            exits += 1
+        elif (x - 1) != 0:
+            wall_neighbours.append((y, x - 1))
+        if maze_shape[x][y - 1] == 0:
+            exits += 1
+        elif (y - 1) != 0:
+            wall_neighbours.append((y - 1, x))
+
+        if exits <= 1:
+            y_, x_ = wall_neighbours[int(random.randint(0, len(wall_neighbours) - 1))]
+            maze_shape[x_][y_] = 0
+            return x_, y_
+    return None
+
+
+def clear_dead_ends(maze_shape, shape):
     for x in range(1, shape[0] - 1):
         for y in range(1, shape[1] - 1):
-            if maze_shape[x][y] == 0:
-                wall_neighbours = []
-                exits = 0
-                if maze_shape[x][y + 1] == 0:
-                    exits += 1
-                elif (y + 1) != shape[0] - 1:
-                    wall_neighbours.append((y + 1, x))
-                if maze_shape[x + 1][y] == 0:
-                    exits += 1
-                elif (x + 1) != shape[1] - 1:
-                    wall_neighbours.append((y, x + 1))
-                if maze_shape[x - 1][y] == 0:
-                    exits += 1
-                elif (x - 1) != 0:
-                    wall_neighbours.append((y, x - 1))
-                if maze_shape[x][y - 1] == 0:
-                    exits += 1
-                elif (y - 1) != 0:
-                    wall_neighbours.append((y - 1, x))
-
-                if exits <= 1:
-                    y_, x_ = wall_neighbours[int(random.randint(0, len(wall_neighbours) - 1))]
-                    maze_shape[x_][y_] = 0
-
-    entry_x = 1
-    entry_y = shape[1]-1
-    exit_x = shape[0] - 2
-    exit_y = 0
-    maze_shape[1][shape[1]-1] = 0  # entry doorway
-    maze_shape[shape[0] - 2][0] = 0  # exit doorway
-
+            clear_dead_end(maze_shape, shape, x, y)
+
+
+def clear_dead_ends_numpy(maze_grid, shape):
+    # find every dead end at once by counting open neighbours across the whole grid, then only visit those
+    # squares, in the same order as the full scan so that we make the same random choices. Opening a wall
+    # can only add exits, so the one new dead end we can make is the square we just opened - if the scan
+    # hasn't reached it yet it gets queued too.
+    open_squares = (maze_grid == 0).astype(numpy.uint8)
+    exit_counts = (open_squares[1:-1, 2:] + open_squares[2:, 1:-1] +
+                   open_squares[:-2, 1:-1] + open_squares[1:-1, :-2])
+    dead_ends = numpy.zeros(shape, dtype=bool)
+    dead_ends[1:-1, 1:-1] = (open_squares[1:-1, 1:-1] == 1) & (exit_counts <= 1)
+
+    square_keys = numpy.flatnonzero(dead_ends).tolist()
+    while square_keys:
+        square_key = heapq.heappop(square_keys)
+        x, y = divmod(square_key, shape[1])
+        opened_square = clear_dead_end(maze_grid, shape, x, y)
+        if opened_square is not None:
+            opened_square_key = opened_square[0] * shape[1] + opened_square[1]
+            if opened_square_key > square_key:
+                heapq.heappush(square_keys, opened_square_key)
+
+
+def find_walls_and_junctions(maze_shape, shape, top_left, square_size, entry_x, entry_y, exit_x, exit_y):
     maze_walls = []
+    maze_wall_ids = set()
     junction_points = []
     maze_entrance = None
     maze_exit = None
 
-    maze_exit_junction = None
-
     for x in range(0, shape[0]):
         for y in range(0, shape[1]):
             if maze_shape[x][y] == 1:
@@ -168,19 +310,23 @@ def create_maze(top_left, square_size, width=11, height=16, complexity=.75, dens
                 if y + 1 < shape[0]:
                     if maze_shape[x][y + 1] == 1:
                         maze_walls = add_new_wall_if_unique(MazeWall(top_left, square_size,
-                                                                     (y, x), (y + 1, x)), maze_walls)
+                                                                     (y, x), (y + 1, x)),
+                                                            maze_walls, maze_wall_ids)
                 if y - 1 > 0:
                     if maze_shape[x][y - 1] == 1:
                         maze_walls = add_new_wall_if_unique(MazeWall(top_left, square_size,
-                                                                     (y, x), (y - 1, x)), maze_walls)
+                                                                     (y, x), (y - 1, x)),
+                                                            maze_walls, maze_wall_ids)
                 if x + 1 < shape[1]:
                     if maze_shape[x + 1][y] == 1:
                         maze_walls = add_new_wall_if_unique(MazeWall(top_left, square_size,
-                                                                     (y, x), (y, x + 1)), maze_walls)
+                                                                     (y, x), (y, x + 1)),
+                                                            maze_walls, maze_wall_ids)
                 if x - 1 > 0:
                     if maze_shape[x - 1][y] == 1:
                         maze_walls = add_new_wall_if_unique(MazeWall(top_left, square_size,
-                                                                     (y, x), (y, x - 1)), maze_walls)
+                                                                     (y, x), (y, x - 1)),
+                                                            maze_walls, maze_wall_ids)
             elif maze_shape[x][y] == 0:
                 if y < shape[1]-1:
                     below = maze_shape[x][y + 1]
@@ -217,84 +363,104 @@ def create_maze(top_left, square_size, width=11, height=16, complexity=.75, dens
                         maze_entrance_junction = JunctionPoint(top_left, square_size, x, y - 1)
                         junction_points.append(maze_entrance_junction)
 
-    for point in junction_points:
-        # locate neighbours in the four possible directions if they exist
-        x_explore = point.grid_x_pos + 1
-        found_wall_or_neighbour = False
-        while x_explore < shape[1] and not found_wall_or_neighbour:  # direction 1
-            if maze_shape[x_explore][point.grid_y_pos] == 0:
-                for neighbour_point in junction_points:
-                    if neighbour_point.grid_y_pos == point.grid_y_pos and neighbour_point.grid_x_pos == x_explore:
-                        point.nav_node.neighbours.append(neighbour_point.nav_node)
-                        found_wall_or_neighbour = True
-                        break
-                x_explore += 1
-            elif maze_shape[x_explore][point.grid_y_pos] == 1:
-                found_wall_or_neighbour = True
-                if x_explore - 1 != point.grid_x_pos:
-                    for neighbour_point in junction_points:
-                        if neighbour_point.grid_x_pos == x_explore - 1 and\
-                                neighbour_point.grid_y_pos == point.grid_y_pos:
-                            point.nav_node.neighbours.append(neighbour_point.nav_node)
-                            break
-
-        x_explore = point.grid_x_pos - 1
-        found_wall_or_neighbour = False
-        while x_explore >= 0 and not found_wall_or_neighbour:  # direction 2
-            if maze_shape[x_explore][point.grid_y_pos] == 0:
-                for neighbour_point in junction_points:
-                    if neighbour_point.grid_y_pos == point.grid_y_pos and neighbour_point.grid_x_pos == x_explore:
-                        point.nav_node.neighbours.append(neighbour_point.nav_node)
-                        found_wall_or_neighbour = True
-                        break
-                x_explore -= 1
-            elif maze_shape[x_explore][point.grid_y_pos] == 1:
-                found_wall_or_neighbour = True
-                if x_explore + 1 != point.grid_x_pos:
-                    for neighbour_point in junction_points:
-                        if neighbour_point.grid_x_pos == x_explore + 1 and\
-                                neighbour_point.grid_y_pos == point.grid_y_pos:
-                            point.nav_node.neighbours.append(neighbour_point.nav_node)
-                            break
-
-        y_explore = point.grid_y_pos + 1
-        found_wall_or_neighbour = False
-        while y_explore < shape[0] and not found_wall_or_neighbour:  # direction 3
-            if maze_shape[point.grid_x_pos][y_explore] == 0:
-                for neighbour_point in junction_points:
-                    if neighbour_point.grid_y_pos == y_explore and neighbour_point.grid_x_pos == point.grid_x_pos:
-                        point.nav_node.neighbours.append(neighbour_point.nav_node)
-                        found_wall_or_neighbour = True
-                        break
-                y_explore += 1
-            elif maze_shape[point.grid_x_pos][y_explore] == 1:
-                found_wall_or_neighbour = True
-                if y_explore - 1 != point.grid_y_pos:
-                    for neighbour_point in junction_points:
-                        if neighbour_point.grid_y_pos == y_explore - 1 and\
-                                neighbour_point.grid_x_pos == point.grid_x_pos:
-                            point.nav_node.neighbours.append(neighbour_point.nav_node)
-                            break
-
-        y_explore = point.grid_y_pos - 1
-        found_wall_or_neighbour = False
-        while y_explore >= 0 and not found_wall_or_neighbour:  # direction 4
-            if maze_shape[point.grid_x_pos][y_explore] == 0:
-                for neighbour_point in junction_points:
-                    if neighbour_point.grid_y_pos == y_explore and\
-                            neighbour_point.grid_x_pos == point.grid_x_pos:
-                        point.nav_node.neighbours.append(neighbour_point.nav_node)
-                        found_wall_or_neighbour = True
-                        break
-
-                y_explore -= 1
-            elif maze_shape[point.grid_x_pos][y_explore] == 1:
-                found_wall_or_neighbour = True
-                if y_explore + 1 != point.grid_y_pos:
-                    for neighbour_point in junction_points:
-                        if neighbour_point.grid_y_pos == y_explore + 1 and\
-                                neighbour_point.grid_x_pos == point.grid_x_pos:
-                            point.nav_node.neighbours.append(neighbour_point.nav_node)
-                            break
+    return maze_walls, junction_points, maze_entrance, maze_exit
+
+
+def find_walls_and_junctions_numpy(maze_grid, shape, top_left, square_size, entry_x, entry_y, exit_x, exit_y):
+    # a wall runs between every pair of wall squares that sit next to each other. We order them by the square
+    # with the lower index, then by direction, which is the order the square by square scan would find them.
+    wall_squares = maze_grid == 1
+    down_xs, down_ys = numpy.nonzero(wall_squares[:, :-1] & wall_squares[:, 1:])
+    right_xs, right_ys = numpy.nonzero(wall_squares[:-1, :] & wall_squares[1:, :])
+    wall_keys = numpy.concatenate(((down_xs * shape[1] + down_ys) * 2,
+                                   (right_xs * shape[1] + right_ys) * 2 + 1))
+    maze_walls = []
+    for wall_key in numpy.sort(wall_keys).tolist():
+        square_key, direction = divmod(wall_key, 2)
+        x, y = divmod(square_key, shape[1])
+        if direction == 0:
+            maze_walls.append(MazeWall(top_left, square_size, (y, x), (y + 1, x)))
+        else:
+            maze_walls.append(MazeWall(top_left, square_size, (y, x), (y, x + 1)))
+
+    # junctions are the open squares inside the border that aren't straight through a corridor
+    open_squares = maze_grid == 0
+    below = open_squares[1:-1, 2:]
+    above = open_squares[1:-1, :-2]
+    left = open_squares[:-2, 1:-1]
+    right = open_squares[2:, 1:-1]
+    horizontal_corridor = ~below & ~above & left & right
+    vertical_corridor = below & above & ~left & ~right
+    junction_xs, junction_ys = numpy.nonzero(open_squares[1:-1, 1:-1] & ~horizontal_corridor & ~vertical_corridor)
+
+    exit_key = exit_x * shape[1] + exit_y
+    entry_key = entry_x * shape[1] + entry_y
+    square_keys = ((junction_xs + 1) * shape[1] + (junction_ys + 1)).tolist()
+    square_keys.extend(key for key in (exit_key, entry_key) if open_squares.flat[key])
+    junction_points = []
+    maze_entrance = None
+    maze_exit = None
+    for square_key in sorted(square_keys):
+        x, y = divmod(square_key, shape[1])
+        if square_key == exit_key:
+            maze_exit = JunctionPoint(top_left, square_size, x, y)
+            junction_points.append(maze_exit)
+            junction_points.append(JunctionPoint(top_left, square_size, x, y + 1))
+        elif square_key == entry_key:
+            maze_entrance = JunctionPoint(top_left, square_size, x, y)
+            junction_points.append(maze_entrance)
+            junction_points.append(JunctionPoint(top_left, square_size, x, y - 1))
+        else:
+            junction_points.append(JunctionPoint(top_left, square_size, x, y))
 
     return maze_walls, junction_points, maze_entrance, maze_exit
+
+
+def create_maze(top_left, square_size, width=11, height=16, complexity=.75, density=.75, use_numpy=None,
+                vectorised_carving=False):
+    # with NumPy installed we find dead ends, walls and junctions with it, which gives the same maze as the pure
+    # python scans for the same random seed, just faster. By default we use it if it's installed.
+    # vectorised_carving also carves the aisles with NumPy, all the random walks at once. That takes
+    # milliseconds where the one walk at a time carving takes seconds on big mazes, but it makes a different
+    # maze for the same seed, so it is only used when asked for.
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    if vectorised_carving and not use_numpy:
+        raise ValueError("vectorised_carving needs NumPy")
+
+    # Only odd shapes
+    shape = ((width // 2) * 2 + 1, (height // 2) * 2 + 1)
+    # Adjust complexity and density relative to maze size
+    complexity = int(complexity * (5 * (shape[0] + shape[1])))
+    density = int(density * ((shape[0] // 2) * (shape[1] // 2)))
+
+    if vectorised_carving:
+        maze_shape = carve_maze_aisles_numpy(shape, complexity, density)
+    elif use_numpy:
+        maze_shape = numpy.array(carve_maze_aisles(shape, complexity, density), dtype=numpy.uint8)
+    else:
+        maze_shape = carve_maze_aisles(shape, complexity, density)
+
+    # clears dead ends
+    if use_numpy:
+        clear_dead_ends_numpy(maze_shape, shape)
+    else:
+        clear_dead_ends(maze_shape, shape)
+
+    entry_x = 1
+    entry_y = shape[1]-1
+    exit_x = shape[0] - 2
+    exit_y = 0
+    maze_shape[1][shape[1]-1] = 0  # entry doorway
+    maze_shape[shape[0] - 2][0] = 0  # exit doorway
+
+    if use_numpy:
+        maze_walls, junction_points, maze_entrance, maze_exit = find_walls_and_junctions_numpy(
+            maze_shape, shape, top_left, square_size, entry_x, entry_y, exit_x, exit_y)
+        maze_shape = maze_shape.tolist()
+    else:
+        maze_walls, junction_points, maze_entrance, maze_exit = find_walls_and_junctions(
+            maze_shape, shape, top_left, square_size, entry_x, entry_y, exit_x, exit_y)
+    link_junction_neighbours(junction_points, maze_shape, shape)
+
+    return maze_walls, junction_points, maze_entrance, maze_exit, MazeGrid(maze_shape, top_left, square_size)
@@ -0,0 +1,233 @@
+import pygame
+import pygame_gui
+
+from ..search.events import NODE_OPENED, NODE_CLOSED
+from .hover_index import NodeHoverIndex
+from .node_layer import SearchNodeLayer
+
+
+class BaseFinder:
+    """
+    Runs a search a slice of each frame, or a node at a time when stepping, and draws how it is getting on.
+
+    Drawing is split up so a finder only has to replace the bits that differ from the others: the colours and
+    hover index entries for open and closed nodes, the label texts, the tooltip text and what hovering shows.
+    """
+    # finders that show nothing on hover can skip indexing every node they draw
+    uses_hover_index = True
+
+    def __init__(self, search, incremental=False):
+        self.search = search
+        self.name = self.search.name
+
+        self.incremental = incremental
+        self.time_to_increment = False
+        self.max_seconds_per_update = 0.008
+
+        # drawing info
+        self.tool_tip = None
+        self.progress_label = None
+        self.progress_label_path_node = None
+        self.finished_path_info_label = None
+        self.path_colour = pygame.Color("#FFAA00")
+        self.path_colour_2 = pygame.Color("#882222AA")
+        self.path_colour_3 = pygame.Color("#22AA22AA")
+        self.path_colour_4 = pygame.Color("#444499AA")
+        self.path_colour_5 = pygame.Color("#449999AA")
+        self.node_layer = None
+        self.node_events = None  # what the search has changed since we last drew, once we are listening
+        self.hover_index = None
+        self.hovered_path_node = None
+        self.hover_path_rects = []
+        self.last_current_node_rect = None
+
+    def get_name(self):
+        return self.name
+
+    def shutdown(self):
+        if self.node_events is not None:
+            self.search.remove_event_listener(self.queue_node_event)
+            self.node_events = None
+        if self.tool_tip is not None:
+            self.tool_tip.kill()
+        if self.progress_label is not None:
+            self.progress_label.kill()
+        if self.finished_path_info_label is not None:
+            self.finished_path_info_label.kill()
+
+    def increment_algorithm(self):
+        self.time_to_increment = True
+
+    def update(self):
+        if not self.incremental:
+            # nobody is stepping through this search so spend a slice of the frame on it, not just one node
+            self.search.step(max_seconds=self.max_seconds_per_update)
+        elif self.search.is_search_complete() or self.time_to_increment:
+            self.search.update()
+            self.time_to_increment = False
+
+    def step(self, max_expansions=None, max_seconds=None):
+        return self.search.step(max_expansions, max_seconds)
+
+    def run_to_completion(self):
+        return self.search.run_to_completion()
+
+    def iter_events(self):
+        return self.search.iter_events()
+
+    def draw_open_node(self, path_node):
+        self.node_layer.draw_node(path_node.nav_node.position, self.path_colour_3)
+        if self.hover_index is not None:
+            self.hover_index.set_node(path_node, NODE_OPENED)
+
+    def draw_closed_node(self, path_node):
+        self.node_layer.draw_node(path_node.nav_node.position, self.path_colour_4)
+        if self.hover_index is not None:
+            self.hover_index.set_node(path_node, NODE_CLOSED)
+
+    def get_progress_label_text(self, path_node):
+        return "Current Node Path Cost: " + str(path_node.fixed_path_cost)
+
+    def get_finished_label_text(self, end_path_node):
+        return ("Search nodes explored: "
+                "" + str(self.search.search_size) + ", Total depth: "
+                "" + str(end_path_node.depth) + ", Total Path Cost: "
+                "" + str(end_path_node.fixed_path_cost))
+
+    def get_tool_tip_text(self, path_node):
+        return "<b>Fixed Path Cost: </b>" + str(path_node.fixed_path_cost)
+
+    def queue_node_event(self, event_type, path_node):
+        self.node_events.append((event_type, path_node))
+
+    def update_node_layer(self, window_surface, maze_square_size):
+        if self.node_events is None:
+            # we keep our own list of the search's events, so anything else listening to it doesn't miss any
+            self.node_events = []
+            self.search.add_event_listener(self.queue_node_event)
+            self.node_layer = None
+
+        if self.node_layer is None:
+            # draw everything the search has done so far once, after that only the changes get drawn
+            self.node_layer = SearchNodeLayer(window_surface.get_size(), maze_square_size)
+            if self.uses_hover_index:
+                self.hover_index = NodeHoverIndex(maze_square_size)
+            for path_node in self.search.closed_node_list:
+                self.draw_closed_node(path_node)
+            for path_node in self.search.get_open_path_nodes():
+                self.draw_open_node(path_node)
+        else:
+            for event_type, path_node in self.node_events:
+                if event_type == NODE_CLOSED:
+                    self.draw_closed_node(path_node)
+                else:
+                    self.draw_open_node(path_node)
+        self.node_events.clear()
+
+    def draw_information(self, window_surface, ui_manager, maze_square_size, background_surface, ui_rects=()):
+        """
+        Brings the window up to date with the search, drawing over background_surface only where something
+        changed, and returns the rects that need updating on the display. ui_rects are anything else drawn over
+        the window last frame that needs the maze and nodes putting back underneath it.
+        """
+        self.update_node_layer(window_surface, maze_square_size)
+
+        # last frame's current node and hover path get drawn over along with the nodes that changed
+        restore_rects = list(ui_rects) + self.hover_path_rects
+        self.hover_path_rects = []
+        if self.last_current_node_rect is not None:
+            restore_rects.append(self.last_current_node_rect)
+            self.last_current_node_rect = None
+        dirty_rects = self.node_layer.draw(window_surface, background_surface, restore_rects)
+
+        dirty_rects.extend(self.draw_current_node(window_surface, ui_manager, maze_square_size))
+        dirty_rects.extend(self.draw_final_path(window_surface, ui_manager))
+        dirty_rects.extend(self.draw_hover_information(window_surface, ui_manager, maze_square_size))
+        return dirty_rects
+
+    def draw_current_node(self, window_surface, ui_manager, maze_square_size):
+        dirty_rects = []
+        current_path_node = self.search.current_path_node
+        if current_path_node is not None:
+            current_node_rect = pygame.Rect(0, 0, maze_square_size, maze_square_size)
+            current_node_rect.center = current_path_node.nav_node.position
+            pygame.draw.rect(window_surface, self.path_colour_2, current_node_rect)
+            dirty_rects.append(current_node_rect)
+            self.last_current_node_rect = current_node_rect
+
+            # the label text only needs laying out again when there is a new current node to show
+            if current_path_node is not self.progress_label_path_node:
+                self.progress_label_path_node = current_path_node
+                label_text = self.get_progress_label_text(current_path_node)
+                if self.progress_label is not None:
+                    self.progress_label.set_text(label_text)
+                else:
+                    self.progress_label = pygame_gui.elements.UILabel(pygame.Rect((10, 510), (600, 30)),
+                                                                      label_text, ui_manager)
+        return dirty_rects
+
+    def draw_path(self, window_surface):
+        start_node = self.search.start_path_node.nav_node
+        path_rects = []
+        for path_node in self.search.final_path:
+            end_node = path_node.nav_node
+            path_rects.append(pygame.draw.line(window_surface, self.path_colour,
+                                               start_node.position, end_node.position, 4))
+            start_node = end_node
+        return path_rects
+
+    def show_finished_path_info(self, ui_manager):
+        if self.progress_label is not None:
+            self.progress_label.kill()
+            self.progress_label = None
+
+        label_text = self.get_finished_label_text(self.search.final_path[-1])
+        self.finished_path_info_label = pygame_gui.elements.UILabel(pygame.Rect((10, 560), (600, 30)),
+                                                                    label_text, ui_manager)
+
+    def draw_final_path(self, window_surface, ui_manager):
+        if not self.search.finished or not self.search.final_path:
+            return []
+        # drawn every frame in case something under it was put back, but the path never changes once the search
+        # is done so the display only needs updating where it is the first time
+        path_rects = self.draw_path(window_surface)
+        if self.finished_path_info_label is None:
+            self.show_finished_path_info(ui_manager)
+            return path_rects
+        return []
+
+    def draw_hover_path(self, window_surface, hovered_path_node):
+        # the hover path moves with the mouse, last frame's lines are cleared away in draw_information()
+        hover_path_node = hovered_path_node
+        while hover_path_node is not None:
+            new_hover_path_node = hover_path_node.parent_path_node
+            if new_hover_path_node is not None:
+                self.hover_path_rects.append(pygame.draw.line(window_surface, self.path_colour_5,
+                                                              hover_path_node.nav_node.position,
+                                                              new_hover_path_node.nav_node.position, 4))
+            hover_path_node = new_hover_path_node
+        return list(self.hover_path_rects)
+
+    def update_tool_tip(self, ui_manager, hovered_path_node, tool_tip_height):
+        # we only rebuild the tooltip when the mouse moves onto a different node
+        if hovered_path_node is self.hovered_path_node:
+            return
+        self.hovered_path_node = hovered_path_node
+
+        if self.tool_tip is not None:
+            self.tool_tip.kill()
+            self.tool_tip = None
+        if hovered_path_node is not None:
+            self.tool_tip = pygame_gui.elements.UITooltip(self.get_tool_tip_text(hovered_path_node),
+                                                          (0, tool_tip_height), ui_manager)
+            self.tool_tip.find_valid_position(hovered_path_node.nav_node.position)
+
+    def draw_hover_information(self, window_surface, ui_manager, maze_square_size):
+        if self.hover_index is None:
+            return []
+        # only open nodes get a tooltip
+        hovered_path_node, hovered_node_state = self.hover_index.get_node_at(pygame.mouse.get_pos())
+        if hovered_node_state != NODE_OPENED:
+            hovered_path_node = None
+        self.update_tool_tip(ui_manager, hovered_path_node, maze_square_size)
+        return []
@@ -0,0 +1,55 @@
+import pygame
+
+from ..search.events import NODE_OPENED, NODE_CLOSED
+from ..search.bidirectional import BidirectionalSearch
+from .base_finder import BaseFinder
+
+
+class BidirectionalFinder(BaseFinder):
+    def __init__(self, start_nav_node, end_nav_node, nav_nodes, incremental=False, use_heuristic=True,
+                 max_path_search_size=None):
+        super().__init__(BidirectionalSearch(start_nav_node, end_nav_node, nav_nodes, use_heuristic,
+                                             max_path_search_size), incremental)
+
+        # the backward search, coming from the end, gets its own open and closed colours
+        self.path_colour_6 = pygame.Color("#88AA22AA")
+        self.path_colour_7 = pygame.Color("#774499AA")
+
+    def draw_open_node(self, path_node):
+        if self.search.is_backward_path_node(path_node):
+            self.node_layer.draw_node(path_node.nav_node.position, self.path_colour_6)
+        else:
+            self.node_layer.draw_node(path_node.nav_node.position, self.path_colour_3)
+        self.hover_index.set_node(path_node, NODE_OPENED)
+
+    def draw_closed_node(self, path_node):
+        if self.search.is_backward_path_node(path_node):
+            self.node_layer.draw_node(path_node.nav_node.position, self.path_colour_7)
+        else:
+            self.node_layer.draw_node(path_node.nav_node.position, self.path_colour_4)
+        self.hover_index.set_node(path_node, NODE_CLOSED)
+
+    def get_progress_label_text(self, path_node):
+        return ("Forward expansions: " + str(self.search.forward.search_size) + ", "
+                "Backward expansions: " + str(self.search.backward.search_size) + ", "
+                "Current Node Path Cost: " + str(path_node.fixed_path_cost))
+
+    def get_finished_label_text(self, end_path_node):
+        return ("Nodes explored: "
+                "" + str(self.search.forward.search_size) + " forward, "
+                "" + str(self.search.backward.search_size) + " backward, Total depth: "
+                "" + str(end_path_node.depth) + ", Total Path Cost: "
+                "" + str(end_path_node.fixed_path_cost))
+
+    def get_tool_tip_text(self, path_node):
+        if self.search.is_backward_path_node(path_node):
+            return "<b>Fixed Path Cost from End: </b>" + str(path_node.fixed_path_cost)
+        return "<b>Fixed Path Cost from Start: </b>" + str(path_node.fixed_path_cost)
+
+    def draw_hover_information(self, window_surface, ui_manager, maze_square_size):
+        # every node gets a tooltip, and closed ones show the path back to where their side started as well
+        hovered_path_node, hovered_node_state = self.hover_index.get_node_at(pygame.mouse.get_pos())
+        dirty_rects = self.draw_hover_path(window_surface,
+                                           hovered_path_node if hovered_node_state == NODE_CLOSED else None)
+        self.update_tool_tip(ui_manager, hovered_path_node, 32)
+        return dirty_rects
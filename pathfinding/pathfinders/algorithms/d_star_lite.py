@@ -0,0 +1,48 @@
+import pygame
+
+from ..search.d_star_lite import DStarLiteSearch
+from .base_finder import BaseFinder
+
+
+class DStarLiteFinder(BaseFinder):
+    def __init__(self, start_nav_node, end_nav_node, nav_nodes, incremental=False):
+        super().__init__(DStarLiteSearch(start_nav_node, end_nav_node, nav_nodes), incremental)
+
+    def start_replanning(self):
+        # the search keeps going from where it was, but what we've drawn and the labels are for the old plan
+        if self.finished_path_info_label is not None:
+            self.finished_path_info_label.kill()
+            self.finished_path_info_label = None
+        self.node_layer = None
+        self.progress_label_path_node = None
+
+    def move_start(self, start_nav_node):
+        self.search.move_start(start_nav_node)
+        self.start_replanning()
+
+    def add_edge(self, from_nav_node, to_nav_node, edge_cost=None):
+        self.search.add_edge(from_nav_node, to_nav_node, edge_cost)
+        self.start_replanning()
+
+    def remove_edge(self, from_nav_node, to_nav_node):
+        self.search.remove_edge(from_nav_node, to_nav_node)
+        self.start_replanning()
+
+    def get_progress_label_text(self, path_node):
+        return "Current Node Path Cost to End: " + str(path_node.fixed_path_cost)
+
+    def get_finished_label_text(self, end_path_node):
+        return ("Search nodes explored: "
+                "" + str(self.search.search_size) + " (" + str(self.search.total_search_size) + ""
+                " in all), Total depth: "
+                "" + str(end_path_node.depth) + ", Total Path Cost: "
+                "" + str(end_path_node.fixed_path_cost))
+
+    def get_tool_tip_text(self, path_node):
+        return "<b>Path Cost to End: </b>" + str(path_node.fixed_path_cost)
+
+    def draw_hover_information(self, window_surface, ui_manager, maze_square_size):
+        # the search runs backwards from the end, so there's no path back to the start to show on hover
+        hovered_path_node, _ = self.hover_index.get_node_at(pygame.mouse.get_pos())
+        self.update_tool_tip(ui_manager, hovered_path_node, 32)
+        return []
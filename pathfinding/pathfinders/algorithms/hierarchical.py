@@ -0,0 +1,39 @@
+from ..search.hierarchical import HierarchicalSearch
+from .base_finder import BaseFinder
+
+
+class HierarchicalFinder(BaseFinder):
+    def __init__(self, start_nav_node, end_nav_node, cluster_abstraction, incremental=False,
+                 max_path_search_size=None):
+        super().__init__(HierarchicalSearch(start_nav_node, end_nav_node, cluster_abstraction, max_path_search_size),
+                         incremental)
+        self.drawn_path_length = 0
+
+    def get_progress_label_text(self, path_node):
+        return "Current Path Total Cost Estimate: " + str(path_node.total_path_cost_estimate)
+
+    def get_finished_label_text(self, end_path_node):
+        return ("Abstract nodes explored: "
+                "" + str(self.search.search_size) + ", Squares searched: "
+                "" + str(self.search.insertion_search_size + self.search.refinement_search_size) + ""
+                ", Total depth: "
+                "" + str(end_path_node.depth) + ", Total Path Cost (approximate): "
+                "" + str(end_path_node.fixed_path_cost))
+
+    def get_tool_tip_text(self, path_node):
+        return ("<b>Total Path Cost Estimate: </b>" + str(path_node.total_path_cost_estimate) +
+                "<br><b>Manhattan Distance to End Estimate: </b>" + str(path_node.distance_to_end) +
+                "<br><b>Fixed Path Cost: </b>" + str(path_node.fixed_path_cost))
+
+    def draw_final_path(self, window_surface, ui_manager):
+        # the path is refined a link at a time, so draw it as it grows rather than waiting for the end
+        dirty_rects = []
+        if self.search.final_path:
+            path_rects = self.draw_path(window_surface)
+            if len(self.search.final_path) != self.drawn_path_length:
+                self.drawn_path_length = len(self.search.final_path)
+                dirty_rects.extend(path_rects)
+
+        if self.search.finished and self.search.final_path and self.finished_path_info_label is None:
+            self.show_finished_path_info(ui_manager)
+        return dirty_rects
@@ -0,0 +1,36 @@
+import pygame
+
+
+class NodeHoverIndex:
+    """
+    Finds the search node under the mouse without testing every node's square each frame.
+
+    Node squares are put in buckets on a grid of maze_square_size cells, one entry in every cell the square
+    overlaps, so a lookup only has to check the few squares in the cell under the mouse. Setting a nav node
+    again replaces its old entry, which is how nodes move from open to closed.
+    """
+    def __init__(self, maze_square_size):
+        self.maze_square_size = maze_square_size
+        self.buckets = {}
+
+    def set_node(self, path_node, node_state):
+        node_rect = pygame.Rect(0, 0, self.maze_square_size, self.maze_square_size)
+        node_rect.center = path_node.nav_node.position
+        for bucket_x in range(node_rect.left // self.maze_square_size,
+                              (node_rect.right - 1) // self.maze_square_size + 1):
+            for bucket_y in range(node_rect.top // self.maze_square_size,
+                                  (node_rect.bottom - 1) // self.maze_square_size + 1):
+                bucket = self.buckets.setdefault((bucket_x, bucket_y), {})
+                bucket[path_node.nav_node] = (node_rect, path_node, node_state)
+
+    def get_node_at(self, position):
+        """
+        Returns the (path node, node state) whose square contains position, or (None, None) if there isn't one.
+        """
+        bucket = self.buckets.get((int(position[0]) // self.maze_square_size,
+                                   int(position[1]) // self.maze_square_size))
+        if bucket is not None:
+            for node_rect, path_node, node_state in bucket.values():
+                if node_rect.collidepoint(position[0], position[1]):
+                    return path_node, node_state
+        return None, None
@@ -0,0 +1,15 @@
+from ..search.jump_point import JumpPointSearch
+from .base_finder import BaseFinder
+
+
+class JumpPointFinder(BaseFinder):
+    def __init__(self, start_nav_node, end_nav_node, maze_grid, incremental=False, max_path_search_size=2000):
+        super().__init__(JumpPointSearch(start_nav_node, end_nav_node, maze_grid, max_path_search_size), incremental)
+
+    def get_progress_label_text(self, path_node):
+        return "Current Path Total Cost Estimate: " + str(path_node.total_path_cost_estimate)
+
+    def get_tool_tip_text(self, path_node):
+        return ("<b>Total Path Cost Estimate: </b>" + str(path_node.total_path_cost_estimate) +
+                "<br><b>Manhattan Distance to End Estimate: </b>" + str(path_node.distance_to_end) +
+                "<br><b>Fixed Path Cost: </b>" + str(path_node.fixed_path_cost))
@@ -0,0 +1,42 @@
+import pygame
+
+
+class SearchNodeLayer:
+    """
+    The open and closed node squares of a search, kept on their own surface so that each square is only drawn
+    when its state changes instead of every frame. Each frame only the rects that changed since the last one
+    have the maze and the layer put back in them, the rest of the window is left as it was.
+    """
+    transparent_colour = pygame.Color("#FF00FF")
+    # past this many changed rects one blit of the whole window is quicker than lots of little ones
+    max_dirty_rect_count = 200
+
+    def __init__(self, size, maze_square_size):
+        self.surface = pygame.Surface(size)
+        self.surface.fill(self.transparent_colour)
+        self.surface.set_colorkey(self.transparent_colour)
+        self.maze_square_size = maze_square_size
+        self.dirty_rects = [self.surface.get_rect()]
+
+    def draw_node(self, position, colour, text_surface=None):
+        node_rect = pygame.Rect(0, 0, self.maze_square_size, self.maze_square_size)
+        node_rect.center = position
+        pygame.draw.rect(self.surface, colour, node_rect)
+        if text_surface is not None:
+            self.surface.blit(text_surface, text_surface.get_rect(center=position))
+        self.dirty_rects.append(node_rect)
+
+    def draw(self, window_surface, background_surface, extra_rects=()):
+        """
+        Puts the background and then the layer back in every rect that changed, plus extra_rects for anything
+        else drawn over them last frame, and returns those rects.
+        """
+        dirty_rects = self.dirty_rects
+        dirty_rects.extend(extra_rects)
+        self.dirty_rects = []
+        if len(dirty_rects) > self.max_dirty_rect_count:
+            dirty_rects = [window_surface.get_rect()]
+        for dirty_rect in dirty_rects:
+            window_surface.blit(background_surface, dirty_rect, dirty_rect)
+            window_surface.blit(self.surface, dirty_rect, dirty_rect)
+        return dirty_rects
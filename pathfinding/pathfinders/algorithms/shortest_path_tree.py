@@ -0,0 +1,15 @@
+from ..search.shortest_path_tree import ShortestPathTreeSearch
+from .base_finder import BaseFinder
+
+
+class ShortestPathTreeFinder(BaseFinder):
+    uses_hover_index = False
+
+    def __init__(self, start_nav_node, end_nav_node, path_tree_cache, incremental=False):
+        super().__init__(ShortestPathTreeSearch(start_nav_node, end_nav_node, path_tree_cache), incremental)
+
+    def get_finished_label_text(self, end_path_node):
+        return ("Cached next hops walked: "
+                "" + str(self.search.search_size) + ", Total depth: "
+                "" + str(end_path_node.depth) + ", Total Path Cost: "
+                "" + str(end_path_node.fixed_path_cost))
@@ -0,0 +1,126 @@
+import sys
+
+from array import array
+
+from .nav_node import PathFinderNode
+from .search.base_search import BaseSearch
+from .search.dijkstra import DijkstraSearch
+
+
+class AllPairsPathTable:
+    """
+    Precomputed path cost and next hop between every pair of nav nodes, so any query is answered with
+    array lookups rather than a search.
+
+    The table is filled by running single source Dijkstra from every nav node, and is stored as two flat
+    typed arrays indexed by [start_id * node_count + end_id]. Memory grows with the square of the node
+    count, so check estimate_memory_size() for a map size before deciding to build one.
+    """
+    distance_type_code = 'd'
+    next_hop_type_code = 'i'
+
+    def __init__(self, nav_nodes):
+        self.nav_nodes = list(nav_nodes)
+        self.node_ids = {nav_node: node_id for node_id, nav_node in enumerate(self.nav_nodes)}
+        self.node_count = len(self.nav_nodes)
+
+        table_size = self.node_count * self.node_count
+        self.path_costs = array(self.distance_type_code, [float('infinity')]) * table_size
+        self.next_hops = array(self.next_hop_type_code, [-1]) * table_size
+
+        for start_id, start_nav_node in enumerate(self.nav_nodes):
+            self.add_paths_from(start_id, start_nav_node)
+
+    def add_paths_from(self, start_id, start_nav_node):
+        search = DijkstraSearch(start_nav_node, None, self.nav_nodes, single_source=True)
+        search.run_to_completion()
+
+        row_start = start_id * self.node_count
+        self.path_costs[row_start + start_id] = 0.0
+        self.next_hops[row_start + start_id] = start_id
+        # nodes are settled after their parents, so the first hop on each parent's path is always known
+        # by the time we reach its children
+        for path_node in search.closed_node_list:
+            parent_path_node = path_node.parent_path_node
+            if parent_path_node is None:
+                continue
+            end_id = self.node_ids[path_node.nav_node]
+            if parent_path_node.parent_path_node is None:
+                first_hop_id = end_id
+            else:
+                first_hop_id = self.next_hops[row_start + self.node_ids[parent_path_node.nav_node]]
+            self.path_costs[row_start + end_id] = path_node.fixed_path_cost
+            self.next_hops[row_start + end_id] = first_hop_id
+
+    def get_path_cost(self, start_nav_node, end_nav_node):
+        return self.path_costs[self.node_ids[start_nav_node] * self.node_count + self.node_ids[end_nav_node]]
+
+    def get_next_hop(self, start_nav_node, end_nav_node):
+        next_hop_id = self.next_hops[self.node_ids[start_nav_node] * self.node_count +
+                                     self.node_ids[end_nav_node]]
+        if next_hop_id == -1:
+            return None
+        return self.nav_nodes[next_hop_id]
+
+    def get_path(self, start_nav_node, end_nav_node):
+        """
+        Follows the next hops from the start node to the end node. The path comes back as PathFinderNodes
+        in the same form as a finder's final_path (so without the start node), or empty if there isn't one.
+        """
+        final_path = []
+        end_id = self.node_ids[end_nav_node]
+        node_id = self.node_ids[start_nav_node]
+        if self.next_hops[node_id * self.node_count + end_id] == -1:
+            return final_path
+
+        path_node = PathFinderNode(start_nav_node, None, 0)
+        while node_id != end_id:
+            next_hop_id = self.next_hops[node_id * self.node_count + end_id]
+            fixed_path_cost = path_node.fixed_path_cost + (self.path_costs[node_id * self.node_count + end_id] -
+                                                           self.path_costs[next_hop_id * self.node_count + end_id])
+            path_node = PathFinderNode(self.nav_nodes[next_hop_id], path_node, path_node.depth + 1,
+                                       fixed_path_cost, 0.0, fixed_path_cost)
+            final_path.append(path_node)
+            node_id = next_hop_id
+        return final_path
+
+    def get_memory_size(self):
+        """
+        Bytes used by the distance and next hop arrays, plus the nav node to id lookup.
+        """
+        return (self.path_costs.itemsize * len(self.path_costs) +
+                self.next_hops.itemsize * len(self.next_hops) +
+                sys.getsizeof(self.node_ids) + sys.getsizeof(self.nav_nodes))
+
+    @classmethod
+    def estimate_memory_size(cls, node_count):
+        """
+        Bytes the two tables would need for a graph of node_count nav nodes, without building them.
+        """
+        bytes_per_entry = array(cls.distance_type_code).itemsize + array(cls.next_hop_type_code).itemsize
+        return node_count * node_count * bytes_per_entry
+
+
+class AllPairsSearch(BaseSearch):
+    """
+    Looks a path up in an AllPairsPathTable, so it can be run anywhere a search can. There is nothing to
+    expand, the whole path is read out of the table in one update and search_size stays at zero.
+    """
+    def __init__(self, start_nav_node, end_nav_node, path_table):
+        super().__init__("All Pairs")
+        self.end_nav_node = end_nav_node
+        self.path_table = path_table
+        self.start_path_node = PathFinderNode(start_nav_node, None, 0)
+        self.current_path_node = self.start_path_node
+
+    def is_search_complete(self):
+        return self.finished
+
+    def update(self):
+        if not self.finished:
+            self.final_path = self.path_table.get_path(self.start_path_node.nav_node, self.end_nav_node)
+            self.finished = True
+            self.current_path_node = None
+
+    def get_open_path_nodes(self):
+        return []
@@ -0,0 +1,111 @@
+import math
+import multiprocessing
+import os
+import time
+
+from .compact_graph import CompactNavGraph, a_star_search, dijkstra_search
+
+
+class BatchQueryResult:
+    def __init__(self, start_nav_node, end_nav_node, path, path_cost, search_size, search_time):
+        self.start_nav_node = start_nav_node
+        self.end_nav_node = end_nav_node
+        self.path = path  # nav nodes from the start to the end, both included, empty if there is no path
+        self.path_cost = path_cost
+        self.search_size = search_size
+        self.search_time = search_time
+
+    def found_path(self):
+        return len(self.path) > 0
+
+
+class BatchQueryRunner:
+    """
+    Answers lots of (start nav node, end nav node) queries on one maze by spreading them over a pool of
+    processes.
+
+    The maze goes to each worker once, as the flat arrays of a CompactNavGraph, when the pool starts up. After
+    that a task is just a chunk of node id pairs and the results come back as node ids, so no nav nodes are
+    pickled per query. Use it as a context manager, or call close(), to shut the pool down.
+    """
+    algorithms = ("A*", "Dijkstra's")
+
+    def __init__(self, nav_nodes, process_count=None):
+        self.graph = CompactNavGraph.from_nav_nodes(nav_nodes)
+        if process_count is None:
+            process_count = os.cpu_count() or 1
+        self.process_count = process_count
+
+        # with one process there is nothing to gain from a pool, the queries are run right here instead
+        self.pool = None
+        if self.process_count > 1:
+            self.pool = multiprocessing.Pool(self.process_count, _init_worker,
+                                             (self.graph.x_positions, self.graph.y_positions,
+                                              self.graph.edge_offsets, self.graph.edge_targets,
+                                              self.graph.edge_weights))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def run(self, queries, algorithm="A*", chunk_size=None):
+        """
+        Solves a list of (start nav node, end nav node) pairs and returns a BatchQueryResult for each, in the
+        same order as the queries.
+        """
+        if algorithm not in self.algorithms:
+            raise ValueError("Batch queries can't use algorithm: " + str(algorithm))
+
+        id_queries = [(self.graph.get_node_id(start_nav_node), self.graph.get_node_id(end_nav_node), algorithm)
+                      for start_nav_node, end_nav_node in queries]
+        if self.pool is None:
+            id_results = _run_queries(id_queries, self.graph)
+        else:
+            if chunk_size is None:
+                # a few chunks per process so a slow chunk doesn't leave the others idle at the end
+                chunk_size = max(1, math.ceil(len(id_queries) / (self.process_count * 4)))
+            chunks = [id_queries[index:index + chunk_size] for index in range(0, len(id_queries), chunk_size)]
+            id_results = [id_result for chunk_results in self.pool.map(_run_queries, chunks)
+                          for id_result in chunk_results]
+
+        results = []
+        for (start_nav_node, end_nav_node), (path_ids, path_cost, search_size, search_time) in zip(queries,
+                                                                                                 id_results):
+            path = [self.graph.get_nav_node(node_id) for node_id in path_ids]
+            results.append(BatchQueryResult(start_nav_node, end_nav_node, path, path_cost,
+                                            search_size, search_time))
+        return results
+
+
+# each worker process keeps its own copy of the graph, set up once by the pool initialiser
+_worker_graph = None
+
+
+def _init_worker(x_positions, y_positions, edge_offsets, edge_targets, edge_weights):
+    global _worker_graph
+    _worker_graph = CompactNavGraph(x_positions, y_positions, edge_offsets, edge_targets, edge_weights)
+
+
+def _run_queries(id_queries, graph=None):
+    if graph is None:
+        graph = _worker_graph
+
+    id_results = []
+    for start_id, end_id, algorithm in id_queries:
+        start_time = time.perf_counter()
+        if algorithm == "A*":
+            records = a_star_search(graph, start_id, end_id)
+        else:
+            records = dijkstra_search(graph, start_id, end_id)
+        path_ids = records.get_path(start_id, end_id)
+        path_cost = records.fixed_path_costs[end_id] if path_ids else float('infinity')
+        id_results.append((path_ids, path_cost, records.search_size, time.perf_counter() - start_time))
+    return id_results
@@ -0,0 +1,409 @@
+import json
+import random
+import time
+
+from ..maze.maze_generation import create_maze
+from .cluster_abstraction import ClusterAbstraction
+from .contraction_hierarchy import ContractionHierarchy
+from .landmarks import LandmarkHeuristic
+from .multi_agent import MultiAgentPathPlanner
+from .nav_node import NavNode
+from .search.a_star import AStarSearch
+from .search.bidirectional import BidirectionalSearch
+from .search.contraction_hierarchy import ContractionHierarchySearch
+from .search.d_star_lite import DStarLiteSearch
+from .search.dijkstra import DijkstraSearch
+from .search.hierarchical import HierarchicalSearch
+from .search.jump_point import JumpPointSearch
+
+
+def make_benchmark_maze(maze_size, seed=0):
+    """
+    Makes the same maze every time for a given size and seed, laid out like the app's. Returns the
+    create_maze() tuple.
+    """
+    random.seed(seed)
+    return create_maze(top_left=(20, 20), square_size=10, width=maze_size, height=maze_size)
+
+
+def make_benchmark_queries(nav_nodes, query_count, seed=0):
+    query_random = random.Random(seed)
+    return [(query_random.choice(nav_nodes), query_random.choice(nav_nodes)) for _ in range(query_count)]
+
+
+def get_path_cost(search):
+    if search.final_path:
+        return search.final_path[-1].fixed_path_cost
+    return None
+
+
+def make_grid_nav_nodes(maze_grid):
+    """
+    A nav node for every open square of the maze grid, linked to the open squares beside it, keyed by grid
+    position. This is the graph plain A* would search if it had no junctions to skip the corridors with.
+    """
+    grid_nav_nodes = {}
+    for x in range(maze_grid.width):
+        for y in range(maze_grid.height):
+            if maze_grid.is_open(x, y):
+                grid_nav_nodes[(x, y)] = NavNode(maze_grid.get_screen_position(x, y))
+    for (x, y), nav_node in grid_nav_nodes.items():
+        for neighbour_position in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if neighbour_position in grid_nav_nodes:
+                nav_node.add_neighbour(grid_nav_nodes[neighbour_position])
+    return grid_nav_nodes
+
+
+def compare_jump_point_with_a_star(maze_size=80, query_count=100, seed=0):
+    """
+    Runs the same random queries on one maze with A* over the junction graph, A* over every open grid square
+    and Jump Point Search over the grid, and returns a dict with the totals for each under 'results'.
+    'different_costs' counts queries where Jump Point Search didn't agree with A* on the path cost, which
+    should always be 0.
+    """
+    walls, junctions, entrance, exit, maze_grid = make_benchmark_maze(maze_size, seed)
+    nav_nodes = [junction.nav_node for junction in junctions]
+    queries = [(entrance.nav_node, exit.nav_node)] + make_benchmark_queries(nav_nodes, query_count - 1, seed)
+    grid_nav_nodes = make_grid_nav_nodes(maze_grid)
+
+    a_star_report = {"expansions": 0, "query_time": 0.0}
+    grid_a_star_report = {"expansions": 0, "query_time": 0.0}
+    jump_point_report = {"expansions": 0, "query_time": 0.0, "different_costs": 0}
+
+    for start_nav_node, end_nav_node in queries:
+        start_time = time.perf_counter()
+        a_star_search = AStarSearch(start_nav_node, end_nav_node, None)
+        a_star_search.run_to_completion()
+        a_star_report["query_time"] += time.perf_counter() - start_time
+        a_star_report["expansions"] += a_star_search.search_size
+
+        start_time = time.perf_counter()
+        grid_a_star_search = AStarSearch(grid_nav_nodes[maze_grid.get_grid_position(start_nav_node.position)],
+                                         grid_nav_nodes[maze_grid.get_grid_position(end_nav_node.position)], None)
+        grid_a_star_search.run_to_completion()
+        grid_a_star_report["query_time"] += time.perf_counter() - start_time
+        grid_a_star_report["expansions"] += grid_a_star_search.search_size
+
+        start_time = time.perf_counter()
+        jump_point_search = JumpPointSearch(start_nav_node, end_nav_node, maze_grid, None)
+        jump_point_search.run_to_completion()
+        jump_point_report["query_time"] += time.perf_counter() - start_time
+        jump_point_report["expansions"] += jump_point_search.search_size
+
+        a_star_path_cost = get_path_cost(a_star_search)
+        jump_point_path_cost = get_path_cost(jump_point_search)
+        if ((a_star_path_cost is None) != (jump_point_path_cost is None) or
+                (a_star_path_cost is not None and abs(a_star_path_cost - jump_point_path_cost) > 1e-6)):
+            jump_point_report["different_costs"] += 1
+
+    return {"maze_size": maze_size, "query_count": len(queries),
+            "results": {"A*": a_star_report, "A* (grid squares)": grid_a_star_report,
+                        "Jump Point": jump_point_report}}
+
+
+def compare_bidirectional_with_one_way(maze_size=80, query_count=100, seed=0):
+    """
+    Runs the same random queries on one maze with A* and Dijkstra's, and with the bidirectional version of
+    each, and returns a dict with the totals for each under 'results'. The first query is always the entrance
+    to the exit, and 'entrance_to_exit_expansions' is how many nodes each needed for that one alone. The
+    bidirectional searches also split their expansions into the forward and backward sides. 'different_costs'
+    counts queries where a bidirectional search didn't agree with Dijkstra's on the path cost, which should
+    always be 0.
+    """
+    walls, junctions, entrance, exit, maze_grid = make_benchmark_maze(maze_size, seed)
+    nav_nodes = [junction.nav_node for junction in junctions]
+    queries = [(entrance.nav_node, exit.nav_node)] + make_benchmark_queries(nav_nodes, query_count - 1, seed)
+
+    search_factories = {"A*": lambda start, end: AStarSearch(start, end, None),
+                        "Dijkstra's": lambda start, end: DijkstraSearch(start, end, nav_nodes),
+                        "Bidirectional A*": lambda start, end: BidirectionalSearch(start, end, nav_nodes, True),
+                        "Bidirectional Dijkstra": lambda start, end: BidirectionalSearch(start, end, nav_nodes,
+                                                                                         False)}
+    results = {}
+    for name, search_factory in search_factories.items():
+        report = {"expansions": 0, "entrance_to_exit_expansions": 0, "query_time": 0.0}
+        if name.startswith("Bidirectional"):
+            report.update({"forward_expansions": 0, "backward_expansions": 0, "different_costs": 0})
+        results[name] = report
+
+    for query_index, (start_nav_node, end_nav_node) in enumerate(queries):
+        dijkstra_path_cost = None
+        for name, search_factory in search_factories.items():
+            report = results[name]
+            start_time = time.perf_counter()
+            search = search_factory(start_nav_node, end_nav_node)
+            search.run_to_completion()
+            report["query_time"] += time.perf_counter() - start_time
+            report["expansions"] += search.search_size
+            if query_index == 0:
+                report["entrance_to_exit_expansions"] = search.search_size
+
+            path_cost = get_path_cost(search)
+            if name == "Dijkstra's":
+                dijkstra_path_cost = path_cost
+            if isinstance(search, BidirectionalSearch):
+                report["forward_expansions"] += search.forward.search_size
+                report["backward_expansions"] += search.backward.search_size
+                if ((dijkstra_path_cost is None) != (path_cost is None) or
+                        (path_cost is not None and abs(dijkstra_path_cost - path_cost) > 1e-6)):
+                    report["different_costs"] += 1
+
+    return {"maze_size": maze_size, "query_count": len(queries), "results": results}
+
+
+def compare_hierarchical_with_a_star(maze_size=160, cluster_size=16, query_count=100, seed=0):
+    """
+    Runs the same random queries on one maze with plain A* over the junction graph and with HPA* over a
+    ClusterAbstraction, and returns a dict with the totals for each under 'results'. A* has nothing to build
+    up front, so its preprocessing time and memory are zero.
+
+    Expansions are nav nodes for A* and abstract nodes for HPA*. HPA*'s 'squares_searched' is the extra grid
+    squares it looks at linking in the start and end and refining the path.
+    """
+    walls, junctions, entrance, exit, maze_grid = make_benchmark_maze(maze_size, seed)
+    nav_nodes = [junction.nav_node for junction in junctions]
+    queries = [(entrance.nav_node, exit.nav_node)] + make_benchmark_queries(nav_nodes, query_count - 1, seed)
+
+    cluster_abstraction = ClusterAbstraction(maze_grid, cluster_size)
+    a_star_report = {"preprocessing_time": 0.0, "memory_size": 0, "expansions": 0, "query_time": 0.0}
+    hierarchical_report = {"preprocessing_time": cluster_abstraction.preprocessing_time,
+                           "memory_size": cluster_abstraction.get_memory_size(),
+                           "abstract_node_count": cluster_abstraction.get_abstract_node_count(),
+                           "expansions": 0, "squares_searched": 0, "query_time": 0.0,
+                           "longer_paths": 0}
+
+    for start_nav_node, end_nav_node in queries:
+        start_time = time.perf_counter()
+        a_star_search = AStarSearch(start_nav_node, end_nav_node, None)
+        a_star_search.run_to_completion()
+        a_star_report["query_time"] += time.perf_counter() - start_time
+        a_star_report["expansions"] += a_star_search.search_size
+
+        start_time = time.perf_counter()
+        hierarchical_search = HierarchicalSearch(start_nav_node, end_nav_node, cluster_abstraction)
+        hierarchical_search.run_to_completion()
+        hierarchical_report["query_time"] += time.perf_counter() - start_time
+        hierarchical_report["expansions"] += hierarchical_search.search_size
+        hierarchical_report["squares_searched"] += (hierarchical_search.insertion_search_size +
+                                                    hierarchical_search.refinement_search_size)
+
+        # one entrance per run of open border can miss the very shortest way through a wide opening
+        a_star_path_cost = get_path_cost(a_star_search)
+        hierarchical_path_cost = get_path_cost(hierarchical_search)
+        if (a_star_path_cost is not None and hierarchical_path_cost is not None and
+                hierarchical_path_cost > a_star_path_cost):
+            hierarchical_report["longer_paths"] += 1
+
+    return {"maze_size": maze_size, "query_count": len(queries),
+            "results": {"A*": a_star_report, "Hierarchical": hierarchical_report}}
+
+
+def compare_contraction_hierarchy_with_dijkstra(maze_size=160, query_count=100, seed=0):
+    """
+    Runs the same random queries on one maze with Dijkstra's and with a ContractionHierarchy, and returns a dict
+    with the totals for each under 'results'. The hierarchy's memory_size is the length of its json form.
+    'different_costs' counts queries where the two didn't agree on the path cost, which should always be 0.
+    """
+    walls, junctions, entrance, exit, maze_grid = make_benchmark_maze(maze_size, seed)
+    nav_nodes = [junction.nav_node for junction in junctions]
+    queries = [(entrance.nav_node, exit.nav_node)] + make_benchmark_queries(nav_nodes, query_count - 1, seed)
+
+    contraction_hierarchy = ContractionHierarchy(nav_nodes)
+    dijkstra_report = {"preprocessing_time": 0.0, "memory_size": 0, "expansions": 0, "query_time": 0.0}
+    hierarchy_report = {"preprocessing_time": contraction_hierarchy.preprocessing_time,
+                        "memory_size": len(json.dumps(contraction_hierarchy.to_data())),
+                        "shortcut_count": contraction_hierarchy.get_shortcut_count(),
+                        "expansions": 0, "query_time": 0.0, "different_costs": 0}
+
+    for start_nav_node, end_nav_node in queries:
+        start_time = time.perf_counter()
+        dijkstra_search = DijkstraSearch(start_nav_node, end_nav_node, nav_nodes)
+        dijkstra_search.run_to_completion()
+        dijkstra_report["query_time"] += time.perf_counter() - start_time
+        dijkstra_report["expansions"] += dijkstra_search.search_size
+
+        start_time = time.perf_counter()
+        hierarchy_search = ContractionHierarchySearch(start_nav_node, end_nav_node, contraction_hierarchy)
+        hierarchy_search.run_to_completion()
+        hierarchy_report["query_time"] += time.perf_counter() - start_time
+        hierarchy_report["expansions"] += hierarchy_search.search_size
+
+        dijkstra_path_cost = get_path_cost(dijkstra_search)
+        hierarchy_path_cost = get_path_cost(hierarchy_search)
+        if ((dijkstra_path_cost is None) != (hierarchy_path_cost is None) or
+                (dijkstra_path_cost is not None and abs(dijkstra_path_cost - hierarchy_path_cost) > 1e-6)):
+            hierarchy_report["different_costs"] += 1
+
+    return {"maze_size": maze_size, "query_count": len(queries),
+            "results": {"Dijkstra's": dijkstra_report, "Contraction Hierarchy": hierarchy_report}}
+
+
+def compare_landmarks_with_straight_line(maze_size=80, landmark_counts=(4, 8, 16), landmark_selection='farthest',
+                                         query_count=100, seed=0):
+    """
+    Runs the same random queries on one maze with A* using the straight line to the end, and with A* using a
+    LandmarkHeuristic for each of landmark_counts, and returns a dict with the totals for each under 'results'.
+    'fewer_expansions' is how many fewer nodes the landmarks needed expanding than the straight line, over
+    all the queries.
+    """
+    walls, junctions, entrance, exit, maze_grid = make_benchmark_maze(maze_size, seed)
+    nav_nodes = [junction.nav_node for junction in junctions]
+    queries = [(entrance.nav_node, exit.nav_node)] + make_benchmark_queries(nav_nodes, query_count - 1, seed)
+
+    heuristics = {"Straight line": None}
+    for landmark_count in landmark_counts:
+        heuristics[str(landmark_count) + " landmarks"] = LandmarkHeuristic(nav_nodes, landmark_count,
+                                                                         landmark_selection=landmark_selection,
+                                                                         random_seed=seed)
+
+    results = {}
+    for name, landmark_heuristic in heuristics.items():
+        report = {"preprocessing_time": 0.0, "stored_costs": 0, "expansions": 0, "query_time": 0.0}
+        if landmark_heuristic is not None:
+            report["preprocessing_time"] = landmark_heuristic.preprocessing_time
+            report["stored_costs"] = landmark_heuristic.get_stored_cost_count()
+        for start_nav_node, end_nav_node in queries:
+            start_time = time.perf_counter()
+            search = AStarSearch(start_nav_node, end_nav_node, None, landmark_heuristic)
+            search.run_to_completion()
+            report["query_time"] += time.perf_counter() - start_time
+            report["expansions"] += search.search_size
+        if landmark_heuristic is not None:
+            report["fewer_expansions"] = results["Straight line"]["expansions"] - report["expansions"]
+        results[name] = report
+
+    return {"maze_size": maze_size, "query_count": len(queries), "results": results}
+
+
+def remove_nav_node_edge(nav_node, neighbour):
+    if neighbour in nav_node.neighbours:
+        neighbour_index = nav_node.neighbours.index(neighbour)
+        del nav_node.neighbours[neighbour_index]
+        del nav_node.neighbour_distances[neighbour_index]
+        return True
+    return False
+
+
+def compare_replanning_with_scratch(maze_size=80, move_count=100, wall_every=3, seed=0):
+    """
+    Walks an agent from the maze entrance towards the exit one nav node at a time, dropping a wall across the
+    path ahead of it every wall_every moves, and after each change gets a new path by repairing one D* Lite
+    search. It also solves each one from scratch with A* and with a new D* Lite search. Returns a dict with
+    the totals for each under 'results'. 'different_costs' counts replans that didn't agree with A*.
+    """
+    walls, junctions, entrance, exit, maze_grid = make_benchmark_maze(maze_size, seed)
+    nav_nodes = [junction.nav_node for junction in junctions]
+    wall_random = random.Random(seed)
+
+    start_time = time.perf_counter()
+    replanning_search = DStarLiteSearch(entrance.nav_node, exit.nav_node, nav_nodes)
+    replanning_search.run_to_completion()
+    replanning_report = {"first_plan_time": time.perf_counter() - start_time,
+                         "first_plan_expansions": replanning_search.search_size,
+                         "replans": 0, "expansions": 0, "query_time": 0.0, "different_costs": 0}
+    a_star_report = {"expansions": 0, "query_time": 0.0}
+    d_star_lite_report = {"expansions": 0, "query_time": 0.0}
+
+    for move_index in range(move_count):
+        if len(replanning_search.final_path) < 2:
+            break
+
+        if move_index % wall_every == 0:
+            # block an edge somewhere in the next few steps, both ways round, as a wall would
+            path_index = wall_random.randrange(min(4, len(replanning_search.final_path) - 1))
+            from_nav_node = replanning_search.final_path[path_index].nav_node
+            to_nav_node = replanning_search.final_path[path_index + 1].nav_node
+            for edge_from, edge_to in ((from_nav_node, to_nav_node), (to_nav_node, from_nav_node)):
+                if remove_nav_node_edge(edge_from, edge_to):
+                    replanning_search.remove_edge(edge_from, edge_to)
+        start_nav_node = replanning_search.final_path[0].nav_node
+        replanning_search.move_start(start_nav_node)
+
+        start_time = time.perf_counter()
+        replanning_search.run_to_completion()
+        replanning_report["query_time"] += time.perf_counter() - start_time
+        replanning_report["expansions"] += replanning_search.search_size
+        replanning_report["replans"] += 1
+
+        start_time = time.perf_counter()
+        a_star_search = AStarSearch(start_nav_node, exit.nav_node, None)
+        a_star_search.run_to_completion()
+        a_star_report["query_time"] += time.perf_counter() - start_time
+        a_star_report["expansions"] += a_star_search.search_size
+
+        start_time = time.perf_counter()
+        d_star_lite_search = DStarLiteSearch(start_nav_node, exit.nav_node, nav_nodes)
+        d_star_lite_search.run_to_completion()
+        d_star_lite_report["query_time"] += time.perf_counter() - start_time
+        d_star_lite_report["expansions"] += d_star_lite_search.search_size
+
+        a_star_path_cost = get_path_cost(a_star_search)
+        replanning_path_cost = get_path_cost(replanning_search)
+        if ((a_star_path_cost is None) != (replanning_path_cost is None) or
+                (a_star_path_cost is not None and abs(a_star_path_cost - replanning_path_cost) > 1e-6)):
+            replanning_report["different_costs"] += 1
+
+    return {"maze_size": maze_size, "query_count": replanning_report["replans"],
+            "results": {"D* Lite replanning": replanning_report, "A* from scratch": a_star_report,
+                        "D* Lite from scratch": d_star_lite_report}}
+
+
+def compare_multi_agent_with_independent(maze_size=80, agent_count=200, goal_count=4, seed=0):
+    """
+    Routes agent_count agents from random nav nodes to goal_count goals, the exit and random nav nodes, first
+    with an A* search per agent and then with one MultiAgentPathPlanner call. Returns a dict with the totals
+    for each under 'results'. 'different_costs' counts agents whose path costs didn't agree.
+    """
+    walls, junctions, entrance, exit, maze_grid = make_benchmark_maze(maze_size, seed)
+    nav_nodes = [junction.nav_node for junction in junctions]
+    agent_random = random.Random(seed)
+    goals = [exit.nav_node] + [agent_random.choice(nav_nodes) for _ in range(goal_count - 1)]
+    path_requests = [(agent_random.choice(nav_nodes), agent_random.choice(goals)) for _ in range(agent_count)]
+
+    independent_report = {"searches": 0, "expansions": 0, "query_time": 0.0}
+    a_star_path_costs = []
+    start_time = time.perf_counter()
+    for start_nav_node, end_nav_node in path_requests:
+        a_star_search = AStarSearch(start_nav_node, end_nav_node, None)
+        a_star_search.run_to_completion()
+        independent_report["searches"] += 1
+        independent_report["expansions"] += a_star_search.search_size
+        a_star_path_costs.append(get_path_cost(a_star_search))
+    independent_report["query_time"] = time.perf_counter() - start_time
+
+    results = MultiAgentPathPlanner(nav_nodes).find_paths(path_requests)
+    planner_report = {"searches": results.new_search_count, "expansions": results.search_size,
+                      "query_time": results.solve_time, "found_paths": results.get_found_path_count(),
+                      "different_costs": 0}
+    for a_star_path_cost, agent_path in zip(a_star_path_costs, results.agent_paths):
+        planner_path_cost = agent_path.path[-1].fixed_path_cost if agent_path.found_path() else None
+        if ((a_star_path_cost is None) != (planner_path_cost is None) or
+                (a_star_path_cost is not None and abs(a_star_path_cost - planner_path_cost) > 1e-6)):
+            planner_report["different_costs"] += 1
+
+    return {"maze_size": maze_size, "query_count": agent_count,
+            "results": {"A* per agent": independent_report, "Shared per goal": planner_report}}
+
+
+def format_value(value):
+    if isinstance(value, float):
+        return "{:.4f}".format(value)
+    return str(value)
+
+
+def print_report(report):
+    print("Maze " + str(report["maze_size"]) + "x" + str(report["maze_size"]) + ", " +
+          str(report["query_count"]) + " queries")
+    for name, results in report["results"].items():
+        print("  " + name + ": " + ", ".join(key + " " + format_value(value) for key, value in results.items()))
+
+
+if __name__ == "__main__":
+    for benchmark_maze_size in (80, 160):
+        print_report(compare_jump_point_with_a_star(benchmark_maze_size))
+        print_report(compare_bidirectional_with_one_way(benchmark_maze_size))
+        print_report(compare_hierarchical_with_a_star(benchmark_maze_size))
+        print_report(compare_contraction_hierarchy_with_dijkstra(benchmark_maze_size))
+        print_report(compare_landmarks_with_straight_line(benchmark_maze_size))
+        print_report(compare_replanning_with_scratch(benchmark_maze_size))
+        print_report(compare_multi_agent_with_independent(benchmark_maze_size))
@@ -0,0 +1,129 @@
+import sys
+import time
+
+from collections import deque
+
+
+class ClusterAbstraction:
+    """
+    A small abstract graph over the maze grid, for hierarchical pathfinding (HPA*) on mazes too big to search
+    square by square, or junction by junction, for every query.
+
+    The grid is cut into square clusters of cluster_size squares. Wherever open squares face each other across
+    a cluster border we make an entrance: one pair of abstract nodes for each run of open border, in the middle
+    of the run, or one at each end if the run is long. Each pair is linked by a one square step, and the
+    entrances inside a cluster are linked to each other by their shortest distance within that cluster.
+
+    This is built once per maze and only holds the distances. The squares along each link are found again
+    when a query needs them, see HierarchicalSearch. Abstract nodes are (x, y) grid positions and costs are in
+    the same screen units as the nav node edges.
+    """
+    long_entrance_length = 6
+
+    def __init__(self, maze_grid, cluster_size=16):
+        start_time = time.perf_counter()
+        self.maze_grid = maze_grid
+        self.cluster_size = cluster_size
+
+        self.abstract_edges = {}
+        self.cluster_entrances = {}
+        self.find_entrances()
+        for cluster, entrance_positions in self.cluster_entrances.items():
+            self.link_cluster_entrances(cluster, entrance_positions)
+
+        self.preprocessing_time = time.perf_counter() - start_time
+
+    def get_cluster(self, grid_position):
+        return grid_position[0] // self.cluster_size, grid_position[1] // self.cluster_size
+
+    def get_abstract_node_count(self):
+        return len(self.abstract_edges)
+
+    def get_abstract_edge_count(self):
+        return sum(len(edges) for edges in self.abstract_edges.values())
+
+    def get_edges(self, grid_position):
+        return self.abstract_edges.get(grid_position, ())
+
+    def add_abstract_node(self, grid_position):
+        if grid_position not in self.abstract_edges:
+            self.abstract_edges[grid_position] = []
+            self.cluster_entrances.setdefault(self.get_cluster(grid_position), []).append(grid_position)
+
+    def add_entrance(self, grid_position, other_grid_position):
+        self.add_abstract_node(grid_position)
+        self.add_abstract_node(other_grid_position)
+        self.abstract_edges[grid_position].append((other_grid_position, float(self.maze_grid.square_size)))
+        self.abstract_edges[other_grid_position].append((grid_position, float(self.maze_grid.square_size)))
+
+    def find_entrances(self):
+        is_open = self.maze_grid.is_open
+        # borders between clusters side by side, then between clusters above and below each other
+        for border_x in range(self.cluster_size, self.maze_grid.width, self.cluster_size):
+            self.add_border_entrances([((border_x - 1, y), (border_x, y)) for y in range(self.maze_grid.height)
+                                       if is_open(border_x - 1, y) and is_open(border_x, y)])
+        for border_y in range(self.cluster_size, self.maze_grid.height, self.cluster_size):
+            self.add_border_entrances([((x, border_y - 1), (x, border_y)) for x in range(self.maze_grid.width)
+                                       if is_open(x, border_y - 1) and is_open(x, border_y)])
+
+    def add_border_entrances(self, open_border_pairs):
+        # split the open pairs along a border into unbroken runs that don't cross into another cluster
+        run = []
+        for border_pair in open_border_pairs:
+            if run and (self.get_cluster(run[-1][0]) != self.get_cluster(border_pair[0]) or
+                        abs(run[-1][0][0] - border_pair[0][0]) + abs(run[-1][0][1] - border_pair[0][1]) != 1):
+                self.add_run_entrances(run)
+                run = []
+            run.append(border_pair)
+        if run:
+            self.add_run_entrances(run)
+
+    def add_run_entrances(self, run):
+        if len(run) >= self.long_entrance_length:
+            self.add_entrance(*run[0])
+            self.add_entrance(*run[-1])
+        else:
+            self.add_entrance(*run[len(run) // 2])
+
+    def link_cluster_entrances(self, cluster, entrance_positions):
+        for entrance_position in entrance_positions:
+            distances, _ = self.search_cluster(entrance_position, cluster)
+            for other_entrance_position in entrance_positions:
+                if other_entrance_position != entrance_position and other_entrance_position in distances:
+                    self.abstract_edges[entrance_position].append((other_entrance_position,
+                                                                   distances[other_entrance_position]))
+
+    def search_cluster(self, start_grid_position, cluster, end_grid_position=None):
+        """
+        Breadth first search of the open squares in one cluster. Every step costs the same, so this finds the
+        shortest distance to each square it reaches. Returns a dict of distances and a dict of the square each
+        one was reached from. Stops early if it reaches end_grid_position.
+        """
+        is_open = self.maze_grid.is_open
+        square_size = self.maze_grid.square_size
+        distances = {start_grid_position: 0.0}
+        parents = {start_grid_position: None}
+        open_squares = deque([start_grid_position])
+        while open_squares:
+            x, y = open_squares.popleft()
+            if (x, y) == end_grid_position:
+                break
+            for neighbour in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if (neighbour not in distances and is_open(neighbour[0], neighbour[1]) and
+                        self.get_cluster(neighbour) == cluster):
+                    distances[neighbour] = distances[(x, y)] + square_size
+                    parents[neighbour] = (x, y)
+                    open_squares.append(neighbour)
+        return distances, parents
+
+    def get_memory_size(self):
+        """
+        Rough bytes used by the abstract graph: the edge dict, its lists and the tuples in them.
+        """
+        memory_size = sys.getsizeof(self.abstract_edges) + sys.getsizeof(self.cluster_entrances)
+        for grid_position, edges in self.abstract_edges.items():
+            memory_size += sys.getsizeof(grid_position) + sys.getsizeof(edges)
+            memory_size += sum(sys.getsizeof(edge) for edge in edges)
+        for entrance_positions in self.cluster_entrances.values():
+            memory_size += sys.getsizeof(entrance_positions)
+        return memory_size
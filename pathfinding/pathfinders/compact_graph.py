@@ -0,0 +1,209 @@
+import heapq
+import math
+import sys
+
+from array import array
+
+from .nav_node import PathFinderNode
+from .search.base_search import BaseSearch
+
+
+class CompactNavGraph:
+    """
+    The nav node graph packed into flat typed arrays, for searching big mazes without a Python object per
+    node and per edge.
+
+    Nodes are numbered 0 to node_count - 1 and their positions live in x_positions and y_positions.
+    Adjacency is in compressed sparse row form: the edges leaving node i are at indices
+    edge_offsets[i] up to edge_offsets[i + 1] in edge_targets (the node id at the far end) and edge_weights
+    (the length of the edge).
+
+    The searches in this module run over it. CompactGraphSearch wraps them for the PathfindingEngine, and
+    BatchQueryRunner sends the arrays to its worker processes.
+    """
+    def __init__(self, x_positions, y_positions, edge_offsets, edge_targets, edge_weights, nav_nodes=None):
+        self.x_positions = x_positions
+        self.y_positions = y_positions
+        self.edge_offsets = edge_offsets
+        self.edge_targets = edge_targets
+        self.edge_weights = edge_weights
+        self.node_count = len(x_positions)
+
+        # only there when the graph was built from nav nodes, so we can hand paths back as nav nodes
+        self.nav_nodes = nav_nodes
+        self.node_ids = None
+        if nav_nodes is not None:
+            self.node_ids = {nav_node: node_id for node_id, nav_node in enumerate(nav_nodes)}
+
+    @classmethod
+    def from_nav_nodes(cls, nav_nodes):
+        nav_nodes = list(nav_nodes)
+        node_ids = {nav_node: node_id for node_id, nav_node in enumerate(nav_nodes)}
+        x_positions = array('d', [nav_node.position[0] for nav_node in nav_nodes])
+        y_positions = array('d', [nav_node.position[1] for nav_node in nav_nodes])
+        edge_offsets = array('i', [0])
+        edge_targets = array('i')
+        edge_weights = array('d')
+        for nav_node in nav_nodes:
+            for neighbour in nav_node.neighbours:
+                edge_targets.append(node_ids[neighbour])
+            edge_weights.extend(nav_node.neighbour_distances)
+            edge_offsets.append(len(edge_targets))
+        return cls(x_positions, y_positions, edge_offsets, edge_targets, edge_weights, nav_nodes)
+
+    def get_node_id(self, nav_node):
+        return self.node_ids[nav_node]
+
+    def get_nav_node(self, node_id):
+        return self.nav_nodes[node_id]
+
+    def get_memory_size(self):
+        """
+        Bytes used by the position and adjacency arrays.
+        """
+        return sum(node_array.itemsize * len(node_array)
+                   for node_array in (self.x_positions, self.y_positions, self.edge_offsets,
+                                      self.edge_targets, self.edge_weights))
+
+
+class CompactSearchRecords:
+    """
+    Per node search state for the compact searches, kept as one array per field instead of a PathFinderNode
+    per node. parent_ids holds -1 for nodes the search never reached.
+    """
+    def __init__(self, node_count):
+        self.parent_ids = array('i', [-1]) * node_count
+        self.fixed_path_costs = array('d', [float('infinity')]) * node_count
+        self.closed = bytearray(node_count)
+        self.search_size = 0
+
+    def get_path(self, start_id, end_id):
+        """
+        The node ids from start_id to end_id, both included, following parent ids back from the end. Empty
+        if the search never reached end_id.
+        """
+        if end_id != start_id and self.parent_ids[end_id] == -1:
+            return []
+        path = [end_id]
+        while path[-1] != start_id:
+            path.append(self.parent_ids[path[-1]])
+        path.reverse()
+        return path
+
+    def get_memory_size(self):
+        return (self.parent_ids.itemsize * len(self.parent_ids) +
+                self.fixed_path_costs.itemsize * len(self.fixed_path_costs) + sys.getsizeof(self.closed))
+
+
+def a_star_search(graph, start_id, end_id, max_search_size=None):
+    """
+    A* from start_id to end_id over a CompactNavGraph with a straight line distance heuristic. Stops once
+    end_id is closed or max_search_size nodes have been expanded.
+    """
+    x_positions = graph.x_positions
+    y_positions = graph.y_positions
+    end_x = x_positions[end_id]
+    end_y = y_positions[end_id]
+
+    def distance_to_end(node_id):
+        return math.sqrt((x_positions[node_id] - end_x) ** 2 + (y_positions[node_id] - end_y) ** 2)
+
+    return _best_first_search(graph, start_id, end_id, distance_to_end, None, max_search_size)
+
+
+def dijkstra_search(graph, start_id, end_id=None, max_path_cost=None, max_search_size=None):
+    """
+    Dijkstra's over a CompactNavGraph. With an end_id it stops as soon as that node is settled, without one
+    it settles every node reachable from start_id (or within max_path_cost of it, if given).
+    """
+    return _best_first_search(graph, start_id, end_id, None, max_path_cost, max_search_size)
+
+
+def _best_first_search(graph, start_id, end_id, heuristic, max_path_cost, max_search_size):
+    edge_offsets = graph.edge_offsets
+    edge_targets = graph.edge_targets
+    edge_weights = graph.edge_weights
+
+    records = CompactSearchRecords(graph.node_count)
+    parent_ids = records.parent_ids
+    fixed_path_costs = records.fixed_path_costs
+    closed = records.closed
+
+    # heap entries are (estimate, insertion order, node id). A node can be in the heap more than once if we
+    # found a cheaper route to it, the older entries are skipped when they come up since it is closed by then
+    fixed_path_costs[start_id] = 0.0
+    open_node_heap = [(0.0 if heuristic is None else heuristic(start_id), 0, start_id)]
+    insertion_count = 1
+    while open_node_heap:
+        if max_search_size is not None and records.search_size >= max_search_size:
+            break
+        node_id = heapq.heappop(open_node_heap)[2]
+        if closed[node_id]:
+            continue
+        node_path_cost = fixed_path_costs[node_id]
+        if max_path_cost is not None and node_path_cost > max_path_cost:
+            break
+
+        closed[node_id] = 1
+        records.search_size += 1
+        if node_id == end_id:
+            break
+
+        for edge_index in range(edge_offsets[node_id], edge_offsets[node_id + 1]):
+            neighbour_id = edge_targets[edge_index]
+            if closed[neighbour_id]:
+                continue
+            fixed_path_cost = node_path_cost + edge_weights[edge_index]
+            if fixed_path_cost < fixed_path_costs[neighbour_id]:
+                fixed_path_costs[neighbour_id] = fixed_path_cost
+                parent_ids[neighbour_id] = node_id
+                estimate = fixed_path_cost if heuristic is None else fixed_path_cost + heuristic(neighbour_id)
+                heapq.heappush(open_node_heap, (estimate, insertion_count, neighbour_id))
+                insertion_count += 1
+
+    return records
+
+
+class CompactGraphSearch(BaseSearch):
+    """
+    Runs a_star_search(), or dijkstra_search() without the heuristic, over a CompactNavGraph built from nav
+    nodes, so the engine can use the compact searches like any other. The whole search happens in one update
+    and the path comes back as PathFinderNodes, in the same form as the other searches' final_path.
+    """
+    def __init__(self, start_nav_node, end_nav_node, graph, use_heuristic=True, max_search_size=None):
+        super().__init__("A* (Compact)" if use_heuristic else "Dijkstra's (Compact)")
+        self.end_nav_node = end_nav_node
+        self.graph = graph
+        self.use_heuristic = use_heuristic
+        self.max_search_size = max_search_size
+        self.start_path_node = PathFinderNode(start_nav_node, None, 0)
+        self.current_path_node = self.start_path_node
+
+    def is_search_complete(self):
+        return self.finished
+
+    def update(self):
+        if self.finished:
+            return
+        start_id = self.graph.get_node_id(self.start_path_node.nav_node)
+        end_id = self.graph.get_node_id(self.end_nav_node)
+        if self.use_heuristic:
+            records = a_star_search(self.graph, start_id, end_id, self.max_search_size)
+        else:
+            records = dijkstra_search(self.graph, start_id, end_id, max_search_size=self.max_search_size)
+        self.search_size = records.search_size
+
+        if records.closed[end_id]:
+            path_node = self.start_path_node
+            for node_id in records.get_path(start_id, end_id)[1:]:
+                fixed_path_cost = records.fixed_path_costs[node_id]
+                path_node = PathFinderNode(self.graph.get_nav_node(node_id), path_node, path_node.depth + 1,
+                                           fixed_path_cost, 0.0, fixed_path_cost)
+                self.final_path.append(path_node)
+        elif self.max_search_size is not None and records.search_size >= self.max_search_size:
+            self.reached_search_limit = True
+        self.finished = True
+        self.current_path_node = None
+
+    def get_open_path_nodes(self):
+        return []
@@ -0,0 +1,199 @@
+import heapq
+import json
+import time
+
+
+class ContractionHierarchy:
+    """
+    The nav node graph preprocessed into a contraction hierarchy, for answering lots of queries on a maze
+    that doesn't change.
+
+    Nav nodes are contracted one at a time, least important first. Contracting a node takes it out of the
+    graph and adds a shortcut edge between each pair of its remaining neighbours that has no other path
+    (a witness) as short as the one through it, so the distances between the nodes left never change. A
+    node's rank is when it was contracted. Queries then only ever need to search upwards, to higher ranked
+    nodes, from both ends; see ContractionHierarchySearch.
+
+    Shortcuts remember the node they skip over so paths can be unpacked back into real edges. to_data() and
+    from_data() (or save() and load()) turn the hierarchy into plain JSON friendly lists and back, so it can
+    be built once and shipped alongside a maze.
+    """
+    witness_search_size = 60
+
+    def __init__(self, nav_nodes, node_ranks=None, edges=None):
+        self.nav_nodes = list(nav_nodes)
+        self.node_ids = {nav_node: node_id for node_id, nav_node in enumerate(self.nav_nodes)}
+        self.node_count = len(self.nav_nodes)
+        self.preprocessing_time = 0.0
+
+        # every edge of the final graph, original or shortcut, as (from id, to id): (cost, skipped node id).
+        # The skipped node id is -1 for the original edges.
+        self.edges = {}
+        if node_ranks is None:
+            start_time = time.perf_counter()
+            for node_id, nav_node in enumerate(self.nav_nodes):
+                for neighbour, distance_to_neighbour in zip(nav_node.neighbours, nav_node.neighbour_distances):
+                    self.add_edge(node_id, self.node_ids[neighbour], distance_to_neighbour, -1)
+            self.node_ranks = self.contract_nodes()
+            self.preprocessing_time = time.perf_counter() - start_time
+        else:
+            self.node_ranks = list(node_ranks)
+            for from_id, to_id, cost, skipped_node_id in edges:
+                self.edges[(from_id, to_id)] = (cost, skipped_node_id)
+
+        # the forward search follows edges up to higher ranked nodes, the backward search follows edges coming
+        # in from higher ranked nodes
+        self.upward_edges = [[] for _ in range(self.node_count)]
+        self.downward_edges = [[] for _ in range(self.node_count)]
+        for (from_id, to_id), (cost, _) in self.edges.items():
+            if self.node_ranks[from_id] < self.node_ranks[to_id]:
+                self.upward_edges[from_id].append((self.nav_nodes[to_id], cost))
+            else:
+                self.downward_edges[to_id].append((self.nav_nodes[from_id], cost))
+
+    def add_edge(self, from_id, to_id, cost, skipped_node_id):
+        if from_id == to_id:
+            return False
+        edge = self.edges.get((from_id, to_id))
+        if edge is None or cost < edge[0]:
+            self.edges[(from_id, to_id)] = (cost, skipped_node_id)
+            return True
+        return False
+
+    def contract_nodes(self):
+        # the graph of nodes not contracted yet, as {neighbour id: cost} both ways round
+        self.out_edges = [{} for _ in range(self.node_count)]
+        self.in_edges = [{} for _ in range(self.node_count)]
+        for (from_id, to_id), (cost, _) in self.edges.items():
+            self.out_edges[from_id][to_id] = cost
+            self.in_edges[to_id][from_id] = cost
+        self.contracted_neighbour_counts = [0] * self.node_count
+
+        node_priority_heap = [(self.get_node_priority(node_id), node_id) for node_id in range(self.node_count)]
+        heapq.heapify(node_priority_heap)
+        node_ranks = [0] * self.node_count
+        next_rank = 0
+        while node_priority_heap:
+            # priorities go stale as the graph changes around a node, so check it again before contracting it
+            _, node_id = heapq.heappop(node_priority_heap)
+            node_priority = self.get_node_priority(node_id)
+            if node_priority_heap and node_priority > node_priority_heap[0][0]:
+                heapq.heappush(node_priority_heap, (node_priority, node_id))
+                continue
+
+            for from_id, to_id, cost in self.find_shortcuts(node_id):
+                if self.add_edge(from_id, to_id, cost, node_id):
+                    self.out_edges[from_id][to_id] = cost
+                    self.in_edges[to_id][from_id] = cost
+            for neighbour_id in set(self.out_edges[node_id]) | set(self.in_edges[node_id]):
+                self.in_edges[neighbour_id].pop(node_id, None)
+                self.out_edges[neighbour_id].pop(node_id, None)
+                self.contracted_neighbour_counts[neighbour_id] += 1
+            self.out_edges[node_id] = {}
+            self.in_edges[node_id] = {}
+
+            node_ranks[node_id] = next_rank
+            next_rank += 1
+
+        del self.out_edges, self.in_edges, self.contracted_neighbour_counts
+        return node_ranks
+
+    def get_node_priority(self, node_id):
+        # contract nodes that add fewer shortcuts than the edges they remove first, and spread the contraction
+        # out rather than eating away at one area
+        shortcut_count = len(self.find_shortcuts(node_id))
+        edge_count = len(self.out_edges[node_id]) + len(self.in_edges[node_id])
+        return shortcut_count - edge_count + self.contracted_neighbour_counts[node_id]
+
+    def find_shortcuts(self, node_id):
+        shortcuts = []
+        out_edges = self.out_edges[node_id]
+        for from_id, in_cost in self.in_edges[node_id].items():
+            max_cost = in_cost + max(out_edges.values(), default=0.0)
+            witness_costs = self.find_witness_costs(from_id, node_id, max_cost)
+            for to_id, out_cost in out_edges.items():
+                if to_id != from_id and witness_costs.get(to_id, float('infinity')) > in_cost + out_cost:
+                    shortcuts.append((from_id, to_id, in_cost + out_cost))
+        return shortcuts
+
+    def find_witness_costs(self, start_id, skipped_node_id, max_cost):
+        """
+        A small Dijkstra's search from start_id that doesn't go through skipped_node_id. It gives up after
+        witness_search_size nodes or past max_cost, which can only mean adding a shortcut we didn't need.
+        """
+        costs = {start_id: 0.0}
+        open_heap = [(0.0, start_id)]
+        settled_count = 0
+        while open_heap and settled_count < self.witness_search_size:
+            cost, node_id = heapq.heappop(open_heap)
+            if cost > costs[node_id]:
+                continue
+            if cost > max_cost:
+                break
+            settled_count += 1
+            for neighbour_id, edge_cost in self.out_edges[node_id].items():
+                if neighbour_id == skipped_node_id:
+                    continue
+                neighbour_cost = cost + edge_cost
+                if neighbour_cost < costs.get(neighbour_id, float('infinity')):
+                    costs[neighbour_id] = neighbour_cost
+                    heapq.heappush(open_heap, (neighbour_cost, neighbour_id))
+        return costs
+
+    def get_upward_edges(self, nav_node):
+        return self.upward_edges[self.node_ids[nav_node]]
+
+    def get_downward_edges(self, nav_node):
+        return self.downward_edges[self.node_ids[nav_node]]
+
+    def get_shortcut_count(self):
+        return sum(1 for _, skipped_node_id in self.edges.values() if skipped_node_id != -1)
+
+    def unpack_edge(self, from_nav_node, to_nav_node):
+        """
+        Returns the nav nodes along the real edges that an edge of the hierarchy stands for, not including
+        from_nav_node.
+        """
+        nav_nodes = []
+        edge_stack = [(self.node_ids[from_nav_node], self.node_ids[to_nav_node])]
+        while edge_stack:
+            from_id, to_id = edge_stack.pop()
+            skipped_node_id = self.edges[(from_id, to_id)][1]
+            if skipped_node_id == -1:
+                nav_nodes.append(self.nav_nodes[to_id])
+            else:
+                # the second half goes on the stack first so the first half comes off first
+                edge_stack.append((skipped_node_id, to_id))
+                edge_stack.append((from_id, skipped_node_id))
+        return nav_nodes
+
+    def to_data(self):
+        """
+        The hierarchy as plain lists and numbers, ready for json. The positions are kept so from_data() can
+        check it is being matched up with the same maze.
+        """
+        return {"positions": [list(nav_node.position) for nav_node in self.nav_nodes],
+                "node_ranks": self.node_ranks,
+                "edges": [[from_id, to_id, cost, skipped_node_id]
+                          for (from_id, to_id), (cost, skipped_node_id) in self.edges.items()]}
+
+    @classmethod
+    def from_data(cls, data, nav_nodes):
+        """
+        Rebuilds a hierarchy from to_data() without contracting again. nav_nodes must be the maze's nav nodes
+        in the same order as when it was built.
+        """
+        nav_nodes = list(nav_nodes)
+        positions = [tuple(position) for position in data["positions"]]
+        if positions != [tuple(nav_node.position) for nav_node in nav_nodes]:
+            raise ValueError("Contraction hierarchy data was built for a different set of nav nodes")
+        return cls(nav_nodes, data["node_ranks"], data["edges"])
+
+    def save(self, file_path):
+        with open(file_path, 'w') as hierarchy_file:
+            json.dump(self.to_data(), hierarchy_file)
+
+    @classmethod
+    def load(cls, file_path, nav_nodes):
+        with open(file_path) as hierarchy_file:
+            return cls.from_data(json.load(hierarchy_file), nav_nodes)
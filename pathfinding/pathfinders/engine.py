@@ -0,0 +1,153 @@
+from .all_pairs import AllPairsPathTable, AllPairsSearch
+from .cluster_abstraction import ClusterAbstraction
+from .compact_graph import CompactNavGraph, CompactGraphSearch
+from .contraction_hierarchy import ContractionHierarchy
+from .landmarks import LandmarkHeuristic
+from .multi_agent import MultiAgentPathPlanner
+from .search.a_star import AStarSearch
+from .search.bidirectional import BidirectionalSearch
+from .search.breadth_first import BreadthFirstSearch
+from .search.contraction_hierarchy import ContractionHierarchySearch
+from .search.d_star_lite import DStarLiteSearch
+from .search.depth_first import DepthFirstSearch
+from .search.dijkstra import DijkstraSearch
+from .search.hierarchical import HierarchicalSearch
+from .search.jump_point import JumpPointSearch
+from .search.uniform_cost import UniformCostSearch
+
+
+class SearchResult:
+    def __init__(self, path, path_cost, search_size, reached_search_limit=False):
+        self.path = path
+        self.path_cost = path_cost  # infinity if no path was found
+        self.search_size = search_size
+        # True if the search gave up at its limit before finding the end, so there may still be a path
+        self.reached_search_limit = reached_search_limit
+
+    def found_path(self):
+        return len(self.path) > 0
+
+
+class PathfindingEngine:
+    """
+    Runs the searches over a set of nav nodes with no window, drawing or frame loop involved, so they can be
+    used for batches of queries, benchmarks or anywhere else that only wants the answer.
+
+    The finders in 'algorithms' wrap the same searches to step through them on screen. Unlike those, the
+    searches here aren't limited in how many nodes they expand unless max_search_size is given, in which case
+    any that can be limited give up after that many. "A* (Compact)" and "Dijkstra's (Compact)" run over the nav
+    nodes packed into a CompactNavGraph, built the first time one of them is asked for.
+
+    Given an all_pairs_memory_limit in bytes, small enough maps also get an "All Pairs" algorithm that answers
+    every query from an AllPairsPathTable. The table is only built if estimate_memory_size() says it fits in
+    the limit, and not until the first query that asks for it.
+    """
+    def __init__(self, nav_nodes, maze_grid=None, contraction_hierarchy=None, max_search_size=None,
+                 all_pairs_memory_limit=None):
+        self.nav_nodes = list(nav_nodes)
+        self.max_search_size = max_search_size
+        self.maze_grid = maze_grid
+        self.all_pairs_path_table = None
+        self.compact_graph = None
+        self.cluster_abstraction = None
+        self.landmark_heuristic = None
+        self.multi_agent_path_planner = None
+        # pass in one loaded from disk to skip contracting the graph again
+        self.contraction_hierarchy = contraction_hierarchy
+
+        # the tree searches don't revisit nav nodes, same as in the app
+        self.search_factories = {"A*": lambda start, end: AStarSearch(start, end, self.max_search_size),
+                                 "A* (Landmarks)": lambda start, end: AStarSearch(
+                                     start, end, self.max_search_size, self.get_landmark_heuristic()),
+                                 "Breadth First": lambda start, end: BreadthFirstSearch(start, end, False),
+                                 "Depth First": lambda start, end: DepthFirstSearch(start, end, False),
+                                 "Uniform Cost": lambda start, end: UniformCostSearch(start, end, False),
+                                 "Dijkstra's": lambda start, end: DijkstraSearch(start, end, self.nav_nodes),
+                                 "Bidirectional A*": lambda start, end: BidirectionalSearch(
+                                     start, end, self.nav_nodes, True, self.max_search_size),
+                                 "Bidirectional Dijkstra": lambda start, end: BidirectionalSearch(
+                                     start, end, self.nav_nodes, False, self.max_search_size),
+                                 "Contraction Hierarchy": lambda start, end: ContractionHierarchySearch(
+                                     start, end, self.get_contraction_hierarchy()),
+                                 "D* Lite": lambda start, end: DStarLiteSearch(start, end, self.nav_nodes),
+                                 "A* (Compact)": lambda start, end: CompactGraphSearch(
+                                     start, end, self.get_compact_graph(), True, self.max_search_size),
+                                 "Dijkstra's (Compact)": lambda start, end: CompactGraphSearch(
+                                     start, end, self.get_compact_graph(), False, self.max_search_size)}
+        # jump point and hierarchical search work on the maze grid squares, so they're only there if we were
+        # given the grid
+        if maze_grid is not None:
+            self.search_factories["Jump Point"] = lambda start, end: JumpPointSearch(start, end, self.maze_grid,
+                                                                                     self.max_search_size)
+            self.search_factories["Hierarchical"] = lambda start, end: HierarchicalSearch(
+                start, end, self.get_cluster_abstraction(), self.max_search_size)
+        if (all_pairs_memory_limit is not None and
+                AllPairsPathTable.estimate_memory_size(len(self.nav_nodes)) <= all_pairs_memory_limit):
+            self.search_factories["All Pairs"] = lambda start, end: AllPairsSearch(
+                start, end, self.get_all_pairs_path_table())
+
+    def get_cluster_abstraction(self):
+        # built the first time a hierarchical search asks for it, then shared by every query after
+        if self.cluster_abstraction is None:
+            self.cluster_abstraction = ClusterAbstraction(self.maze_grid)
+        return self.cluster_abstraction
+
+    def get_all_pairs_path_table(self):
+        if self.all_pairs_path_table is None:
+            self.all_pairs_path_table = AllPairsPathTable(self.nav_nodes)
+        return self.all_pairs_path_table
+
+    def get_compact_graph(self):
+        # the nav nodes packed into flat arrays, for the compact searches
+        if self.compact_graph is None:
+            self.compact_graph = CompactNavGraph.from_nav_nodes(self.nav_nodes)
+        return self.compact_graph
+
+    def get_landmark_heuristic(self):
+        if self.landmark_heuristic is None:
+            self.landmark_heuristic = LandmarkHeuristic(self.nav_nodes)
+        return self.landmark_heuristic
+
+    def get_contraction_hierarchy(self):
+        if self.contraction_hierarchy is None:
+            self.contraction_hierarchy = ContractionHierarchy(self.nav_nodes)
+        return self.contraction_hierarchy
+
+    def get_algorithm_names(self):
+        return list(self.search_factories.keys())
+
+    def create_search(self, start_nav_node, end_nav_node, algorithm="A*"):
+        return self.search_factories[algorithm](start_nav_node, end_nav_node)
+
+    def solve(self, start_nav_node, end_nav_node, algorithm="A*"):
+        return self.run_search(self.create_search(start_nav_node, end_nav_node, algorithm))
+
+    def run_search(self, search):
+        """
+        Runs a search from create_search() to the end and returns its SearchResult. A "D* Lite" search can be
+        run again after move_start(), add_edge(), remove_edge() or set_edge_cost() to get the repaired path,
+        which only searches the part of the graph the change affects.
+        """
+        search.run_to_completion()
+
+        path_cost = float('infinity')
+        if search.final_path:
+            path_cost = search.final_path[-1].fixed_path_cost
+        elif search.start_path_node.nav_node == search.end_nav_node:
+            path_cost = 0.0
+        return SearchResult(search.final_path, path_cost, search.search_size, search.reached_search_limit)
+
+    def solve_all(self, queries, algorithm="A*"):
+        """
+        Solves a list of (start nav node, end nav node) pairs in order and returns a SearchResult for each.
+        """
+        return [self.solve(start_nav_node, end_nav_node, algorithm) for start_nav_node, end_nav_node in queries]
+
+    def solve_agents(self, path_requests):
+        """
+        Solves a list of (start nav node, end nav node) pairs, one per agent, sharing one search per end nav
+        node between every agent heading there. Returns MultiAgentPathResults.
+        """
+        if self.multi_agent_path_planner is None:
+            self.multi_agent_path_planner = MultiAgentPathPlanner(self.nav_nodes)
+        return self.multi_agent_path_planner.find_paths(path_requests)
@@ -0,0 +1,106 @@
+import random
+import time
+
+from .nav_node import NavNode
+from .search.dijkstra import DijkstraSearch
+
+
+class LandmarkHeuristic:
+    """
+    The ALT (A*, landmarks and the triangle inequality) heuristic. For a few landmark nav nodes we store the
+    exact path cost from each landmark to every nav node, and from every nav node back to it. No path from a
+    node to the end can then be shorter than how much further the end is from a landmark than the node is, or
+    than how much further the node is from getting to a landmark than the end is. The biggest of these over
+    all the landmarks is our estimate, and in a maze it is a lot closer to the real cost than the straight line.
+
+    Landmarks can be given as a list of nav nodes, or picked with landmark_selection:
+     - 'farthest' picks each new landmark as far as it can get from the ones already picked, which spreads them
+       out round the edges of the maze, where they work best.
+     - 'random' picks them at random, seeded by random_seed.
+    """
+    def __init__(self, nav_nodes, landmark_count=8, landmarks=None, landmark_selection='farthest',
+                 random_seed=None):
+        start_time = time.perf_counter()
+        self.nav_nodes = list(nav_nodes)
+
+        # the costs back to a landmark come from searching outwards from it over the edges turned round
+        self.reversed_nav_nodes = {nav_node: NavNode(nav_node.position) for nav_node in self.nav_nodes}
+        for nav_node in self.nav_nodes:
+            for neighbour in nav_node.neighbours:
+                self.reversed_nav_nodes[neighbour].add_neighbour(self.reversed_nav_nodes[nav_node])
+
+        self.landmarks = []
+        # per nav node, a list with an entry for each landmark
+        self.costs_from_landmarks = {nav_node: [] for nav_node in self.nav_nodes}
+        self.costs_to_landmarks = {nav_node: [] for nav_node in self.nav_nodes}
+
+        if landmarks is not None:
+            for landmark in landmarks:
+                self.add_landmark(landmark)
+        elif landmark_selection == 'random':
+            landmark_random = random.Random(random_seed)
+            for landmark in landmark_random.sample(self.nav_nodes, min(landmark_count, len(self.nav_nodes))):
+                self.add_landmark(landmark)
+        elif landmark_selection == 'farthest':
+            self.add_farthest_landmarks(landmark_count)
+        else:
+            raise ValueError("Unknown landmark selection: " + str(landmark_selection))
+
+        self.preprocessing_time = time.perf_counter() - start_time
+
+    def get_path_costs_from(self, start_nav_node, nav_nodes):
+        search = DijkstraSearch(start_nav_node, None, nav_nodes, single_source=True)
+        search.run_to_completion()
+        return {path_node.nav_node: path_node.fixed_path_cost for path_node in search.closed_node_list}
+
+    def add_landmark(self, landmark):
+        self.landmarks.append(landmark)
+        costs_from_landmark = self.get_path_costs_from(landmark, self.nav_nodes)
+        reversed_costs = self.get_path_costs_from(self.reversed_nav_nodes[landmark],
+                                                  list(self.reversed_nav_nodes.values()))
+        for nav_node in self.nav_nodes:
+            self.costs_from_landmarks[nav_node].append(costs_from_landmark.get(nav_node, float('infinity')))
+            self.costs_to_landmarks[nav_node].append(reversed_costs.get(self.reversed_nav_nodes[nav_node],
+                                                                        float('infinity')))
+
+    def add_farthest_landmarks(self, landmark_count):
+        # start from the node farthest from the first one, then keep adding whichever node is farthest from
+        # its nearest landmark. Nodes a landmark can't reach at all are skipped.
+        if not self.nav_nodes or landmark_count <= 0:
+            return
+        costs = self.get_path_costs_from(self.nav_nodes[0], self.nav_nodes)
+        nearest_landmark_costs = {nav_node: float('infinity') for nav_node in costs}
+        next_landmark = max(costs, key=costs.get)
+        while len(self.landmarks) < landmark_count and next_landmark is not None:
+            self.add_landmark(next_landmark)
+            landmark_index = len(self.landmarks) - 1
+            next_landmark = None
+            farthest_cost = 0.0
+            for nav_node in nearest_landmark_costs:
+                nearest_landmark_costs[nav_node] = min(nearest_landmark_costs[nav_node],
+                                                       self.costs_from_landmarks[nav_node][landmark_index])
+                if farthest_cost < nearest_landmark_costs[nav_node] < float('infinity'):
+                    farthest_cost = nearest_landmark_costs[nav_node]
+                    next_landmark = nav_node
+
+    def get_distance_to_end(self, nav_node, end_nav_node):
+        costs_from_landmarks = self.costs_from_landmarks.get(nav_node)
+        end_costs_from_landmarks = self.costs_from_landmarks.get(end_nav_node)
+        if costs_from_landmarks is None or end_costs_from_landmarks is None:
+            return 0.0
+
+        lower_bound = 0.0
+        infinity = float('infinity')
+        for cost_from_landmark, end_cost_from_landmark, cost_to_landmark, end_cost_to_landmark in zip(
+                costs_from_landmarks, end_costs_from_landmarks,
+                self.costs_to_landmarks[nav_node], self.costs_to_landmarks[end_nav_node]):
+            # a landmark that can't reach, or be reached from, either node tells us nothing
+            if cost_from_landmark != infinity and end_cost_from_landmark != infinity:
+                lower_bound = max(lower_bound, end_cost_from_landmark - cost_from_landmark)
+            if cost_to_landmark != infinity and end_cost_to_landmark != infinity:
+                lower_bound = max(lower_bound, cost_to_landmark - end_cost_to_landmark)
+        return lower_bound
+
+    def get_stored_cost_count(self):
+        # two per landmark per nav node
+        return 2 * len(self.landmarks) * len(self.nav_nodes)
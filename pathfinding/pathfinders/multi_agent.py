@@ -0,0 +1,76 @@
+import time
+
+from .path_cache import ShortestPathTreeCache
+
+
+class AgentPathResult:
+    def __init__(self, start_nav_node, end_nav_node, path, path_cost):
+        self.start_nav_node = start_nav_node
+        self.end_nav_node = end_nav_node
+        self.path = path  # PathFinderNodes like a finder's final_path, empty if there is no path
+        self.path_cost = path_cost
+
+    def found_path(self):
+        return len(self.path) > 0
+
+
+class MultiAgentPathResults:
+    def __init__(self, agent_paths, goal_count, new_search_count, search_size, solve_time):
+        self.agent_paths = agent_paths  # an AgentPathResult per request, in the same order
+        self.goal_count = goal_count
+        self.new_search_count = new_search_count  # goals we had to search from, the rest were already cached
+        self.search_size = search_size  # nodes expanded by those searches
+        self.solve_time = solve_time
+
+    def get_found_path_count(self):
+        return sum(1 for agent_path in self.agent_paths if agent_path.found_path())
+
+    def get_total_path_cost(self):
+        return sum(agent_path.path_cost for agent_path in self.agent_paths if agent_path.found_path())
+
+
+class MultiAgentPathPlanner:
+    """
+    Finds paths for lots of agents at once by grouping their requests by goal. Each goal gets one search
+    outwards from it, a ShortestPathTreeCache, and every agent heading there reads its path off that, so N
+    agents going to the same place cost one search rather than N.
+
+    The trees are kept between calls, so later requests to a goal already seen need no searching at all.
+    Call clear() if the nav node graph changes.
+    """
+    def __init__(self, nav_nodes):
+        self.nav_nodes = list(nav_nodes)
+        self.path_tree_caches = {}
+
+    def clear(self):
+        self.path_tree_caches = {}
+
+    def find_paths(self, path_requests):
+        """
+        Takes a list of (start nav node, end nav node) pairs, one per agent, and returns MultiAgentPathResults
+        with a path for every agent and totals for the whole call.
+        """
+        start_time = time.perf_counter()
+        goal_requests = {}
+        for request_index, (start_nav_node, end_nav_node) in enumerate(path_requests):
+            goal_requests.setdefault(end_nav_node, []).append(request_index)
+
+        agent_paths = [None] * len(path_requests)
+        new_search_count = 0
+        search_size = 0
+        for end_nav_node, request_indices in goal_requests.items():
+            path_tree_cache = self.path_tree_caches.get(end_nav_node)
+            if path_tree_cache is None:
+                path_tree_cache = ShortestPathTreeCache(self.nav_nodes, end_nav_node)
+                self.path_tree_caches[end_nav_node] = path_tree_cache
+                new_search_count += 1
+                search_size += path_tree_cache.search_size
+
+            for request_index in request_indices:
+                start_nav_node = path_requests[request_index][0]
+                agent_paths[request_index] = AgentPathResult(start_nav_node, end_nav_node,
+                                                             path_tree_cache.get_path(start_nav_node),
+                                                             path_tree_cache.get_path_cost(start_nav_node))
+
+        return MultiAgentPathResults(agent_paths, len(goal_requests), new_search_count, search_size,
+                                     time.perf_counter() - start_time)
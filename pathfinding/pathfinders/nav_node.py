@@ -1,14 +1,21 @@
-import pygame
+import math
 
 
 class NavNode:
+    __slots__ = ('position', 'neighbours', 'neighbour_distances')
+
     def __init__(self, position):
         self.position = position
         self.neighbours = []
+        # the length of the edge to each neighbour, in the same order as the neighbours list. Worked out once
+        # here so the finders don't have to redo it every time they expand this node.
+        self.neighbour_distances = []
 
     def add_neighbour(self, neighbour):
-
+        x_diff = self.position[0] - neighbour.position[0]
+        y_diff = self.position[1] - neighbour.position[1]
         self.neighbours.append(neighbour)
+        self.neighbour_distances.append(math.sqrt(x_diff ** 2 + y_diff ** 2))
 
     def __str__(self):
         return "[" + str(self.position[0]) + ", " + str(self.position[1]) + "]"
@@ -16,21 +23,37 @@ class NavNode:
     __repr__ = __str__
 
 
-class NavigationNode:
+class NavNodeIndex:
     """
-    Better Navigation node than the one above.
+    Hash-indexed membership for the nav nodes held in a finder's open or closed list, keyed on nav node
+    identity so checking a neighbour costs the same however large the search has grown. A count is kept
+    per nav node because finders that allow revisiting can hold several path nodes for the same nav node.
     """
-    def __init__(self, position: pygame.math.Vector2):
-        self.position = position
-        self.neighbour_connections = []
+    def __init__(self):
+        self.nav_node_counts = {}
+
+    def add(self, nav_node):
+        self.nav_node_counts[nav_node] = self.nav_node_counts.get(nav_node, 0) + 1
 
-    def add_connection(self, node):
-        distance = self.position.distance_to(node.position)
-        connection_edge = {'node': node, 'distance': distance}
-        self.neighbour_connections.append(connection_edge)
+    def remove(self, nav_node):
+        count = self.nav_node_counts[nav_node]
+        if count > 1:
+            self.nav_node_counts[nav_node] = count - 1
+        else:
+            del self.nav_node_counts[nav_node]
+
+    def __contains__(self, nav_node):
+        return nav_node in self.nav_node_counts
+
+    def __len__(self):
+        return len(self.nav_node_counts)
 
 
 class PathFinderNode:
+    # a new one of these is made every time a node is added to an open list, so keep them small
+    __slots__ = ('nav_node', 'parent_path_node', 'depth', 'fixed_path_cost', 'distance_to_end',
+                 'total_path_cost_estimate')
+
     def __init__(self, nav_node, parent_path_node, depth,
                  fixed_path_cost=0.0, straight_line_distance_to_end=0.0,
                  total_path_cost_estimate=0.0):
@@ -42,9 +65,6 @@ class PathFinderNode:
         self.distance_to_end = straight_line_distance_to_end
         self.total_path_cost_estimate = total_path_cost_estimate
 
-    def __lt__(self, other):
-        return self
-
     def __str__(self):
         return str(self.nav_node)
 
@@ -0,0 +1,64 @@
+from .nav_node import NavNode, PathFinderNode
+from .search.dijkstra import DijkstraSearch
+
+
+class ShortestPathTreeCache:
+    """
+    Shortest path tree rooted at a fixed end node, for when every query heads to the same place (like the
+    maze exit).
+
+    We build it once per maze by running single source Dijkstra outwards from the end node over a reversed
+    copy of the nav node graph. Each settled node's parent is then its next hop towards the end node, so a
+    query from any start node is answered by walking next hops in O(path length) with no further searching.
+    Throw the cache away and build a new one whenever the nav node graph changes.
+    """
+    def __init__(self, nav_nodes, end_nav_node):
+        self.end_nav_node = end_nav_node
+        self.next_hops = {}
+        self.path_costs = {}
+
+        reversed_nav_nodes = {nav_node: NavNode(nav_node.position) for nav_node in nav_nodes}
+        original_nav_nodes = {reversed_nav_node: nav_node
+                              for nav_node, reversed_nav_node in reversed_nav_nodes.items()}
+        for nav_node in nav_nodes:
+            for neighbour in nav_node.neighbours:
+                reversed_nav_nodes[neighbour].add_neighbour(reversed_nav_nodes[nav_node])
+
+        tree_search = DijkstraSearch(reversed_nav_nodes[end_nav_node], None,
+                                     list(reversed_nav_nodes.values()), single_source=True)
+        tree_search.run_to_completion()
+        self.search_size = tree_search.search_size
+
+        for path_node in tree_search.closed_node_list:
+            nav_node = original_nav_nodes[path_node.nav_node]
+            if path_node.parent_path_node is not None:
+                self.next_hops[nav_node] = original_nav_nodes[path_node.parent_path_node.nav_node]
+            else:
+                self.next_hops[nav_node] = None
+            self.path_costs[nav_node] = path_node.fixed_path_cost
+
+    def has_path(self, start_nav_node):
+        return start_nav_node in self.next_hops
+
+    def get_path_cost(self, start_nav_node):
+        return self.path_costs.get(start_nav_node, float('infinity'))
+
+    def get_path(self, start_nav_node):
+        """
+        Walks the next hops from the start node to the end node. The path comes back as PathFinderNodes in
+        the same form as a finder's final_path (so without the start node), or empty if there isn't one.
+        """
+        final_path = []
+        if start_nav_node not in self.next_hops:
+            return final_path
+
+        start_path_cost = self.path_costs[start_nav_node]
+        path_node = PathFinderNode(start_nav_node, None, 0)
+        next_hop = self.next_hops[start_nav_node]
+        while next_hop is not None:
+            fixed_path_cost = start_path_cost - self.path_costs[next_hop]
+            path_node = PathFinderNode(next_hop, path_node, path_node.depth + 1,
+                                       fixed_path_cost, 0.0, fixed_path_cost)
+            final_path.append(path_node)
+            next_hop = self.next_hops[next_hop]
+        return final_path
@@ -0,0 +1,84 @@
+import math
+
+from ..nav_node import PathFinderNode
+from .base_search import BestFirstSearch
+from .events import NODE_OPENED, NODE_COST_UPDATED
+
+
+class AStarSearch(BestFirstSearch):
+    def __init__(self, start_nav_node, end_nav_node, max_path_search_size=2000, landmark_heuristic=None):
+        super().__init__("A*" if landmark_heuristic is None else "A* (Landmarks)")
+        self.end_nav_node = end_nav_node
+        # with a LandmarkHeuristic we use whichever of it and the straight line is the closer estimate
+        self.landmark_heuristic = landmark_heuristic
+
+        distance_to_end_node = self.get_distance_to_end(start_nav_node)
+        self.start_path_node = PathFinderNode(start_nav_node, None, 0, 0, distance_to_end_node,
+                                              distance_to_end_node)
+        self.max_search_size = max_path_search_size  # None to search until the end is found or ruled out
+        self.current_path_node = self.start_path_node
+
+        self.node_progress = []
+
+        self.add_current_path_node_neighbours_to_open_list()
+
+    def get_distance_to_end(self, nav_node):
+        x_diff = nav_node.position[0] - self.end_nav_node.position[0]
+        y_diff = nav_node.position[1] - self.end_nav_node.position[1]
+        straight_line_distance_to_end_node = math.sqrt(x_diff ** 2 + y_diff ** 2)
+        if self.landmark_heuristic is None:
+            return straight_line_distance_to_end_node
+        return max(straight_line_distance_to_end_node,
+                   self.landmark_heuristic.get_distance_to_end(nav_node, self.end_nav_node))
+
+    def is_search_complete(self):
+        if self.finished or self.current_path_node is None:
+            return True
+        reached_end_of_path = self.current_path_node.nav_node == self.end_nav_node
+        return (reached_end_of_path or
+                (self.max_search_size is not None and self.search_size >= self.max_search_size))
+
+    def update(self):
+        if not self.is_search_complete():
+            self.current_path_node = self.pop_lowest_cost_open_node()
+            if self.current_path_node is not None:
+                self.node_progress.append([self.current_path_node,
+                                           self.current_path_node.total_path_cost_estimate])
+                self.add_current_path_node_neighbours_to_open_list()
+
+            self.search_size += 1
+
+        elif not self.finished:
+            self.finished = True
+            # unwind our successful path
+            if self.current_path_node is not None and self.current_path_node.nav_node == self.end_nav_node:
+                self.final_path = self.unwind_path(self.current_path_node)
+            elif self.max_search_size is not None and self.search_size >= self.max_search_size:
+                self.reached_search_limit = True
+            self.current_path_node = None
+
+    def add_current_path_node_neighbours_to_open_list(self):
+        # add current Node neighbours to open list (if not in closed list), or replace the open entry for
+        # a neighbour if we have just found a cheaper route to it
+        current_nav_node = self.current_path_node.nav_node
+        for neighbour, distance_to_neighbour in zip(current_nav_node.neighbours,
+                                                    current_nav_node.neighbour_distances):
+            if not self.is_nav_node_in_closed_list(neighbour):
+                fixed_path_cost = self.current_path_node.fixed_path_cost + distance_to_neighbour
+                open_path_node = self.open_path_nodes.get(neighbour)
+                if open_path_node is None or fixed_path_cost < open_path_node.fixed_path_cost:
+                    # the distance to the end only needs working out the first time we see a nav node
+                    if open_path_node is None:
+                        distance_to_end_node = self.get_distance_to_end(neighbour)
+                    else:
+                        distance_to_end_node = open_path_node.distance_to_end
+                    total_path_cost_estimate = fixed_path_cost + distance_to_end_node
+                    self.push_open_node(PathFinderNode(neighbour, self.current_path_node,
+                                                       self.current_path_node.depth + 1,
+                                                       fixed_path_cost, distance_to_end_node,
+                                                       total_path_cost_estimate))
+                    self.record_event(NODE_OPENED if open_path_node is None else NODE_COST_UPDATED,
+                                      self.open_path_nodes[neighbour])
+
+        # closed nodes are the ones we have already evaluated by adding their neighbours to the open list
+        self.add_path_node_to_closed_list(self.current_path_node)
@@ -0,0 +1,179 @@
+import heapq
+import time
+
+from ..nav_node import NavNode, NavNodeIndex
+from .events import search_events, NODE_CLOSED
+
+
+class BaseSearch:
+    """
+    What every search shares. A search sets up its start_path_node and current_path_node, then does its work
+    a node at a time in update(), counting expansions in search_size and setting finished once it is done.
+    Stepping, running to the end and streaming events are all built on those.
+    """
+    def __init__(self, name):
+        self.name = name
+        self.final_path = []
+        self.closed_node_list = []
+        self.closed_nav_nodes = NavNodeIndex()
+        # called with (event type, path node) for every change to the open and closed lists, see events.py
+        self.event_listeners = []
+
+        self.search_size = 0
+        # set when a search with a limit on its size gives up before finding the end
+        self.reached_search_limit = False
+        self.finished = False
+
+    def is_search_complete(self):
+        raise NotImplementedError
+
+    def update(self):
+        raise NotImplementedError
+
+    def get_open_path_nodes(self):
+        raise NotImplementedError
+
+    def step(self, max_expansions=None, max_seconds=None):
+        """
+        Runs updates until the search finishes, or until max_expansions nodes have been expanded or
+        max_seconds have passed, whichever comes first. Returns how many nodes were expanded.
+        """
+        start_search_size = self.search_size
+        start_time = time.perf_counter()
+        while not self.finished:
+            self.update()
+            if max_expansions is not None and self.search_size - start_search_size >= max_expansions:
+                break
+            if max_seconds is not None and time.perf_counter() - start_time >= max_seconds:
+                break
+        return self.search_size - start_search_size
+
+    def run_to_completion(self):
+        while not self.finished:
+            self.update()
+        return self.final_path
+
+    def add_event_listener(self, listener):
+        self.event_listeners.append(listener)
+
+    def remove_event_listener(self, listener):
+        self.event_listeners.remove(listener)
+
+    def record_event(self, event_type, path_node):
+        for listener in self.event_listeners:
+            listener(event_type, path_node)
+
+    def iter_events(self):
+        return search_events(self)
+
+    def add_path_node_to_closed_list(self, path_node):
+        self.closed_node_list.append(path_node)
+        self.closed_nav_nodes.add(path_node.nav_node)
+        self.record_event(NODE_CLOSED, path_node)
+
+    def is_nav_node_in_closed_list(self, nav_node):
+        return nav_node in self.closed_nav_nodes
+
+    @staticmethod
+    def unwind_path(end_path_node):
+        # the path nodes from the one after the start up to end_path_node, following parents back from the end
+        final_path = []
+        path_node = end_path_node
+        while path_node is not None and path_node.parent_path_node is not None:
+            final_path.append(path_node)
+            path_node = path_node.parent_path_node
+        final_path.reverse()
+        return final_path
+
+
+class OpenNodeHeap:
+    """
+    An open list kept as a binary heap of (total path cost estimate, insertion order, path node) entries, with
+    the live path node for each open nav node kept alongside in open_path_nodes. When a cheaper route to an
+    open nav node turns up the new path node is pushed and the old entry is left behind, to be skipped when it
+    reaches the top of the heap. The insertion order breaks cost ties so path nodes are never compared.
+    """
+    def __init__(self):
+        self.open_node_heap = []
+        self.open_path_nodes = {}
+        self.open_node_insertion_count = 0
+
+    def push_open_node(self, path_node):
+        self.open_path_nodes[path_node.nav_node] = path_node
+        heapq.heappush(self.open_node_heap, (path_node.total_path_cost_estimate,
+                                             self.open_node_insertion_count, path_node))
+        self.open_node_insertion_count += 1
+
+    def peek_lowest_cost_open_node(self):
+        while self.open_node_heap:
+            path_node = self.open_node_heap[0][2]
+            if self.open_path_nodes.get(path_node.nav_node) is path_node:
+                return path_node
+            heapq.heappop(self.open_node_heap)
+        return None
+
+    def pop_lowest_cost_open_node(self):
+        while self.open_node_heap:
+            path_node = heapq.heappop(self.open_node_heap)[2]
+            if self.open_path_nodes.get(path_node.nav_node) is path_node:
+                del self.open_path_nodes[path_node.nav_node]
+                return path_node
+        return None
+
+
+class BestFirstSearch(OpenNodeHeap, BaseSearch):
+    """
+    A search that always expands its cheapest open node next, by total path cost estimate, and never opens a
+    nav node again once it is closed.
+    """
+    def __init__(self, name):
+        BaseSearch.__init__(self, name)
+        OpenNodeHeap.__init__(self)
+
+    def get_open_path_nodes(self):
+        return list(self.open_path_nodes.values())
+
+    def is_nav_node_in_open_list(self, nav_node):
+        return nav_node in self.open_path_nodes
+
+
+class GridSearch(BestFirstSearch):
+    """
+    A best first search over the maze grid squares rather than the junction graph. Grid squares that aren't the
+    start or end get their own nav nodes, made as the search reaches them, so the path nodes look the same as
+    the other searches' to anything drawing them.
+    """
+    def __init__(self, name, start_nav_node, end_nav_node, maze_grid):
+        super().__init__(name)
+        self.end_nav_node = end_nav_node
+        self.maze_grid = maze_grid
+
+        self.grid_nav_nodes = {}
+        self.grid_positions = {}
+        self.end_grid_position = self.add_grid_nav_node(end_nav_node)
+        self.start_grid_position = self.add_grid_nav_node(start_nav_node)
+
+    def add_grid_nav_node(self, nav_node):
+        grid_position = self.maze_grid.get_grid_position(nav_node.position)
+        self.grid_nav_nodes[grid_position] = nav_node
+        self.grid_positions[nav_node] = grid_position
+        return grid_position
+
+    def get_grid_nav_node(self, grid_position):
+        nav_node = self.grid_nav_nodes.get(grid_position)
+        if nav_node is None:
+            nav_node = NavNode(self.maze_grid.get_screen_position(grid_position[0], grid_position[1]))
+            self.grid_nav_nodes[grid_position] = nav_node
+            self.grid_positions[nav_node] = grid_position
+        return nav_node
+
+    def get_distance_to_end(self, nav_node):
+        # with four way movement the manhattan distance never overestimates, and it is a closer guess than
+        # the straight line
+        return (abs(nav_node.position[0] - self.end_nav_node.position[0]) +
+                abs(nav_node.position[1] - self.end_nav_node.position[1]))
+
+    def get_grid_step_cost(self, from_grid_position, to_grid_position):
+        # the cost of a straight run between two squares in the same row or column
+        return (abs(to_grid_position[0] - from_grid_position[0]) +
+                abs(to_grid_position[1] - from_grid_position[1])) * float(self.maze_grid.square_size)
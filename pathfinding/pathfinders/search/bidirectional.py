@@ -0,0 +1,170 @@
+import math
+
+from ..nav_node import PathFinderNode
+from .base_search import BaseSearch, OpenNodeHeap
+from .events import NODE_OPENED, NODE_COST_UPDATED
+
+
+class SearchFrontier(OpenNodeHeap):
+    """
+    One side of a bidirectional search: its own open heap, the best path node found so far for each nav node it
+    has reached and the nav nodes it has closed. The backward side walks the edges in reverse, so it is given
+    a function for looking up a nav node's (neighbour, distance) pairs rather than using nav_node.neighbours.
+    """
+    def __init__(self, start_nav_node, target_nav_node, get_edges, use_heuristic):
+        super().__init__()
+        self.target_nav_node = target_nav_node
+        self.get_edges = get_edges
+        self.use_heuristic = use_heuristic
+
+        distance_to_target = self.get_distance_to_target(start_nav_node)
+        self.start_path_node = PathFinderNode(start_nav_node, None, 0, 0, distance_to_target, distance_to_target)
+
+        self.closed_path_nodes = {}
+        self.search_size = 0
+        self.push_open_node(self.start_path_node)
+
+    def get_distance_to_target(self, nav_node):
+        if not self.use_heuristic:
+            return 0.0
+        x_diff = nav_node.position[0] - self.target_nav_node.position[0]
+        y_diff = nav_node.position[1] - self.target_nav_node.position[1]
+        return math.sqrt(x_diff ** 2 + y_diff ** 2)
+
+    def get_best_path_node(self, nav_node):
+        path_node = self.closed_path_nodes.get(nav_node)
+        if path_node is None:
+            path_node = self.open_path_nodes.get(nav_node)
+        return path_node
+
+
+class BidirectionalSearch(BaseSearch):
+    """
+    Grows one search out from the start and another backwards from the end, always expanding whichever side
+    has the smaller open list, until the two can prove they have met on the shortest path.
+
+    Every time either side finds a cheaper route to a nav node the other side has already reached, the two
+    halves make a candidate path, and we keep the cheapest. Without a heuristic (bidirectional Dijkstra's)
+    we can stop once the cheapest open node on each side add up to at least that path's cost, as nothing left
+    could join up any cheaper. With the straight line heuristic (bidirectional A*) we stop once the lowest
+    total cost estimate on either side reaches it.
+    """
+    def __init__(self, start_nav_node, end_nav_node, nav_nodes, use_heuristic=True, max_path_search_size=None):
+        super().__init__("Bidirectional A*" if use_heuristic else "Bidirectional Dijkstra")
+        self.end_nav_node = end_nav_node
+        self.use_heuristic = use_heuristic
+        self.max_search_size = max_path_search_size
+
+        # the backward side needs the edges coming into each nav node
+        self.incoming_edges = {nav_node: [] for nav_node in nav_nodes}
+        for nav_node in nav_nodes:
+            for neighbour, distance_to_neighbour in zip(nav_node.neighbours, nav_node.neighbour_distances):
+                self.incoming_edges[neighbour].append((nav_node, distance_to_neighbour))
+
+        self.forward = SearchFrontier(start_nav_node, end_nav_node, self.get_outgoing_edges, use_heuristic)
+        self.backward = SearchFrontier(end_nav_node, start_nav_node, self.get_incoming_edges, use_heuristic)
+        self.start_path_node = self.forward.start_path_node
+
+        # the cheapest place found so far where the two sides join, as the path node each side has there
+        self.best_path_cost = float('infinity')
+        self.best_meeting_path_nodes = None
+        if start_nav_node == end_nav_node:
+            self.best_path_cost = 0.0
+
+        self.current_path_node = self.start_path_node
+
+    def get_outgoing_edges(self, nav_node):
+        return zip(nav_node.neighbours, nav_node.neighbour_distances)
+
+    def get_incoming_edges(self, nav_node):
+        return self.incoming_edges.get(nav_node, ())
+
+    def has_proven_shortest_path(self):
+        lowest_forward_node = self.forward.peek_lowest_cost_open_node()
+        lowest_backward_node = self.backward.peek_lowest_cost_open_node()
+        if lowest_forward_node is None or lowest_backward_node is None:
+            # one side has run out of nodes, so it has already met everything the other side could reach
+            return True
+        if self.use_heuristic:
+            return max(lowest_forward_node.total_path_cost_estimate,
+                       lowest_backward_node.total_path_cost_estimate) >= self.best_path_cost
+        return lowest_forward_node.fixed_path_cost + lowest_backward_node.fixed_path_cost >= self.best_path_cost
+
+    def is_search_complete(self):
+        if self.finished:
+            return True
+        if self.has_proven_shortest_path():
+            return True
+        return self.max_search_size is not None and self.search_size >= self.max_search_size
+
+    def update(self):
+        if not self.is_search_complete():
+            if len(self.forward.open_path_nodes) <= len(self.backward.open_path_nodes):
+                self.expand_lowest_cost_node(self.forward, self.backward)
+            else:
+                self.expand_lowest_cost_node(self.backward, self.forward)
+            self.search_size += 1
+
+        elif not self.finished:
+            self.finished = True
+            self.current_path_node = None
+            if not self.has_proven_shortest_path():
+                self.reached_search_limit = True
+            elif self.best_meeting_path_nodes is not None:
+                self.final_path = self.join_path(*self.best_meeting_path_nodes)
+
+    def get_open_path_nodes(self):
+        return list(self.forward.open_path_nodes.values()) + list(self.backward.open_path_nodes.values())
+
+    def is_backward_path_node(self, path_node):
+        return self.backward.get_best_path_node(path_node.nav_node) is path_node
+
+    def expand_lowest_cost_node(self, frontier, other_frontier):
+        path_node = frontier.pop_lowest_cost_open_node()
+        frontier.closed_path_nodes[path_node.nav_node] = path_node
+        frontier.search_size += 1
+        self.current_path_node = path_node
+
+        for neighbour, distance_to_neighbour in frontier.get_edges(path_node.nav_node):
+            if neighbour in frontier.closed_path_nodes:
+                continue
+            fixed_path_cost = path_node.fixed_path_cost + distance_to_neighbour
+            open_path_node = frontier.open_path_nodes.get(neighbour)
+            if open_path_node is None or fixed_path_cost < open_path_node.fixed_path_cost:
+                if open_path_node is None:
+                    distance_to_target = frontier.get_distance_to_target(neighbour)
+                else:
+                    distance_to_target = open_path_node.distance_to_end
+                neighbour_path_node = PathFinderNode(neighbour, path_node, path_node.depth + 1, fixed_path_cost,
+                                                     distance_to_target, fixed_path_cost + distance_to_target)
+                frontier.push_open_node(neighbour_path_node)
+                self.record_event(NODE_OPENED if open_path_node is None else NODE_COST_UPDATED,
+                                  neighbour_path_node)
+
+                # see if this joins up with the other side any cheaper than what we have
+                other_path_node = other_frontier.get_best_path_node(neighbour)
+                if other_path_node is not None:
+                    path_cost = fixed_path_cost + other_path_node.fixed_path_cost
+                    if path_cost < self.best_path_cost:
+                        self.best_path_cost = path_cost
+                        if frontier is self.forward:
+                            self.best_meeting_path_nodes = (neighbour_path_node, other_path_node)
+                        else:
+                            self.best_meeting_path_nodes = (other_path_node, neighbour_path_node)
+
+        self.add_path_node_to_closed_list(path_node)
+
+    def join_path(self, forward_path_node, backward_path_node):
+        # the forward half unwinds as normal, then we carry on along the backward half's parents towards the end,
+        # making new path nodes so the costs and depths keep counting up from the start
+        final_path = self.unwind_path(forward_path_node)
+
+        path_node = forward_path_node
+        backward_path_node = backward_path_node.parent_path_node
+        while backward_path_node is not None:
+            fixed_path_cost = self.best_path_cost - backward_path_node.fixed_path_cost
+            path_node = PathFinderNode(backward_path_node.nav_node, path_node, path_node.depth + 1,
+                                       fixed_path_cost, 0.0, fixed_path_cost)
+            final_path.append(path_node)
+            backward_path_node = backward_path_node.parent_path_node
+        return final_path
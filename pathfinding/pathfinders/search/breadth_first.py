@@ -0,0 +1,68 @@
+from collections import deque
+
+from ..nav_node import PathFinderNode, NavNodeIndex
+from .base_search import BaseSearch
+from .events import NODE_OPENED
+
+
+class BreadthFirstSearch(BaseSearch):
+    def __init__(self, start_nav_node, end_nav_node, allow_revisiting=True):
+        super().__init__("Breadth First")
+        self.start_path_node = PathFinderNode(start_nav_node, None, 0)
+        self.end_nav_node = end_nav_node
+        self.current_path_node = self.start_path_node
+        self.allow_revisiting = allow_revisiting
+
+        # nodes are opened a depth at a time, so first in first out keeps the open list in depth order
+        self.open_node_queue = deque()
+        self.open_nav_nodes = NavNodeIndex()
+
+        self.expand_path_node(self.current_path_node)
+
+    def is_search_complete(self):
+        if self.finished or self.current_path_node is None:
+            return True
+        return self.current_path_node.nav_node == self.end_nav_node or not self.open_node_queue
+
+    def update(self):
+        if not self.is_search_complete():
+            # the front of the queue is the next sibling at the current depth, or the first child at the next
+            # depth once the siblings have all been expanded
+            path_node = self.open_node_queue.popleft()
+            self.open_nav_nodes.remove(path_node.nav_node)
+            self.add_path_node_to_closed_list(self.current_path_node)
+            self.expand_path_node(path_node)
+            self.current_path_node = path_node
+
+            self.search_size += 1
+        elif not self.finished:
+            self.finished = True
+            if self.current_path_node.nav_node == self.end_nav_node:
+                self.final_path = self.unwind_path(self.current_path_node)
+            self.current_path_node = None
+
+    def get_open_path_nodes(self):
+        return list(self.open_node_queue)
+
+    def expand_path_node(self, path_node):
+        for neighbour_nav_node, distance_to_neighbour in zip(path_node.nav_node.neighbours,
+                                                             path_node.nav_node.neighbour_distances):
+            fixed_cost = path_node.fixed_path_cost + distance_to_neighbour
+
+            if self.allow_revisiting:
+                self.add_path_node_to_open_list(PathFinderNode(neighbour_nav_node, path_node, path_node.depth + 1,
+                                                               fixed_cost, 0.0, fixed_cost))
+            else:
+                if not self.is_nav_node_in_open_list(neighbour_nav_node) and not self.is_nav_node_in_closed_list(
+                        neighbour_nav_node):
+                    self.add_path_node_to_open_list(PathFinderNode(neighbour_nav_node, path_node,
+                                                                   path_node.depth + 1,
+                                                                   fixed_cost, 0.0, fixed_cost))
+
+    def add_path_node_to_open_list(self, path_node):
+        self.open_node_queue.append(path_node)
+        self.open_nav_nodes.add(path_node.nav_node)
+        self.record_event(NODE_OPENED, path_node)
+
+    def is_nav_node_in_open_list(self, nav_node):
+        return nav_node in self.open_nav_nodes
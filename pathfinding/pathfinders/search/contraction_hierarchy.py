@@ -0,0 +1,128 @@
+from ..nav_node import PathFinderNode
+from .base_search import BaseSearch
+from .bidirectional import SearchFrontier
+from .events import NODE_OPENED, NODE_COST_UPDATED
+
+
+class ContractionHierarchySearch(BaseSearch):
+    """
+    The query half of a ContractionHierarchy. A Dijkstra's search goes up the hierarchy from the start, only
+    following edges to higher ranked nodes, and another goes up from the end along the edges coming in from
+    higher ranked nodes. The shortest path always climbs to one highest node and back down, so it is found
+    where the two searches meet. Each side stops once its cheapest open node costs more than the best path
+    found, and the edges of that path are unpacked from shortcuts back into real ones at the end.
+
+    Both searches only ever see a small part of the graph, so this expands far fewer nodes than Dijkstra's.
+    """
+    def __init__(self, start_nav_node, end_nav_node, contraction_hierarchy):
+        super().__init__("Contraction Hierarchy")
+        self.end_nav_node = end_nav_node
+        self.contraction_hierarchy = contraction_hierarchy
+
+        self.forward = SearchFrontier(start_nav_node, end_nav_node,
+                                      contraction_hierarchy.get_upward_edges, False)
+        self.backward = SearchFrontier(end_nav_node, start_nav_node,
+                                       contraction_hierarchy.get_downward_edges, False)
+        self.start_path_node = self.forward.start_path_node
+
+        self.best_path_cost = float('infinity')
+        self.best_meeting_path_nodes = None
+        if start_nav_node == end_nav_node:
+            self.best_path_cost = 0.0
+
+        self.current_path_node = self.start_path_node
+
+    def get_searching_frontiers(self):
+        # a side is done once nothing it has open could lead to a cheaper path
+        searching_frontiers = []
+        for frontier in (self.forward, self.backward):
+            lowest_cost_path_node = frontier.peek_lowest_cost_open_node()
+            if lowest_cost_path_node is not None and lowest_cost_path_node.fixed_path_cost < self.best_path_cost:
+                searching_frontiers.append(frontier)
+        return searching_frontiers
+
+    def is_search_complete(self):
+        return self.finished or not self.get_searching_frontiers()
+
+    def update(self):
+        searching_frontiers = self.get_searching_frontiers()
+        if not self.finished and searching_frontiers:
+            if len(searching_frontiers) == 1:
+                frontier = searching_frontiers[0]
+            elif len(self.forward.open_path_nodes) <= len(self.backward.open_path_nodes):
+                frontier = self.forward
+            else:
+                frontier = self.backward
+            if frontier is self.forward:
+                self.expand_lowest_cost_node(self.forward, self.backward)
+            else:
+                self.expand_lowest_cost_node(self.backward, self.forward)
+            self.search_size += 1
+
+        elif not self.finished:
+            self.finished = True
+            self.current_path_node = None
+            if self.best_meeting_path_nodes is not None:
+                self.final_path = self.unpack_path(*self.best_meeting_path_nodes)
+
+    def get_open_path_nodes(self):
+        return list(self.forward.open_path_nodes.values()) + list(self.backward.open_path_nodes.values())
+
+    def expand_lowest_cost_node(self, frontier, other_frontier):
+        path_node = frontier.pop_lowest_cost_open_node()
+        frontier.closed_path_nodes[path_node.nav_node] = path_node
+        frontier.search_size += 1
+        self.current_path_node = path_node
+
+        for neighbour, distance_to_neighbour in frontier.get_edges(path_node.nav_node):
+            if neighbour in frontier.closed_path_nodes:
+                continue
+            fixed_path_cost = path_node.fixed_path_cost + distance_to_neighbour
+            open_path_node = frontier.open_path_nodes.get(neighbour)
+            if open_path_node is None or fixed_path_cost < open_path_node.fixed_path_cost:
+                neighbour_path_node = PathFinderNode(neighbour, path_node, path_node.depth + 1, fixed_path_cost,
+                                                     0.0, fixed_path_cost)
+                frontier.push_open_node(neighbour_path_node)
+                self.record_event(NODE_OPENED if open_path_node is None else NODE_COST_UPDATED,
+                                  neighbour_path_node)
+
+                other_path_node = other_frontier.get_best_path_node(neighbour)
+                if other_path_node is not None:
+                    self.update_best_meeting(frontier, neighbour_path_node, other_path_node)
+
+        self.add_path_node_to_closed_list(path_node)
+
+    def update_best_meeting(self, frontier, path_node, other_path_node):
+        path_cost = path_node.fixed_path_cost + other_path_node.fixed_path_cost
+        if path_cost < self.best_path_cost:
+            self.best_path_cost = path_cost
+            if frontier is self.forward:
+                self.best_meeting_path_nodes = (path_node, other_path_node)
+            else:
+                self.best_meeting_path_nodes = (other_path_node, path_node)
+
+    def unpack_path(self, forward_path_node, backward_path_node):
+        # the hierarchy's nodes from the start up to the meeting node and back down to the end
+        hierarchy_nav_nodes = []
+        path_node = forward_path_node
+        while path_node is not None:
+            hierarchy_nav_nodes.append(path_node.nav_node)
+            path_node = path_node.parent_path_node
+        hierarchy_nav_nodes.reverse()
+        path_node = backward_path_node.parent_path_node
+        while path_node is not None:
+            hierarchy_nav_nodes.append(path_node.nav_node)
+            path_node = path_node.parent_path_node
+
+        # then every shortcut between them is swapped for the real edges it skips
+        final_path = []
+        path_node = self.start_path_node
+        for from_nav_node, to_nav_node in zip(hierarchy_nav_nodes, hierarchy_nav_nodes[1:]):
+            for nav_node in self.contraction_hierarchy.unpack_edge(from_nav_node, to_nav_node):
+                distance_to_neighbour = path_node.nav_node.neighbour_distances[
+                    path_node.nav_node.neighbours.index(nav_node)]
+                fixed_path_cost = path_node.fixed_path_cost + distance_to_neighbour
+                path_node = PathFinderNode(nav_node, path_node, path_node.depth + 1,
+                                           fixed_path_cost, 0.0, fixed_path_cost)
+                final_path.append(path_node)
+        return final_path
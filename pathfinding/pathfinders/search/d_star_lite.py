@@ -0,0 +1,202 @@
+import heapq
+import math
+
+from ..nav_node import PathFinderNode, NavNodeIndex
+from .base_search import BaseSearch
+from .events import NODE_OPENED
+
+
+class DStarLiteSearch(BaseSearch):
+    """
+    D* Lite: a search that can be repaired instead of started again when the start moves or an edge of the
+    graph changes.
+
+    It searches backwards from the end, keeping for every nav node g, the path cost to the end as of its last
+    expansion, and rhs, what its neighbours say that cost should be now. A node where the two differ is open.
+    When an edge changes only the nodes at either end get their rhs worked out again, and the search carries
+    on expanding open nodes until the start is settled, so only the part of the graph the change affects is
+    searched again. Moving the start just adds to km, an offset that keeps the old open list keys usable
+    without re-sorting them.
+
+    The search keeps its own copy of the edges, changed with set_edge_cost(), add_edge() and remove_edge().
+    Edge costs should never be less than the straight line between their nodes, as that is the heuristic.
+    """
+    def __init__(self, start_nav_node, end_nav_node, nav_nodes):
+        super().__init__("D* Lite")
+        self.start_nav_node = start_nav_node
+        self.end_nav_node = end_nav_node
+
+        self.successors = {nav_node: {} for nav_node in nav_nodes}
+        self.predecessors = {nav_node: {} for nav_node in nav_nodes}
+        for nav_node in nav_nodes:
+            for neighbour, distance_to_neighbour in zip(nav_node.neighbours, nav_node.neighbour_distances):
+                self.successors[nav_node][neighbour] = min(distance_to_neighbour,
+                                                           self.successors[nav_node].get(neighbour,
+                                                                                         float('infinity')))
+                self.predecessors[neighbour][nav_node] = self.successors[nav_node][neighbour]
+
+        self.g_costs = {}
+        self.rhs_costs = {end_nav_node: 0.0}
+        self.key_offset = 0.0  # km in the paper
+        self.last_start_nav_node = start_nav_node
+
+        # open nodes in a heap of (key, insertion order, nav node) with the current key for each kept alongside,
+        # so entries left behind when a node's key changes can be skipped
+        self.open_node_heap = []
+        self.open_node_keys = {}
+        self.open_node_insertion_count = 0
+        self.push_open_node(end_nav_node)
+
+        self.start_path_node = PathFinderNode(start_nav_node, None, 0)
+        self.current_path_node = None
+
+        # search_size counts the expansions since the last change, total_search_size all of them
+        self.total_search_size = 0
+
+    def get_g_cost(self, nav_node):
+        return self.g_costs.get(nav_node, float('infinity'))
+
+    def get_rhs_cost(self, nav_node):
+        return self.rhs_costs.get(nav_node, float('infinity'))
+
+    def get_distance_from_start(self, nav_node):
+        x_diff = nav_node.position[0] - self.start_nav_node.position[0]
+        y_diff = nav_node.position[1] - self.start_nav_node.position[1]
+        return math.sqrt(x_diff ** 2 + y_diff ** 2)
+
+    def calculate_key(self, nav_node):
+        cost = min(self.get_g_cost(nav_node), self.get_rhs_cost(nav_node))
+        return cost + self.get_distance_from_start(nav_node) + self.key_offset, cost
+
+    def push_open_node(self, nav_node):
+        key = self.calculate_key(nav_node)
+        self.open_node_keys[nav_node] = key
+        heapq.heappush(self.open_node_heap, (key, self.open_node_insertion_count, nav_node))
+        self.open_node_insertion_count += 1
+        self.record_nav_node_event(NODE_OPENED, nav_node)
+
+    def peek_lowest_key_open_node(self):
+        while self.open_node_heap:
+            key, _, nav_node = self.open_node_heap[0]
+            if self.open_node_keys.get(nav_node) == key:
+                return key, nav_node
+            heapq.heappop(self.open_node_heap)
+        return (float('infinity'), float('infinity')), None
+
+    def update_node(self, nav_node):
+        if nav_node != self.end_nav_node:
+            self.rhs_costs[nav_node] = min((edge_cost + self.get_g_cost(successor)
+                                            for successor, edge_cost in self.successors[nav_node].items()),
+                                           default=float('infinity'))
+        self.open_node_keys.pop(nav_node, None)
+        if self.get_g_cost(nav_node) != self.get_rhs_cost(nav_node):
+            self.push_open_node(nav_node)
+
+    def is_search_complete(self):
+        if self.finished:
+            return True
+        lowest_key, _ = self.peek_lowest_key_open_node()
+        return (lowest_key >= self.calculate_key(self.start_nav_node) and
+                self.get_rhs_cost(self.start_nav_node) <= self.get_g_cost(self.start_nav_node))
+
+    def update(self):
+        if not self.is_search_complete():
+            lowest_key, nav_node = self.peek_lowest_key_open_node()
+            new_key = self.calculate_key(nav_node)
+            if lowest_key < new_key:
+                # the start has moved since this node was keyed, so it goes back in at its proper place
+                self.push_open_node(nav_node)
+                return
+
+            del self.open_node_keys[nav_node]
+            if self.get_g_cost(nav_node) > self.get_rhs_cost(nav_node):
+                self.g_costs[nav_node] = self.rhs_costs[nav_node]
+                for predecessor in self.predecessors[nav_node]:
+                    self.update_node(predecessor)
+            else:
+                # got more expensive, so everything that went through it needs working out again
+                self.g_costs[nav_node] = float('infinity')
+                for predecessor in self.predecessors[nav_node]:
+                    self.update_node(predecessor)
+                self.update_node(nav_node)
+
+            self.current_path_node = PathFinderNode(nav_node, None, 0, min(self.get_g_cost(nav_node),
+                                                                           self.get_rhs_cost(nav_node)))
+            self.add_path_node_to_closed_list(self.current_path_node)
+            self.search_size += 1
+            self.total_search_size += 1
+
+        elif not self.finished:
+            self.finished = True
+            self.current_path_node = None
+            self.final_path = self.follow_path()
+
+    def get_open_path_nodes(self):
+        return [PathFinderNode(nav_node, None, 0, min(self.get_g_cost(nav_node), self.get_rhs_cost(nav_node)))
+                for nav_node in self.open_node_keys]
+
+    def record_nav_node_event(self, event_type, nav_node):
+        # saves making a path node for every open list change when nobody is listening
+        if self.event_listeners:
+            self.record_event(event_type, PathFinderNode(nav_node, None, 0, min(self.get_g_cost(nav_node),
+                                                                                self.get_rhs_cost(nav_node))))
+
+    def follow_path(self):
+        # walk from the start, always to the successor with the cheapest cost to the end through it
+        # rhs is what the start's neighbours say its cost is, the search can stop before g catches up with it
+        final_path = []
+        if self.get_rhs_cost(self.start_nav_node) == float('infinity'):
+            return final_path
+
+        path_node = PathFinderNode(self.start_nav_node, None, 0)
+        while path_node.nav_node != self.end_nav_node:
+            next_nav_node, edge_cost = min(self.successors[path_node.nav_node].items(),
+                                           key=lambda edge: edge[1] + self.get_g_cost(edge[0]))
+            fixed_path_cost = path_node.fixed_path_cost + edge_cost
+            path_node = PathFinderNode(next_nav_node, path_node, path_node.depth + 1,
+                                       fixed_path_cost, 0.0, fixed_path_cost)
+            final_path.append(path_node)
+        return final_path
+
+    def start_replanning(self):
+        # the nodes drawn as expanded so far are from the last plan, so start a fresh list
+        self.closed_node_list = []
+        self.closed_nav_nodes = NavNodeIndex()
+        self.search_size = 0
+        self.finished = False
+
+    def move_start(self, start_nav_node):
+        """
+        Moves the start, keeping everything searched so far. The next updates only repair what the move needs.
+        """
+        self.start_nav_node = start_nav_node
+        self.key_offset += self.get_distance_from_start(self.last_start_nav_node)
+        self.last_start_nav_node = start_nav_node
+        self.start_path_node = PathFinderNode(start_nav_node, None, 0)
+        self.start_replanning()
+
+    def set_edge_cost(self, from_nav_node, to_nav_node, edge_cost):
+        """
+        Changes the cost of the edge from from_nav_node to to_nav_node, adding it if it isn't there.
+        An edge_cost of None removes it.
+        """
+        if edge_cost is None:
+            self.successors[from_nav_node].pop(to_nav_node, None)
+            self.predecessors[to_nav_node].pop(from_nav_node, None)
+        else:
+            self.successors.setdefault(from_nav_node, {})[to_nav_node] = edge_cost
+            self.predecessors.setdefault(to_nav_node, {})[from_nav_node] = edge_cost
+            self.successors.setdefault(to_nav_node, {})
+            self.predecessors.setdefault(from_nav_node, {})
+        self.update_node(from_nav_node)
+        self.start_replanning()
+
+    def add_edge(self, from_nav_node, to_nav_node, edge_cost=None):
+        if edge_cost is None:
+            x_diff = from_nav_node.position[0] - to_nav_node.position[0]
+            y_diff = from_nav_node.position[1] - to_nav_node.position[1]
+            edge_cost = math.sqrt(x_diff ** 2 + y_diff ** 2)
+        self.set_edge_cost(from_nav_node, to_nav_node, edge_cost)
+
+    def remove_edge(self, from_nav_node, to_nav_node):
+        self.set_edge_cost(from_nav_node, to_nav_node, None)
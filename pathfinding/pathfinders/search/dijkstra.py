@@ -0,0 +1,71 @@
+from ..nav_node import PathFinderNode
+from .base_search import BestFirstSearch
+from .events import NODE_OPENED, NODE_COST_UPDATED
+
+
+class DijkstraSearch(BestFirstSearch):
+    def __init__(self, start_nav_node, end_nav_node, nav_nodes, single_source=False, max_path_cost=None):
+        super().__init__("Dijkstra's")
+        self.start_path_node = PathFinderNode(start_nav_node, None, 0)
+        self.end_nav_node = end_nav_node
+        self.end_path_node = None
+        self.current_path_node = self.start_path_node
+
+        # by default we stop as soon as the end node is settled, single source mode carries on until every
+        # reachable node is settled so that 'distances' holds the full distance map. Either way we stop once
+        # the cheapest open node costs more than max_path_cost, if there is one.
+        self.single_source = single_source
+        self.max_path_cost = max_path_cost
+        self.reached_max_path_cost = False
+
+        self.distances = {nav_node: float('infinity') for nav_node in nav_nodes}
+        self.distances[start_nav_node] = 0
+
+        self.expand_path_node(self.current_path_node)
+
+    def is_search_complete(self):
+        if self.finished or not self.open_path_nodes or self.reached_max_path_cost:
+            return True
+        return not self.single_source and self.end_path_node is not None
+
+    def update(self):
+        if not self.is_search_complete():
+            # expand the lowest cost node
+            node_to_expand = self.pop_lowest_cost_open_node()
+
+            if self.max_path_cost is not None and node_to_expand.fixed_path_cost > self.max_path_cost:
+                # nothing left in the open list is within the cost bound, leave the node open and stop
+                self.push_open_node(node_to_expand)
+                self.reached_max_path_cost = True
+                self.reached_search_limit = True
+            else:
+                self.add_path_node_to_closed_list(self.current_path_node)
+                self.current_path_node = node_to_expand
+                if node_to_expand.nav_node == self.end_nav_node:
+                    self.end_path_node = node_to_expand
+                if self.single_source or self.end_path_node is None:
+                    self.expand_path_node(node_to_expand)
+
+            self.search_size += 1
+        elif not self.finished:
+            if self.current_path_node not in self.closed_node_list:
+                self.add_path_node_to_closed_list(self.current_path_node)
+            self.finished = True
+            end_path_node = self.end_path_node
+            if end_path_node is not None:
+                self.final_path = self.unwind_path(end_path_node)
+                self.current_path_node = None
+
+    def expand_path_node(self, path_node):
+        for neighbour_nav_node, distance_to_neighbour in zip(path_node.nav_node.neighbours,
+                                                             path_node.nav_node.neighbour_distances):
+            if not self.is_nav_node_in_closed_list(neighbour_nav_node):
+                fixed_cost = path_node.fixed_path_cost + distance_to_neighbour
+
+                if fixed_cost < self.distances[neighbour_nav_node]:
+                    self.distances[neighbour_nav_node] = fixed_cost
+                    already_open = self.is_nav_node_in_open_list(neighbour_nav_node)
+                    self.push_open_node(PathFinderNode(neighbour_nav_node, path_node, path_node.depth + 1,
+                                                       fixed_cost, 0.0, fixed_cost))
+                    self.record_event(NODE_COST_UPDATED if already_open else NODE_OPENED,
+                                      self.open_path_nodes[neighbour_nav_node])
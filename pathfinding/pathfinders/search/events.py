@@ -0,0 +1,52 @@
+from collections import deque
+
+NODE_OPENED = "opened"
+NODE_COST_UPDATED = "cost updated"
+NODE_EXPANDED = "expanded"
+NODE_CLOSED = "closed"
+PATH_FOUND = "path found"
+NO_PATH_FOUND = "no path found"
+
+
+def search_events(search):
+    """
+    Runs a search to the end, yielding an (event type, path node) tuple for each change to it as it goes so
+    that whatever is watching only has to deal with what changed.
+
+    Nodes opened and closed before we started listening are yielded first. A node being reopened with a
+    cheaper path comes through as NODE_COST_UPDATED with the new path node. The last event is PATH_FOUND with
+    the end path node, or NO_PATH_FOUND with None.
+    """
+    for path_node in search.closed_node_list:
+        yield NODE_CLOSED, path_node
+    for path_node in search.get_open_path_nodes():
+        yield NODE_OPENED, path_node
+
+    # each generator has its own queue, so a finder drawing the same search still sees every event too
+    event_queue = deque()
+
+    def queue_event(event_type, path_node):
+        event_queue.append((event_type, path_node))
+
+    search.add_event_listener(queue_event)
+    try:
+        expanded_path_node = search.current_path_node
+        if expanded_path_node is not None:
+            yield NODE_EXPANDED, expanded_path_node
+
+        while not search.finished:
+            search.update()
+            if search.current_path_node is not None and search.current_path_node is not expanded_path_node:
+                expanded_path_node = search.current_path_node
+                event_queue.appendleft((NODE_EXPANDED, expanded_path_node))
+
+            # anything whoever is listening does to the search while we yield just joins the end of the queue
+            while event_queue:
+                yield event_queue.popleft()
+
+        if search.final_path:
+            yield PATH_FOUND, search.final_path[-1]
+        else:
+            yield NO_PATH_FOUND, None
+    finally:
+        search.remove_event_listener(queue_event)
@@ -0,0 +1,169 @@
+from ..nav_node import PathFinderNode
+from .base_search import GridSearch
+from .events import NODE_OPENED, NODE_COST_UPDATED
+
+
+class HierarchicalSearch(GridSearch):
+    """
+    HPA* over a ClusterAbstraction. The start and end squares are linked into the abstract graph by searching
+    just their own clusters, then A* runs over the abstract nodes alone, and finally the abstract path is
+    refined into grid squares one link at a time, with a search of only the cluster that link is in.
+
+    Refining is lazy: each update after the abstract search has finished refines one more link, so whoever is
+    following the path can start moving before the far end of it has been worked out. The refined path is
+    made of path nodes at the squares where it turns.
+
+    The path is approximate. It is the shortest one over the abstract graph, but every border crossing has to
+    go through one of the few entrance squares picked for that border, so it can be a few squares longer than
+    the shortest path A* would find on the grid.
+    """
+    def __init__(self, start_nav_node, end_nav_node, cluster_abstraction, max_path_search_size=None):
+        super().__init__("Hierarchical", start_nav_node, end_nav_node, cluster_abstraction.maze_grid)
+        self.cluster_abstraction = cluster_abstraction
+        self.max_search_size = max_path_search_size
+
+        # squares looked at while linking the start and end in, and while refining, aren't abstract expansions
+        # so they are counted separately
+        self.insertion_search_size = 0
+        self.refinement_search_size = 0
+        self.query_edges = {}
+        self.insert_start_and_end()
+
+        distance_to_end_node = self.get_distance_to_end(start_nav_node)
+        self.start_path_node = PathFinderNode(start_nav_node, None, 0, 0.0, distance_to_end_node,
+                                              distance_to_end_node)
+        self.abstract_path = []
+        self.refined_abstract_path_length = 0
+        self.current_path_node = self.start_path_node
+        self.abstract_search_finished = False
+
+        self.add_current_path_node_neighbours_to_open_list()
+
+    def insert_start_and_end(self):
+        # link the start to the entrances of its cluster, the end's cluster entrances to the end, and the start
+        # straight to the end if they share a cluster. These edges only live as long as this search.
+        abstraction = self.cluster_abstraction
+        start_cluster = abstraction.get_cluster(self.start_grid_position)
+        end_cluster = abstraction.get_cluster(self.end_grid_position)
+
+        distances, _ = abstraction.search_cluster(self.start_grid_position, start_cluster)
+        self.insertion_search_size += len(distances)
+        start_edges = self.query_edges.setdefault(self.start_grid_position, [])
+        for entrance_position in abstraction.cluster_entrances.get(start_cluster, []):
+            if entrance_position in distances and entrance_position != self.start_grid_position:
+                start_edges.append((entrance_position, distances[entrance_position]))
+        if start_cluster == end_cluster and self.end_grid_position in distances:
+            start_edges.append((self.end_grid_position, distances[self.end_grid_position]))
+
+        distances, _ = abstraction.search_cluster(self.end_grid_position, end_cluster)
+        self.insertion_search_size += len(distances)
+        for entrance_position in abstraction.cluster_entrances.get(end_cluster, []):
+            if entrance_position in distances and entrance_position != self.end_grid_position:
+                self.query_edges.setdefault(entrance_position, []).append((self.end_grid_position,
+                                                                           distances[entrance_position]))
+
+    def get_edges(self, grid_position):
+        query_edges = self.query_edges.get(grid_position)
+        if query_edges is None:
+            return self.cluster_abstraction.get_edges(grid_position)
+        return list(self.cluster_abstraction.get_edges(grid_position)) + query_edges
+
+    def is_search_complete(self):
+        if self.finished:
+            return True
+        return self.abstract_search_finished and self.refined_abstract_path_length >= len(self.abstract_path)
+
+    def is_abstract_search_complete(self):
+        if self.abstract_search_finished or self.current_path_node is None:
+            return True
+        reached_end_of_path = self.current_path_node.nav_node == self.end_nav_node
+        return (reached_end_of_path or
+                (self.max_search_size is not None and self.search_size >= self.max_search_size))
+
+    def update(self):
+        if not self.is_abstract_search_complete():
+            self.current_path_node = self.pop_lowest_cost_open_node()
+            if self.current_path_node is not None:
+                self.add_current_path_node_neighbours_to_open_list()
+
+            self.search_size += 1
+
+        elif not self.abstract_search_finished:
+            self.abstract_search_finished = True
+            # unwind the abstract path, refining it into squares happens over the next updates
+            if self.current_path_node is not None and self.current_path_node.nav_node == self.end_nav_node:
+                path_node = self.current_path_node
+                while path_node is not None:
+                    self.abstract_path.append(path_node)
+                    path_node = path_node.parent_path_node
+                self.abstract_path.reverse()
+                self.refined_abstract_path_length = 1
+            elif self.max_search_size is not None and self.search_size >= self.max_search_size:
+                self.reached_search_limit = True
+            self.current_path_node = None
+
+        elif not self.is_search_complete():
+            self.refine_next_abstract_edge()
+
+        elif not self.finished:
+            self.finished = True
+
+    def add_current_path_node_neighbours_to_open_list(self):
+        current_grid_position = self.grid_positions[self.current_path_node.nav_node]
+        for neighbour_grid_position, distance_to_neighbour in self.get_edges(current_grid_position):
+            neighbour = self.get_grid_nav_node(neighbour_grid_position)
+            if self.is_nav_node_in_closed_list(neighbour):
+                continue
+
+            fixed_path_cost = self.current_path_node.fixed_path_cost + distance_to_neighbour
+            open_path_node = self.open_path_nodes.get(neighbour)
+            if open_path_node is None or fixed_path_cost < open_path_node.fixed_path_cost:
+                distance_to_end_node = self.get_distance_to_end(neighbour)
+                self.push_open_node(PathFinderNode(neighbour, self.current_path_node,
+                                                   self.current_path_node.depth + 1,
+                                                   fixed_path_cost, distance_to_end_node,
+                                                   fixed_path_cost + distance_to_end_node))
+                self.record_event(NODE_OPENED if open_path_node is None else NODE_COST_UPDATED,
+                                  self.open_path_nodes[neighbour])
+
+        self.add_path_node_to_closed_list(self.current_path_node)
+
+    def refine_next_abstract_edge(self):
+        abstraction = self.cluster_abstraction
+        from_grid_position = self.grid_positions[self.abstract_path[self.refined_abstract_path_length - 1].nav_node]
+        to_grid_position = self.grid_positions[self.abstract_path[self.refined_abstract_path_length].nav_node]
+        self.refined_abstract_path_length += 1
+
+        # links between clusters are a single step, links inside one need searching again
+        cluster = abstraction.get_cluster(from_grid_position)
+        if cluster != abstraction.get_cluster(to_grid_position):
+            squares = [to_grid_position]
+        else:
+            distances, parents = abstraction.search_cluster(from_grid_position, cluster, to_grid_position)
+            self.refinement_search_size += len(distances)
+            squares = []
+            square = to_grid_position
+            while square != from_grid_position:
+                squares.append(square)
+                square = parents[square]
+            squares.reverse()
+
+        if self.final_path:
+            path_node = self.final_path[-1]
+        else:
+            path_node = self.start_path_node
+        last_grid_position = from_grid_position
+        for index, square in enumerate(squares):
+            # only keep the squares where the path turns, and the end of each link
+            if index + 1 < len(squares):
+                next_square = squares[index + 1]
+                if (next_square[0] - square[0], next_square[1] - square[1]) == (square[0] - last_grid_position[0],
+                                                                                  square[1] - last_grid_position[1]):
+                    last_grid_position = square
+                    continue
+            fixed_path_cost = (path_node.fixed_path_cost +
+                               self.get_grid_step_cost(self.grid_positions[path_node.nav_node], square))
+            path_node = PathFinderNode(self.get_grid_nav_node(square), path_node, path_node.depth + 1,
+                                       fixed_path_cost, 0.0, fixed_path_cost)
+            self.final_path.append(path_node)
+            last_grid_position = square
@@ -0,0 +1,106 @@
+from ..nav_node import PathFinderNode
+from .base_search import GridSearch
+from .events import NODE_OPENED, NODE_COST_UPDATED
+
+
+class JumpPointSearch(GridSearch):
+    """
+    Jump Point Search for four way movement, run on the maze grid squares rather than the junction graph.
+
+    From each node we 'jump' in a straight line until we hit a wall, reach the end, or reach a square where
+    some other route could branch off (a forced neighbour). Only the squares we stop at go on the open list,
+    so the straight runs between them are never expanded one square at a time. Moving vertically we also stop
+    wherever a horizontal jump would find something, which is what keeps the paths optimal with no diagonals.
+    """
+    def __init__(self, start_nav_node, end_nav_node, maze_grid, max_path_search_size=2000):
+        super().__init__("Jump Point", start_nav_node, end_nav_node, maze_grid)
+        self.max_search_size = max_path_search_size  # None to search until the end is found or ruled out
+
+        distance_to_end_node = self.get_distance_to_end(start_nav_node)
+        self.start_path_node = PathFinderNode(start_nav_node, None, 0, 0.0, distance_to_end_node,
+                                              distance_to_end_node)
+        self.current_path_node = self.start_path_node
+
+        self.add_current_path_node_jump_points_to_open_list()
+
+    def is_search_complete(self):
+        if self.finished or self.current_path_node is None:
+            return True
+        reached_end_of_path = self.current_path_node.nav_node == self.end_nav_node
+        return (reached_end_of_path or
+                (self.max_search_size is not None and self.search_size >= self.max_search_size))
+
+    def update(self):
+        if not self.is_search_complete():
+            self.current_path_node = self.pop_lowest_cost_open_node()
+            if self.current_path_node is not None:
+                self.add_current_path_node_jump_points_to_open_list()
+
+            self.search_size += 1
+
+        elif not self.finished:
+            self.finished = True
+            # unwind our successful path
+            if self.current_path_node is not None and self.current_path_node.nav_node == self.end_nav_node:
+                self.final_path = self.unwind_path(self.current_path_node)
+            elif self.max_search_size is not None and self.search_size >= self.max_search_size:
+                self.reached_search_limit = True
+            self.current_path_node = None
+
+    def get_search_directions(self, path_node):
+        x, y = self.grid_positions[path_node.nav_node]
+        if path_node.parent_path_node is None:
+            return (1, 0), (-1, 0), (0, 1), (0, -1)
+
+        # carry on the way we came, or turn off to either side. Going back the way we came can never help.
+        parent_x, parent_y = self.grid_positions[path_node.parent_path_node.nav_node]
+        x_step = (x > parent_x) - (x < parent_x)
+        y_step = (y > parent_y) - (y < parent_y)
+        if x_step != 0:
+            return (x_step, 0), (0, 1), (0, -1)
+        return (0, y_step), (1, 0), (-1, 0)
+
+    def jump(self, x, y, x_step, y_step):
+        is_open = self.maze_grid.is_open
+        while is_open(x, y):
+            if (x, y) == self.end_grid_position:
+                return x, y
+            if x_step != 0:
+                # a forced neighbour is an open square beside us whose own square behind us is a wall, so the
+                # only short way into it is through here
+                if ((is_open(x, y - 1) and not is_open(x - x_step, y - 1)) or
+                        (is_open(x, y + 1) and not is_open(x - x_step, y + 1))):
+                    return x, y
+            else:
+                if ((is_open(x - 1, y) and not is_open(x - 1, y - y_step)) or
+                        (is_open(x + 1, y) and not is_open(x + 1, y - y_step))):
+                    return x, y
+                if self.jump(x + 1, y, 1, 0) is not None or self.jump(x - 1, y, -1, 0) is not None:
+                    return x, y
+            x += x_step
+            y += y_step
+        return None
+
+    def add_current_path_node_jump_points_to_open_list(self):
+        current_x, current_y = self.grid_positions[self.current_path_node.nav_node]
+        for x_step, y_step in self.get_search_directions(self.current_path_node):
+            jump_point = self.jump(current_x + x_step, current_y + y_step, x_step, y_step)
+            if jump_point is None:
+                continue
+            neighbour = self.get_grid_nav_node(jump_point)
+            if self.is_nav_node_in_closed_list(neighbour):
+                continue
+
+            fixed_path_cost = (self.current_path_node.fixed_path_cost +
+                               self.get_grid_step_cost((current_x, current_y), jump_point))
+            open_path_node = self.open_path_nodes.get(neighbour)
+            if open_path_node is None or fixed_path_cost < open_path_node.fixed_path_cost:
+                distance_to_end_node = self.get_distance_to_end(neighbour)
+                self.push_open_node(PathFinderNode(neighbour, self.current_path_node,
+                                                   self.current_path_node.depth + 1,
+                                                   fixed_path_cost, distance_to_end_node,
+                                                   fixed_path_cost + distance_to_end_node))
+                self.record_event(NODE_OPENED if open_path_node is None else NODE_COST_UPDATED,
+                                  self.open_path_nodes[neighbour])
+
+        self.add_path_node_to_closed_list(self.current_path_node)
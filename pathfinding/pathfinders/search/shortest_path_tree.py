@@ -0,0 +1,35 @@
+from ..nav_node import PathFinderNode
+from .base_search import BaseSearch
+
+
+class ShortestPathTreeSearch(BaseSearch):
+    def __init__(self, start_nav_node, end_nav_node, path_tree_cache):
+        super().__init__("Shortest Path Tree")
+        self.start_path_node = PathFinderNode(start_nav_node, None, 0)
+        self.end_nav_node = end_nav_node
+        self.current_path_node = self.start_path_node
+
+        # no searching happens here, we just walk the next hops stored in a cache that was built once for
+        # the end node, one hop per update
+        self.cached_path = path_tree_cache.get_path(start_nav_node)
+        self.walked_path = []
+
+    def is_search_complete(self):
+        if self.finished or self.current_path_node is None:
+            return True
+        return len(self.walked_path) == len(self.cached_path)
+
+    def update(self):
+        if not self.is_search_complete():
+            self.current_path_node = self.cached_path[len(self.walked_path)]
+            self.walked_path.append(self.current_path_node)
+            self.add_path_node_to_closed_list(self.current_path_node)
+            self.search_size += 1
+        elif not self.finished:
+            self.finished = True
+            if self.current_path_node.nav_node == self.end_nav_node:
+                self.final_path = self.walked_path
+            self.current_path_node = None
+
+    def get_open_path_nodes(self):
+        return []
@@ -0,0 +1,70 @@
+import heapq
+
+from ..nav_node import PathFinderNode, NavNodeIndex
+from .base_search import BaseSearch
+from .events import NODE_OPENED
+
+
+class UniformCostSearch(BaseSearch):
+    def __init__(self, start_nav_node, end_nav_node, allow_revisiting=True):
+        super().__init__("Uniform Cost")
+        self.start_path_node = PathFinderNode(start_nav_node, None, 0)
+        self.end_nav_node = end_nav_node
+        self.current_path_node = self.start_path_node
+        self.allow_revisiting = allow_revisiting
+
+        # binary heap of (fixed path cost, insertion order, path node) entries, the insertion order breaks
+        # cost ties so the node opened first is expanded first
+        self.open_node_heap = []
+        self.open_node_insertion_count = 0
+        self.open_nav_nodes = NavNodeIndex()
+
+        self.expand_path_node(self.current_path_node)
+
+    def is_search_complete(self):
+        if self.finished or self.current_path_node is None:
+            return True
+        return self.current_path_node.nav_node == self.end_nav_node or not self.open_node_heap
+
+    def update(self):
+        if not self.is_search_complete():
+            # expand the lowest cost node
+            node_to_expand = heapq.heappop(self.open_node_heap)[2]
+            self.open_nav_nodes.remove(node_to_expand.nav_node)
+            self.add_path_node_to_closed_list(self.current_path_node)
+            self.expand_path_node(node_to_expand)
+            self.current_path_node = node_to_expand
+
+            self.search_size += 1
+        elif not self.finished:
+            self.finished = True
+            if self.current_path_node.nav_node == self.end_nav_node:
+                self.final_path = self.unwind_path(self.current_path_node)
+            self.current_path_node = None
+
+    def get_open_path_nodes(self):
+        return [path_node for _, _, path_node in self.open_node_heap]
+
+    def expand_path_node(self, path_node):
+        for neighbour_nav_node, distance_to_neighbour in zip(path_node.nav_node.neighbours,
+                                                             path_node.nav_node.neighbour_distances):
+            fixed_cost = path_node.fixed_path_cost + distance_to_neighbour
+
+            if self.allow_revisiting:
+                self.add_path_node_to_open_list(PathFinderNode(neighbour_nav_node, path_node, path_node.depth + 1,
+                                                               fixed_cost, 0.0, fixed_cost))
+            else:
+                if not self.is_nav_node_in_open_list(neighbour_nav_node) and not self.is_nav_node_in_closed_list(
+                        neighbour_nav_node):
+                    self.add_path_node_to_open_list(PathFinderNode(neighbour_nav_node, path_node,
+                                                                   path_node.depth + 1,
+                                                                   fixed_cost, 0.0, fixed_cost))
+
+    def add_path_node_to_open_list(self, path_node):
+        heapq.heappush(self.open_node_heap, (path_node.fixed_path_cost, self.open_node_insertion_count, path_node))
+        self.open_node_insertion_count += 1
+        self.open_nav_nodes.add(path_node.nav_node)
+        self.record_event(NODE_OPENED, path_node)
+
+    def is_nav_node_in_open_list(self, nav_node):
+        return nav_node in self.open_nav_nodes
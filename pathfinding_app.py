@@ -1,16 +1,26 @@
 import random
+import time
 
 import pygame
 import pygame_gui
+from pygame_gui.core import UIContainer
 from pygame_gui.elements import UIDropDownMenu, UIButton, UIHorizontalSlider
 
 from pathfinding.maze.maze_generation import create_maze
 from pathfinding.pathfinders.nav_node import PathFinderNode
 from pathfinding.pathfinders.algorithms.a_star import AStarFinder
+from pathfinding.pathfinders.algorithms.jump_point import JumpPointFinder
+from pathfinding.pathfinders.algorithms.bidirectional import BidirectionalFinder
+from pathfinding.pathfinders.algorithms.hierarchical import HierarchicalFinder
+from pathfinding.pathfinders.algorithms.d_star_lite import DStarLiteFinder
 from pathfinding.pathfinders.algorithms.breadth_first import BreadthFirstFinder
 from pathfinding.pathfinders.algorithms.uniform_cost import UniformCostFinder
 from pathfinding.pathfinders.algorithms.depth_first import DepthFirstFinder
 from pathfinding.pathfinders.algorithms.dijkstra import DijkstraFinder
+from pathfinding.pathfinders.algorithms.shortest_path_tree import ShortestPathTreeFinder
+from pathfinding.pathfinders.path_cache import ShortestPathTreeCache
+from pathfinding.pathfinders.cluster_abstraction import ClusterAbstraction
+from pathfinding.pathfinders.landmarks import LandmarkHeuristic
 
 
 class PathfindingApp:
@@ -30,7 +40,9 @@ class PathfindingApp:
         self.play_speed = 0.5
         self.play_speed_acc = 0.0
 
-        pathfinding_algorithms = ['A*', "Breadth First", "Depth First", "Dijkstra's", "Uniform Cost"]
+        pathfinding_algorithms = ['A*', "A* (Landmarks)", "Breadth First", "Depth First", "Dijkstra's", "Uniform Cost",
+                                  "Shortest Path Tree", "Jump Point", "Bidirectional A*",
+                                  "Bidirectional Dijkstra", "Hierarchical", "D* Lite"]
         self.pathfinder_drop_down = UIDropDownMenu(pathfinding_algorithms, 'A*',
                                                    pygame.Rect((620, 50), (150, 25)), self.ui_manager)
 
@@ -53,6 +65,9 @@ class PathfindingApp:
         self.play_button = UIButton(pygame.Rect((620, 420), (150, 25)),
                                     "Play", self.ui_manager)
 
+        self.run_to_end_button = UIButton(pygame.Rect((620, 490), (150, 25)),
+                                          "Run to end", self.ui_manager)
+
         self.speed_slider = UIHorizontalSlider(pygame.Rect((620, 455), (150, 25)),
                                                self.play_speed, (1.0, 0.017),
                                                self.ui_manager)
@@ -60,6 +75,14 @@ class PathfindingApp:
         self.speed_slider_label = pygame_gui.elements.UILabel(pygame.Rect((520, 455), (100, 25)),
                                                               "Play speed: ", self.ui_manager)
 
+        # how long each frame spends updating and drawing, not counting the wait for the next tick. The label
+        # is only refreshed a couple of times a second so it doesn't add much work of its own
+        self.frame_time_label = pygame_gui.elements.UILabel(pygame.Rect((520, 10), (250, 25)),
+                                                            "Frame time: -", self.ui_manager)
+        self.frame_time_total = 0.0
+        self.frame_time_count = 0
+        self.frame_time_label_acc = 0.0
+
         self.tool_tip = None
 
         self.wall_colour = pygame.Color("#FFFFFF")
@@ -69,12 +92,17 @@ class PathfindingApp:
         self.maze_dimension = 20
 
         self.maze_square_size = int(self.available_maze_space/self.maze_dimension) + 1
-        self.walls, self.junctions, self.entrance, self.exit = create_maze(top_left=(20, 20),
-                                                                           square_size=self.maze_square_size,
-                                                                           width=self.maze_dimension,
-                                                                           height=self.maze_dimension)
+        self.walls, self.junctions, self.entrance, self.exit, self.maze_grid = create_maze(
+            top_left=(20, 20), square_size=self.maze_square_size, width=self.maze_dimension,
+            height=self.maze_dimension)
 
         self.nav_node_graph = [junction.nav_node for junction in self.junctions]
+        self.exit_path_tree_cache = None
+        self.cluster_abstraction = None
+        self.landmark_heuristic = None
+        self.maze_surface = self.render_maze_surface()
+        self.full_redraw_needed = True
+        self.last_ui_rects = []
         self.font = pygame.font.Font(None, 12)
         self.current_finder = AStarFinder(self.entrance.nav_node, self.exit.nav_node, incremental=True)
 
@@ -84,6 +112,7 @@ class PathfindingApp:
     def set_current_pathfinder(self, finder_name):
         if self.current_finder is not None:
             self.current_finder.shutdown()
+        self.full_redraw_needed = True
 
         if finder_name == "Breadth First":
             self.current_finder.shutdown()
@@ -96,6 +125,12 @@ class PathfindingApp:
             self.current_finder = AStarFinder(self.entrance.nav_node,
                                               self.exit.nav_node,
                                               incremental=True)
+        elif finder_name == "A* (Landmarks)":
+            self.current_finder.shutdown()
+            self.current_finder = AStarFinder(self.entrance.nav_node,
+                                              self.exit.nav_node,
+                                              incremental=True,
+                                              landmark_heuristic=self.get_landmark_heuristic())
         elif finder_name == "Uniform Cost":
             self.current_finder.shutdown()
             self.current_finder = UniformCostFinder(self.entrance.nav_node,
@@ -114,10 +149,87 @@ class PathfindingApp:
                                                  self.exit.nav_node,
                                                  self.nav_node_graph,
                                                  incremental=True)
+        elif finder_name == "Shortest Path Tree":
+            self.current_finder.shutdown()
+            self.current_finder = ShortestPathTreeFinder(self.entrance.nav_node,
+                                                         self.exit.nav_node,
+                                                         self.get_exit_path_tree_cache(),
+                                                         incremental=True)
+        elif finder_name == "Jump Point":
+            self.current_finder.shutdown()
+            self.current_finder = JumpPointFinder(self.entrance.nav_node,
+                                                  self.exit.nav_node,
+                                                  self.maze_grid,
+                                                  incremental=True)
+        elif finder_name == "Bidirectional A*":
+            self.current_finder.shutdown()
+            self.current_finder = BidirectionalFinder(self.entrance.nav_node,
+                                                      self.exit.nav_node,
+                                                      self.nav_node_graph,
+                                                      incremental=True)
+        elif finder_name == "Bidirectional Dijkstra":
+            self.current_finder.shutdown()
+            self.current_finder = BidirectionalFinder(self.entrance.nav_node,
+                                                      self.exit.nav_node,
+                                                      self.nav_node_graph,
+                                                      incremental=True,
+                                                      use_heuristic=False)
+        elif finder_name == "Hierarchical":
+            self.current_finder.shutdown()
+            self.current_finder = HierarchicalFinder(self.entrance.nav_node,
+                                                     self.exit.nav_node,
+                                                     self.get_cluster_abstraction(),
+                                                     incremental=True)
+        elif finder_name == "D* Lite":
+            self.current_finder.shutdown()
+            self.current_finder = DStarLiteFinder(self.entrance.nav_node,
+                                                  self.exit.nav_node,
+                                                  self.nav_node_graph,
+                                                  incremental=True)
+
+    def render_maze_surface(self):
+        # the walls don't change until we make a new maze, so draw them once and blit the result each frame
+        maze_surface = self.background_surface.copy()
+        for wall in self.walls:
+            pygame.draw.line(maze_surface, self.wall_colour, wall.start_pos, wall.end_pos, self.wall_size)
+        return maze_surface
+
+    def get_ui_rects(self):
+        return [sprite.rect.copy() for sprite in self.ui_manager.get_sprite_group().sprites()
+                if not isinstance(sprite, UIContainer)]
+
+    def update_frame_time_label(self, time_delta):
+        self.frame_time_label_acc += time_delta
+        if self.frame_time_label_acc >= 0.5 and self.frame_time_count > 0:
+            average_frame_time = 1000.0 * self.frame_time_total / self.frame_time_count
+            self.frame_time_label.set_text("Frame time: " + "{:.2f}".format(average_frame_time) + " ms")
+            self.frame_time_total = 0.0
+            self.frame_time_count = 0
+            self.frame_time_label_acc = 0.0
+
+    def get_exit_path_tree_cache(self):
+        # every query heads for the exit, so build the tree once per maze and reuse it for each start
+        if self.exit_path_tree_cache is None:
+            self.exit_path_tree_cache = ShortestPathTreeCache(self.nav_node_graph, self.exit.nav_node)
+        return self.exit_path_tree_cache
+
+    def get_cluster_abstraction(self):
+        # the cluster entrances and distances only depend on the maze, so they are built once per maze too
+        if self.cluster_abstraction is None:
+            self.cluster_abstraction = ClusterAbstraction(self.maze_grid)
+        return self.cluster_abstraction
+
+    def get_landmark_heuristic(self):
+        # landmark distances only change with the maze, so work them out once per maze
+        if self.landmark_heuristic is None:
+            self.landmark_heuristic = LandmarkHeuristic(self.nav_node_graph)
+        return self.landmark_heuristic
 
     def run(self):
         while self.running:
             time_delta = self.clock.tick(60)/1000.0  # time_delta is time between loops in seconds
+            frame_start_time = time.perf_counter()
+            self.update_frame_time_label(time_delta)
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -129,6 +241,10 @@ class PathfindingApp:
                     if event.ui_element == self.increment_pathfinder_button:
                         self.playing_pathfinder = False
                         self.current_finder.increment_algorithm()
+                    if event.ui_element == self.run_to_end_button:
+                        self.playing_pathfinder = False
+                        self.play_button.set_text('Play')
+                        self.current_finder.run_to_completion()
                     if event.ui_element == self.play_button:
                         if self.playing_pathfinder:
                             self.playing_pathfinder = False
@@ -142,7 +258,11 @@ class PathfindingApp:
                         while start_nav_node == self.exit.nav_node:
                             start_nav_node = random.choice(self.nav_node_graph)
                         self.entrance = PathFinderNode(start_nav_node, None, 0)
-                        self.set_current_pathfinder(self.current_finder.get_name())
+                        if isinstance(self.current_finder, DStarLiteFinder):
+                            # D* Lite keeps its search and only repairs the part the new start affects
+                            self.current_finder.move_start(start_nav_node)
+                        else:
+                            self.set_current_pathfinder(self.current_finder.get_name())
 
                 if event.type == pygame_gui.UI_DROP_DOWN_MENU_CHANGED:
                     if event.ui_element == self.map_size_drop_down:
@@ -156,7 +276,12 @@ class PathfindingApp:
                         self.junctions = result[1]
                         self.entrance = result[2]
                         self.exit = result[3]
+                        self.maze_grid = result[4]
                         self.nav_node_graph = [junction.nav_node for junction in self.junctions]
+                        self.exit_path_tree_cache = None
+                        self.cluster_abstraction = None
+                        self.landmark_heuristic = None
+                        self.maze_surface = self.render_maze_surface()
 
                         self.set_current_pathfinder(self.current_finder.get_name())
 
@@ -173,13 +298,11 @@ class PathfindingApp:
             self.ui_manager.update(time_delta)
             self.current_finder.update()
 
-            self.window_surface.blit(self.background_surface, (0, 0))
-
-            for wall in self.walls:
-                pygame.draw.line(self.window_surface, self.wall_colour,
-                                 wall.start_pos, wall.end_pos, self.wall_size)
-
-            self.current_finder.draw_information(self.window_surface, self.ui_manager, self.maze_square_size)
+            # the window keeps last frame's drawing, the finder puts the maze back only where something changed,
+            # which is the nodes it redrew plus wherever the UI elements are now and were last frame
+            dirty_rects = self.current_finder.draw_information(self.window_surface, self.ui_manager,
+                                                               self.maze_square_size, self.maze_surface,
+                                                               self.get_ui_rects() + self.last_ui_rects)
 
             if self.entrance is not None:
                 entrance_rect = pygame.Rect(0, 0, self.maze_square_size, self.maze_square_size)
@@ -193,7 +316,19 @@ class PathfindingApp:
 
             self.ui_manager.draw_ui(self.window_surface)
 
-            pygame.display.update()
+            # only push the parts of the window that could have changed to the display, including any UI the
+            # finder made while drawing
+            ui_rects = self.get_ui_rects()
+            dirty_rects.extend(ui_rects)
+            self.last_ui_rects = ui_rects
+            if self.full_redraw_needed:
+                pygame.display.update()
+                self.full_redraw_needed = False
+            else:
+                pygame.display.update(dirty_rects)
+
+            self.frame_time_total += time.perf_counter() - frame_start_time
+            self.frame_time_count += 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+import random
+
+import pytest
+
+from pathfinding.maze.maze_generation import create_maze
+
+
+@pytest.fixture
+def maze():
+    # a small maze's nav nodes and grid, the same every time
+    random.seed(3)
+    maze_walls, junction_points, maze_entrance, maze_exit, maze_grid = create_maze((25, 25), 16, 31, 31,
+                                                                                   use_numpy=False)
+    return [point.nav_node for point in junction_points], maze_grid
+
+
+@pytest.fixture
+def random_queries(maze):
+    # (start nav node, end nav node) pairs picked at random from the maze fixture's nav nodes
+    nav_nodes, maze_grid = maze
+    query_random = random.Random(7)
+    return [(query_random.choice(nav_nodes), query_random.choice(nav_nodes)) for _ in range(50)]
@@ -0,0 +1,35 @@
+import math
+
+import pytest
+
+from pathfinding.pathfinders.batch import BatchQueryRunner
+from pathfinding.pathfinders.engine import PathfindingEngine
+
+
+@pytest.mark.parametrize("process_count", [1, 2])
+@pytest.mark.parametrize("algorithm", ["A*", "Dijkstra's"])
+def test_results_in_query_order_match_engine(maze, random_queries, process_count, algorithm):
+    nav_nodes, maze_grid = maze
+    engine = PathfindingEngine(nav_nodes, maze_grid)
+
+    with BatchQueryRunner(nav_nodes, process_count) as batch_query_runner:
+        # small chunks so the queries are spread over several tasks
+        results = batch_query_runner.run(random_queries, algorithm, chunk_size=4)
+
+    assert len(results) == len(random_queries)
+    for (start_nav_node, end_nav_node), result in zip(random_queries, results):
+        expected = engine.solve(start_nav_node, end_nav_node, algorithm)
+
+        assert result.start_nav_node is start_nav_node
+        assert result.end_nav_node is end_nav_node
+        assert math.isclose(result.path_cost, expected.path_cost)
+        if result.found_path():
+            assert result.path[0] is start_nav_node
+            assert result.path[-1] is end_nav_node
+
+
+def test_unknown_algorithm_rejected(maze, random_queries):
+    nav_nodes, maze_grid = maze
+    with BatchQueryRunner(nav_nodes, 1) as batch_query_runner:
+        with pytest.raises(ValueError):
+            batch_query_runner.run(random_queries, "Depth First")
@@ -0,0 +1,32 @@
+import math
+
+import pytest
+
+from pathfinding.pathfinders.benchmark import compare_bidirectional_with_one_way
+from pathfinding.pathfinders.engine import PathfindingEngine
+
+
+@pytest.mark.parametrize("algorithm", ["Bidirectional A*", "Bidirectional Dijkstra"])
+def test_bidirectional_matches_dijkstra(maze, random_queries, algorithm):
+    nav_nodes, maze_grid = maze
+    engine = PathfindingEngine(nav_nodes, maze_grid)
+
+    for start_nav_node, end_nav_node in random_queries:
+        search = engine.create_search(start_nav_node, end_nav_node, algorithm)
+        result = engine.run_search(search)
+        expected = engine.solve(start_nav_node, end_nav_node, "Dijkstra's")
+
+        assert math.isclose(result.path_cost, expected.path_cost)
+        assert result.search_size == search.forward.search_size + search.backward.search_size
+        if result.found_path():
+            assert result.path[-1].nav_node is end_nav_node
+            assert all(path_node.nav_node in path_node.parent_path_node.nav_node.neighbours
+                       for path_node in result.path)
+
+
+def test_benchmark_reports_both_sides():
+    report = compare_bidirectional_with_one_way(maze_size=41, query_count=20)
+    for name in ("Bidirectional A*", "Bidirectional Dijkstra"):
+        results = report["results"][name]
+        assert results["different_costs"] == 0
+        assert results["forward_expansions"] + results["backward_expansions"] == results["expansions"]
@@ -0,0 +1,53 @@
+import math
+
+import pytest
+
+from pathfinding.pathfinders.contraction_hierarchy import ContractionHierarchy
+from pathfinding.pathfinders.engine import PathfindingEngine
+
+
+def check_costs_match_dijkstra(engine, queries):
+    for start_nav_node, end_nav_node in queries:
+        result = engine.solve(start_nav_node, end_nav_node, "Contraction Hierarchy")
+        expected = engine.solve(start_nav_node, end_nav_node, "Dijkstra's")
+
+        assert math.isclose(result.path_cost, expected.path_cost)
+        if result.found_path():
+            # shortcuts are unpacked, so every step of the path is an edge of the nav node graph
+            assert result.path[-1].nav_node is end_nav_node
+            assert all(path_node.nav_node in path_node.parent_path_node.nav_node.neighbours
+                       for path_node in result.path)
+
+
+def test_queries_match_dijkstra(maze, random_queries):
+    nav_nodes, maze_grid = maze
+    engine = PathfindingEngine(nav_nodes, maze_grid)
+
+    check_costs_match_dijkstra(engine, random_queries)
+    assert engine.get_contraction_hierarchy().get_shortcut_count() > 0
+
+
+def test_saved_hierarchy_loads_with_same_costs(maze, random_queries, tmp_path):
+    nav_nodes, maze_grid = maze
+    contraction_hierarchy = ContractionHierarchy(nav_nodes)
+    hierarchy_path = tmp_path / "hierarchy.json"
+    contraction_hierarchy.save(hierarchy_path)
+
+    loaded_hierarchy = ContractionHierarchy.load(hierarchy_path, nav_nodes)
+    assert loaded_hierarchy.to_data() == contraction_hierarchy.to_data()
+
+    built_engine = PathfindingEngine(nav_nodes, maze_grid, contraction_hierarchy)
+    loaded_engine = PathfindingEngine(nav_nodes, maze_grid, loaded_hierarchy)
+    check_costs_match_dijkstra(loaded_engine, random_queries)
+    for start_nav_node, end_nav_node in random_queries:
+        assert (loaded_engine.solve(start_nav_node, end_nav_node, "Contraction Hierarchy").path_cost ==
+                built_engine.solve(start_nav_node, end_nav_node, "Contraction Hierarchy").path_cost)
+
+
+def test_loading_for_other_nav_nodes_fails(maze, tmp_path):
+    nav_nodes, maze_grid = maze
+    hierarchy_path = tmp_path / "hierarchy.json"
+    ContractionHierarchy(nav_nodes).save(hierarchy_path)
+
+    with pytest.raises(ValueError):
+        ContractionHierarchy.load(hierarchy_path, nav_nodes[1:])
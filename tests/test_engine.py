@@ -0,0 +1,106 @@
+import math
+import random
+
+import pytest
+
+from pathfinding.pathfinders.all_pairs import AllPairsPathTable
+from pathfinding.pathfinders.engine import PathfindingEngine
+
+
+def test_all_pairs_only_offered_within_memory_limit(maze):
+    nav_nodes, maze_grid = maze
+    table_size = AllPairsPathTable.estimate_memory_size(len(nav_nodes))
+
+    assert "All Pairs" not in PathfindingEngine(nav_nodes, maze_grid).get_algorithm_names()
+    assert "All Pairs" not in PathfindingEngine(nav_nodes, maze_grid,
+                                                all_pairs_memory_limit=table_size - 1).get_algorithm_names()
+    assert "All Pairs" in PathfindingEngine(nav_nodes, maze_grid,
+                                            all_pairs_memory_limit=table_size).get_algorithm_names()
+
+
+def test_all_pairs_matches_dijkstra(maze):
+    nav_nodes, maze_grid = maze
+    engine = PathfindingEngine(nav_nodes, maze_grid, all_pairs_memory_limit=10 ** 8)
+    assert engine.all_pairs_path_table is None
+
+    random.seed(7)
+    for _ in range(100):
+        start_nav_node, end_nav_node = random.choice(nav_nodes), random.choice(nav_nodes)
+        result = engine.solve(start_nav_node, end_nav_node, "All Pairs")
+        expected = engine.solve(start_nav_node, end_nav_node, "Dijkstra's")
+
+        assert result.search_size == 0
+        assert math.isclose(result.path_cost, expected.path_cost)
+        if result.found_path():
+            assert result.path[-1].nav_node is end_nav_node
+            assert math.isclose(result.path[-1].fixed_path_cost, result.path_cost)
+
+
+def test_d_star_lite_matches_dijkstra(maze):
+    nav_nodes, maze_grid = maze
+    engine = PathfindingEngine(nav_nodes, maze_grid)
+
+    random.seed(11)
+    for _ in range(50):
+        start_nav_node, end_nav_node = random.choice(nav_nodes), random.choice(nav_nodes)
+        result = engine.solve(start_nav_node, end_nav_node, "D* Lite")
+        expected = engine.solve(start_nav_node, end_nav_node, "Dijkstra's")
+        assert math.isclose(result.path_cost, expected.path_cost)
+
+
+def test_d_star_lite_replans_through_engine(maze):
+    nav_nodes, maze_grid = maze
+    engine = PathfindingEngine(nav_nodes, maze_grid)
+    start_nav_node, end_nav_node = nav_nodes[0], nav_nodes[-1]
+
+    search = engine.create_search(start_nav_node, end_nav_node, "D* Lite")
+    first_result = engine.run_search(search)
+    assert first_result.found_path()
+
+    # block the middle of the path both ways, then move the start along what is left of it
+    middle = len(first_result.path) // 2
+    blocked_from = first_result.path[middle - 1].nav_node
+    blocked_to = first_result.path[middle].nav_node
+    search.remove_edge(blocked_from, blocked_to)
+    search.remove_edge(blocked_to, blocked_from)
+    search.move_start(first_result.path[0].nav_node)
+    repaired_result = engine.run_search(search)
+
+    fresh_search = engine.create_search(first_result.path[0].nav_node, end_nav_node, "D* Lite")
+    fresh_search.remove_edge(blocked_from, blocked_to)
+    fresh_search.remove_edge(blocked_to, blocked_from)
+    fresh_result = engine.run_search(fresh_search)
+
+    assert math.isclose(repaired_result.path_cost, fresh_result.path_cost)
+    assert repaired_result.path_cost >= first_result.path_cost - first_result.path[0].fixed_path_cost
+    assert all((path_node.parent_path_node.nav_node, path_node.nav_node) != (blocked_from, blocked_to)
+               for path_node in repaired_result.path)
+
+
+@pytest.mark.parametrize("algorithm, expected_algorithm", [("A* (Compact)", "A*"),
+                                                           ("Dijkstra's (Compact)", "Dijkstra's")])
+def test_compact_searches_match_nav_node_searches(maze, algorithm, expected_algorithm):
+    nav_nodes, maze_grid = maze
+    engine = PathfindingEngine(nav_nodes, maze_grid)
+
+    random.seed(5)
+    for _ in range(50):
+        start_nav_node, end_nav_node = random.choice(nav_nodes), random.choice(nav_nodes)
+        result = engine.solve(start_nav_node, end_nav_node, algorithm)
+        expected = engine.solve(start_nav_node, end_nav_node, expected_algorithm)
+
+        assert math.isclose(result.path_cost, expected.path_cost)
+        if result.found_path():
+            assert result.path[-1].nav_node is end_nav_node
+            assert all(path_node.nav_node in path_node.parent_path_node.nav_node.neighbours
+                       for path_node in result.path)
+
+
+def test_compact_search_gives_up_at_limit(maze):
+    nav_nodes, maze_grid = maze
+    engine = PathfindingEngine(nav_nodes, maze_grid, max_search_size=3)
+
+    result = engine.solve(nav_nodes[0], nav_nodes[-1], "A* (Compact)")
+    assert not result.found_path()
+    assert result.reached_search_limit
+    assert result.search_size == 3
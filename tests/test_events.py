@@ -0,0 +1,58 @@
+from pathfinding.pathfinders.nav_node import NavNode
+from pathfinding.pathfinders.search.a_star import AStarSearch
+from pathfinding.pathfinders.search.events import (NODE_OPENED, NODE_EXPANDED, NODE_CLOSED, PATH_FOUND,
+                                                   NO_PATH_FOUND)
+
+
+def link(nav_node, other_nav_node):
+    nav_node.add_neighbour(other_nav_node)
+    other_nav_node.add_neighbour(nav_node)
+
+
+def make_small_graph():
+    #  D
+    #  |
+    #  A - B - C      E on its own
+    nav_nodes = {name: NavNode(position) for name, position in (("A", (0, 0)), ("B", (10, 0)), ("C", (20, 0)),
+                                                                 ("D", (0, 10)), ("E", (50, 50)))}
+    link(nav_nodes["A"], nav_nodes["B"])
+    link(nav_nodes["A"], nav_nodes["D"])
+    link(nav_nodes["B"], nav_nodes["C"])
+    return nav_nodes
+
+
+def describe_events(events, nav_nodes):
+    names = {nav_node: name for name, nav_node in nav_nodes.items()}
+    return [(event_type, None if path_node is None else names[path_node.nav_node]) for event_type, path_node in events]
+
+
+def test_a_star_event_sequence():
+    nav_nodes = make_small_graph()
+    search = AStarSearch(nav_nodes["A"], nav_nodes["C"])
+    events = list(search.iter_events())
+
+    # what the search did while it was set up comes first, then each expansion followed by what it changed
+    assert describe_events(events, nav_nodes) == [(NODE_CLOSED, "A"),
+                                                  (NODE_OPENED, "B"),
+                                                  (NODE_OPENED, "D"),
+                                                  (NODE_EXPANDED, "A"),
+                                                  (NODE_EXPANDED, "B"),
+                                                  (NODE_OPENED, "C"),
+                                                  (NODE_CLOSED, "B"),
+                                                  (NODE_EXPANDED, "C"),
+                                                  (NODE_CLOSED, "C"),
+                                                  (PATH_FOUND, "C")]
+    assert events[-1][1] is search.final_path[-1]
+    assert events[-1][1].fixed_path_cost == 20
+    assert not search.event_listeners
+
+
+def test_no_path_event_sequence():
+    nav_nodes = make_small_graph()
+    search = AStarSearch(nav_nodes["A"], nav_nodes["E"])
+    events = describe_events(search.iter_events(), nav_nodes)
+
+    assert events[-1] == (NO_PATH_FOUND, None)
+    closed_names = [name for event_type, name in events if event_type == NODE_CLOSED]
+    assert sorted(closed_names) == ["A", "B", "C", "D"]
+    assert "E" not in [name for _, name in events]
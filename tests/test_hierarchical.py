@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from pathfinding.maze.maze_generation import create_maze
+from pathfinding.pathfinders.benchmark import make_benchmark_queries, get_path_cost
+from pathfinding.pathfinders.cluster_abstraction import ClusterAbstraction
+from pathfinding.pathfinders.search.a_star import AStarSearch
+from pathfinding.pathfinders.search.hierarchical import HierarchicalSearch
+
+
+# HPA* paths can be longer than A*'s, since they have to cross cluster borders at the entrances, but on these
+# mazes never by more than this much
+PATH_COST_TOLERANCE = 1.1
+
+
+@pytest.mark.parametrize("vectorised_carving", [False, True])
+def test_hierarchical_path_costs_close_to_a_star(vectorised_carving):
+    if vectorised_carving:
+        pytest.importorskip("numpy")
+    # seed 3 on the vectorised carving has queries where HPA* takes a longer way round
+    random.seed(3)
+    maze_walls, junction_points, maze_entrance, maze_exit, maze_grid = create_maze(
+        (20, 20), 10, 81, 81, vectorised_carving=vectorised_carving)
+    nav_nodes = [point.nav_node for point in junction_points]
+    cluster_abstraction = ClusterAbstraction(maze_grid, 16)
+
+    queries = [(maze_entrance.nav_node, maze_exit.nav_node)] + make_benchmark_queries(nav_nodes, 99, 3)
+    for start_nav_node, end_nav_node in queries:
+        a_star_search = AStarSearch(start_nav_node, end_nav_node, None)
+        a_star_search.run_to_completion()
+        hierarchical_search = HierarchicalSearch(start_nav_node, end_nav_node, cluster_abstraction)
+        hierarchical_search.run_to_completion()
+
+        a_star_path_cost = get_path_cost(a_star_search)
+        if a_star_path_cost is None:
+            continue
+        hierarchical_path_cost = get_path_cost(hierarchical_search)
+        assert hierarchical_path_cost is not None
+        assert hierarchical_path_cost >= a_star_path_cost - 1e-6
+        assert hierarchical_path_cost <= a_star_path_cost * PATH_COST_TOLERANCE
+        assert isinstance(hierarchical_path_cost, float)
@@ -0,0 +1,20 @@
+from pathfinding.pathfinders.benchmark import compare_jump_point_with_a_star, make_benchmark_maze
+from pathfinding.pathfinders.search.jump_point import JumpPointSearch
+
+
+def test_jump_point_matches_a_star_with_fewer_expansions():
+    report = compare_jump_point_with_a_star(maze_size=41, query_count=40)
+    results = report["results"]
+
+    assert results["Jump Point"]["different_costs"] == 0
+    assert results["Jump Point"]["expansions"] < results["A*"]["expansions"]
+    assert results["Jump Point"]["expansions"] < results["A* (grid squares)"]["expansions"]
+
+
+def test_jump_point_path_costs_are_floats():
+    walls, junctions, entrance, exit, maze_grid = make_benchmark_maze(21)
+    search = JumpPointSearch(entrance.nav_node, exit.nav_node, maze_grid, None)
+    search.run_to_completion()
+
+    assert search.final_path
+    assert all(isinstance(path_node.fixed_path_cost, float) for path_node in search.final_path)
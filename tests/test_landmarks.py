@@ -0,0 +1,31 @@
+import math
+
+import pytest
+
+from pathfinding.pathfinders.engine import PathfindingEngine
+from pathfinding.pathfinders.landmarks import LandmarkHeuristic
+from pathfinding.pathfinders.search.dijkstra import DijkstraSearch
+
+
+@pytest.mark.parametrize("landmark_selection", ["farthest", "random"])
+def test_heuristic_never_overestimates(maze, landmark_selection):
+    nav_nodes, maze_grid = maze
+    landmark_heuristic = LandmarkHeuristic(nav_nodes, 4, landmark_selection=landmark_selection, random_seed=0)
+
+    for start_nav_node in nav_nodes[::5]:
+        # the real cost from the start to every node it can reach
+        search = DijkstraSearch(start_nav_node, None, nav_nodes, single_source=True)
+        search.run_to_completion()
+        for path_node in search.closed_node_list:
+            estimate = landmark_heuristic.get_distance_to_end(start_nav_node, path_node.nav_node)
+            assert estimate <= path_node.fixed_path_cost + 1e-6
+
+
+def test_a_star_with_landmarks_matches_a_star(maze, random_queries):
+    nav_nodes, maze_grid = maze
+    engine = PathfindingEngine(nav_nodes, maze_grid)
+
+    for start_nav_node, end_nav_node in random_queries:
+        result = engine.solve(start_nav_node, end_nav_node, "A* (Landmarks)")
+        expected = engine.solve(start_nav_node, end_nav_node, "A*")
+        assert math.isclose(result.path_cost, expected.path_cost)
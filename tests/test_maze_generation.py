@@ -0,0 +1,231 @@
+import random
+
+import pytest
+
+from pathfinding.maze.maze_generation import (MazeWall, JunctionPoint, carve_maze_aisles, clear_dead_ends,
+                                              find_walls_and_junctions, link_junction_neighbours, create_maze)
+
+
+TOP_LEFT = (25, 25)
+SQUARE_SIZE = 16
+# the dead end clearing only copes with square mazes, so those are all we check
+MAZE_SIZES = (11, 21, 31)
+SEEDS = (0, 1, 2, 3, 4)
+
+
+def old_add_new_wall_if_unique(possible_new_wall, maze_walls):
+    # the original scan of every wall so far, kept here to check the faster lookup against
+    wall_already_exists = False
+    for wall in maze_walls:
+        if wall.id == possible_new_wall.id:
+            wall_already_exists = True
+    if not wall_already_exists:
+        maze_walls.append(possible_new_wall)
+
+    return maze_walls
+
+
+def old_create_maze(top_left, square_size, width=11, height=16, complexity=.75, density=.75):
+    # create_maze as it was before walls and junction neighbours were looked up rather than scanned for
+    shape = ((width // 2) * 2 + 1, (height // 2) * 2 + 1)
+    complexity = int(complexity * (5 * (shape[0] + shape[1])))
+    density = int(density * ((shape[0] // 2) * (shape[1] // 2)))
+    maze_shape = carve_maze_aisles(shape, complexity, density)
+    clear_dead_ends(maze_shape, shape)
+
+    entry_x = 1
+    entry_y = shape[1]-1
+    exit_x = shape[0] - 2
+    exit_y = 0
+    maze_shape[1][shape[1]-1] = 0
+    maze_shape[shape[0] - 2][0] = 0
+
+    maze_walls = []
+    junction_points = []
+    maze_entrance = None
+    maze_exit = None
+
+    for x in range(0, shape[0]):
+        for y in range(0, shape[1]):
+            if maze_shape[x][y] == 1:
+                if y + 1 < shape[0] and maze_shape[x][y + 1] == 1:
+                    old_add_new_wall_if_unique(MazeWall(top_left, square_size, (y, x), (y + 1, x)), maze_walls)
+                if y - 1 > 0 and maze_shape[x][y - 1] == 1:
+                    old_add_new_wall_if_unique(MazeWall(top_left, square_size, (y, x), (y - 1, x)), maze_walls)
+                if x + 1 < shape[1] and maze_shape[x + 1][y] == 1:
+                    old_add_new_wall_if_unique(MazeWall(top_left, square_size, (y, x), (y, x + 1)), maze_walls)
+                if x - 1 > 0 and maze_shape[x - 1][y] == 1:
+                    old_add_new_wall_if_unique(MazeWall(top_left, square_size, (y, x), (y, x - 1)), maze_walls)
+            elif maze_shape[x][y] == 0:
+                below = maze_shape[x][y + 1] if y < shape[1]-1 else None
+                above = maze_shape[x][y - 1] if y > 0 else None
+                left = maze_shape[x - 1][y] if x > 0 else None
+                right = maze_shape[x + 1][y] if x < shape[0]-1 else None
+                if above is not None and below is not None and left is not None and right is not None:
+                    if (below == 1) and (above == 1) and (left == 0) and (right == 0):
+                        pass
+                    elif (below == 0) and (above == 0) and (left == 1) and (right == 1):
+                        pass
+                    else:
+                        junction_points.append(JunctionPoint(top_left, square_size, x, y))
+                else:
+                    if x == exit_x and y == exit_y:
+                        maze_exit = JunctionPoint(top_left, square_size, x, y)
+                        junction_points.append(maze_exit)
+                        junction_points.append(JunctionPoint(top_left, square_size, x, y + 1))
+                    if x == entry_x and y == entry_y:
+                        maze_entrance = JunctionPoint(top_left, square_size, x, y)
+                        junction_points.append(maze_entrance)
+                        junction_points.append(JunctionPoint(top_left, square_size, x, y - 1))
+
+    # for every open square along each corridor, scan the whole junction list for one sitting on it
+    def find_junction(x_pos, y_pos):
+        for neighbour_point in junction_points:
+            if neighbour_point.grid_x_pos == x_pos and neighbour_point.grid_y_pos == y_pos:
+                return neighbour_point
+        return None
+
+    for point in junction_points:
+        for x_step, y_step in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            x_explore = point.grid_x_pos + x_step
+            y_explore = point.grid_y_pos + y_step
+            while 0 <= x_explore < shape[1] and 0 <= y_explore < shape[0]:
+                if maze_shape[x_explore][y_explore] == 1:
+                    # a wall right after an open square, that square may be a junction we walked onto
+                    if (x_explore - x_step, y_explore - y_step) != (point.grid_x_pos, point.grid_y_pos):
+                        neighbour_point = find_junction(x_explore - x_step, y_explore - y_step)
+                        if neighbour_point is not None:
+                            point.nav_node.neighbours.append(neighbour_point.nav_node)
+                    break
+                neighbour_point = find_junction(x_explore, y_explore)
+                if neighbour_point is not None:
+                    point.nav_node.neighbours.append(neighbour_point.nav_node)
+                    break
+                x_explore += x_step
+                y_explore += y_step
+
+    return maze_walls, junction_points, maze_entrance, maze_exit, maze_shape
+
+
+def describe_junctions(junction_points):
+    # junction squares in order, each with the squares of its neighbours in the order they were linked
+    positions = {point.nav_node: (point.grid_x_pos, point.grid_y_pos) for point in junction_points}
+    return [((point.grid_x_pos, point.grid_y_pos), [positions[neighbour] for neighbour in point.nav_node.neighbours])
+            for point in junction_points]
+
+
+def describe_walls(maze_walls):
+    return [(wall.id, wall.start_index, wall.end_index) for wall in maze_walls]
+
+
+def check_maze_matches_original_scans(seed, size, **create_maze_options):
+    random.seed(seed)
+    old_walls, old_junctions, old_entrance, old_exit, old_shape = old_create_maze(TOP_LEFT, SQUARE_SIZE, size, size)
+    random.seed(seed)
+    walls, junctions, entrance, exit_point, maze_grid = create_maze(TOP_LEFT, SQUARE_SIZE, size, size,
+                                                                     **create_maze_options)
+
+    assert maze_grid.maze_shape == old_shape
+    assert describe_walls(walls) == describe_walls(old_walls)
+    assert describe_junctions(junctions) == describe_junctions(old_junctions)
+    assert junctions.index(entrance) == old_junctions.index(old_entrance)
+    assert junctions.index(exit_point) == old_junctions.index(old_exit)
+
+
+@pytest.mark.parametrize("size", MAZE_SIZES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_default_maze_matches_original_scans(seed, size):
+    # what the app and benchmarks get, whether or not NumPy is installed
+    check_maze_matches_original_scans(seed, size)
+
+
+@pytest.mark.parametrize("size", MAZE_SIZES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_python_maze_matches_original_scans(seed, size):
+    check_maze_matches_original_scans(seed, size, use_numpy=False)
+
+
+@pytest.mark.parametrize("size", MAZE_SIZES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_numpy_maze_matches_original_scans(seed, size):
+    pytest.importorskip("numpy")
+    check_maze_matches_original_scans(seed, size, use_numpy=True)
+
+
+@pytest.mark.parametrize("size", MAZE_SIZES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_numpy_stages_match_python_stages(seed, size):
+    # from the same carved grid everything after carving should come out exactly the same, random choices when
+    # clearing dead ends included
+    numpy = pytest.importorskip("numpy")
+    from pathfinding.maze.maze_generation import clear_dead_ends_numpy, find_walls_and_junctions_numpy
+
+    shape = (size, size)
+    random.seed(seed)
+    carved_shape = carve_maze_aisles(shape, int(.75 * 5 * (shape[0] + shape[1])),
+                                     int(.75 * (shape[0] // 2) * (shape[1] // 2)))
+    maze_shape = [list(column) for column in carved_shape]
+    maze_grid = numpy.array(carved_shape, dtype=numpy.int8)
+
+    random.seed(seed + 1000)
+    clear_dead_ends(maze_shape, shape)
+    random.seed(seed + 1000)
+    clear_dead_ends_numpy(maze_grid, shape)
+    assert maze_grid.tolist() == maze_shape
+
+    entry_x, entry_y, exit_x, exit_y = 1, shape[1] - 1, shape[0] - 2, 0
+    for grid in (maze_shape, maze_grid):
+        grid[entry_x][entry_y] = 0
+        grid[exit_x][exit_y] = 0
+
+    walls, junctions, entrance, exit_point = find_walls_and_junctions(
+        maze_shape, shape, TOP_LEFT, SQUARE_SIZE, entry_x, entry_y, exit_x, exit_y)
+    numpy_walls, numpy_junctions, numpy_entrance, numpy_exit = find_walls_and_junctions_numpy(
+        maze_grid, shape, TOP_LEFT, SQUARE_SIZE, entry_x, entry_y, exit_x, exit_y)
+    link_junction_neighbours(junctions, maze_shape, shape)
+    link_junction_neighbours(numpy_junctions, maze_grid.tolist(), shape)
+
+    assert describe_walls(numpy_walls) == describe_walls(walls)
+    assert describe_junctions(numpy_junctions) == describe_junctions(junctions)
+    assert numpy_junctions.index(numpy_entrance) == junctions.index(entrance)
+    assert numpy_junctions.index(numpy_exit) == junctions.index(exit_point)
+
+
+@pytest.mark.parametrize("size", MAZE_SIZES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_numpy_dead_end_clearing_matches_on_noise(seed, size):
+    # carved mazes have few dead ends, random noise has plenty, including ones made by opening up a wall
+    numpy = pytest.importorskip("numpy")
+    from pathfinding.maze.maze_generation import clear_dead_ends_numpy
+
+    shape = (size, size)
+    random.seed(seed)
+    maze_shape = [[1 if x in (0, size - 1) or y in (0, size - 1) else random.randint(0, 1) for y in range(size)]
+                  for x in range(size)]
+    maze_grid = numpy.array(maze_shape, dtype=numpy.int8)
+
+    random.seed(seed + 1000)
+    clear_dead_ends(maze_shape, shape)
+    random.seed(seed + 1000)
+    clear_dead_ends_numpy(maze_grid, shape)
+    assert maze_grid.tolist() == maze_shape
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_vectorised_carving_maze_is_connected(seed):
+    # the vectorised carving makes its own mazes, so all we can check is that every junction is reachable from
+    # the entrance over the linked neighbours
+    pytest.importorskip("numpy")
+    random.seed(seed)
+    walls, junctions, entrance, exit_point, maze_grid = create_maze(TOP_LEFT, SQUARE_SIZE, 41, 41,
+                                                                     vectorised_carving=True)
+
+    reached = {entrance.nav_node}
+    to_visit = [entrance.nav_node]
+    while to_visit:
+        for neighbour in to_visit.pop().neighbours:
+            if neighbour not in reached:
+                reached.add(neighbour)
+                to_visit.append(neighbour)
+    assert exit_point.nav_node in reached
+    assert len(reached) == len({(point.grid_x_pos, point.grid_y_pos) for point in junctions})
@@ -0,0 +1,53 @@
+import math
+import random
+
+from pathfinding.pathfinders.engine import PathfindingEngine
+from pathfinding.pathfinders.multi_agent import MultiAgentPathPlanner
+
+
+def make_agent_requests(nav_nodes, agent_count, goal_count, seed):
+    request_random = random.Random(seed)
+    goals = request_random.sample(nav_nodes, goal_count)
+    return [(request_random.choice(nav_nodes), request_random.choice(goals)) for _ in range(agent_count)]
+
+
+def test_agent_paths_match_independent_searches(maze):
+    nav_nodes, maze_grid = maze
+    engine = PathfindingEngine(nav_nodes, maze_grid)
+    path_requests = make_agent_requests(nav_nodes, 60, 4, 1)
+
+    results = engine.solve_agents(path_requests)
+    assert len(results.agent_paths) == len(path_requests)
+    for (start_nav_node, end_nav_node), agent_path in zip(path_requests, results.agent_paths):
+        expected = engine.solve(start_nav_node, end_nav_node, "Dijkstra's")
+
+        assert agent_path.start_nav_node is start_nav_node
+        assert agent_path.end_nav_node is end_nav_node
+        assert math.isclose(agent_path.path_cost, expected.path_cost)
+        if agent_path.found_path():
+            assert agent_path.path[-1].nav_node is end_nav_node
+            assert math.isclose(agent_path.path[-1].fixed_path_cost, agent_path.path_cost)
+
+
+def test_one_search_per_goal_kept_between_calls(maze):
+    nav_nodes, maze_grid = maze
+    planner = MultiAgentPathPlanner(nav_nodes)
+    path_requests = make_agent_requests(nav_nodes, 60, 4, 2)
+    goal_count = len({end_nav_node for _, end_nav_node in path_requests})
+
+    first_results = planner.find_paths(path_requests)
+    assert first_results.goal_count == goal_count
+    assert first_results.new_search_count == goal_count
+    path_tree_caches = dict(planner.path_tree_caches)
+
+    # the same goals again, from other starts, are answered from the trees we already have
+    more_requests = [(random.Random(index).choice(nav_nodes), end_nav_node)
+                     for index, (_, end_nav_node) in enumerate(path_requests)]
+    second_results = planner.find_paths(more_requests)
+    assert second_results.new_search_count == 0
+    assert second_results.search_size == 0
+    assert all(planner.path_tree_caches[end_nav_node] is path_tree_cache
+               for end_nav_node, path_tree_cache in path_tree_caches.items())
+
+    planner.clear()
+    assert planner.find_paths(path_requests).new_search_count == goal_count
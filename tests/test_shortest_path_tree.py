@@ -0,0 +1,24 @@
+import math
+import random
+
+from pathfinding.maze.maze_generation import create_maze
+from pathfinding.pathfinders.engine import PathfindingEngine
+from pathfinding.pathfinders.path_cache import ShortestPathTreeCache
+from pathfinding.pathfinders.search.shortest_path_tree import ShortestPathTreeSearch
+
+
+def test_walk_to_exit_matches_dijkstra():
+    random.seed(3)
+    maze_walls, junction_points, maze_entrance, maze_exit, maze_grid = create_maze((25, 25), 16, 31, 31)
+    nav_nodes = [point.nav_node for point in junction_points]
+    path_tree_cache = ShortestPathTreeCache(nav_nodes, maze_exit.nav_node)
+    engine = PathfindingEngine(nav_nodes, maze_grid)
+
+    for start_nav_node in random.sample(nav_nodes, 20):
+        search = ShortestPathTreeSearch(start_nav_node, maze_exit.nav_node, path_tree_cache)
+        result = engine.run_search(search)
+        expected = engine.solve(start_nav_node, maze_exit.nav_node, "Dijkstra's")
+
+        assert math.isclose(result.path_cost, expected.path_cost)
+        assert search.closed_node_list == search.final_path
+        assert result.search_size == len(result.path)